@@ -9,23 +9,29 @@ Physical Output:     480x480 (2x Upscale)
 import os
 import sys
 import subprocess
+import time
 import pygame
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pygame.locals import *
 
 from store_client.config import load_config
-from store_client.http_client import HttpClient
+from store_client.http_client import HttpClient, create_session
 from store_client.cdn_api import CdnApi
 from store_client.repository import Repository
 from store_client.installer import Installer
 from store_client.updater import Updater
 from store_client.ui.controller_input import InputManager
-from store_client.ui.screens import MainMenu, CatalogList, GameDetail, DownloadScreen, InstalledList, UpdateCheck, ParentalControlsScreen, DeveloperCodeScreen, RebootScreen, FilterScreen
+from store_client.ui import widgets
+from store_client.ui.screens import MainMenu, CatalogList, GameDetail, DownloadScreen, InstalledList, UpdateCheck, ParentalControlsScreen, DeveloperCodeScreen, RebootScreen, FilterScreen, get_device_id
 from store_client.parental_controls import ParentalControls
+from store_client.device_sync import DeviceSync
 
 # --- CONFIGURATION ---
 PHYSICAL_WIDTH, PHYSICAL_HEIGHT = 480, 480
 VIRTUAL_WIDTH, VIRTUAL_HEIGHT = 240, 240
+SCALE = PHYSICAL_WIDTH // VIRTUAL_WIDTH
+MAX_DIRTY_RECTS = 25  # Above this a full flip is cheaper
 FONT_SIZE = 24 
 
 # --- HARDWARE SETUP ---
@@ -43,8 +49,6 @@ class EmulationStationStopper:
     """
     def __enter__(self):
         """Stop EmulationStation if it's running."""
-        import time
-        
         try:
             # Check if EmulationStation is running (the actual binary, not wrappers)
             result = subprocess.run(
@@ -123,22 +127,34 @@ class App:
             self.font = pygame.font.Font(None, FONT_SIZE)
         except:
             self.font = pygame.font.SysFont("sans", FONT_SIZE)
+        
+        widgets.warm_caches()
 
         self.clock = pygame.time.Clock()
         self.running = True
 
         # Store Components Setup
         self.config = load_config()
+        # One keep-alive connection pool shared by the API and CDN clients
+        self.http_session = create_session()
         # API client for catalog/game details (worker)
-        self.api_client = HttpClient(self.config.api_base_url, self.config.http_timeout, self.config.max_retries)
+        self.api_client = HttpClient(self.config.api_base_url, self.config.http_timeout, self.config.max_retries, self.http_session)
         # CDN client for downloads
-        self.cdn_client = HttpClient(self.config.cdn_base_url, self.config.http_timeout, self.config.max_retries)
+        self.cdn_client = HttpClient(self.config.cdn_base_url, self.config.http_timeout, self.config.max_retries, self.http_session)
         self.cdn_api = CdnApi(self.api_client, self.cdn_client)
         self.repo = Repository(self.config)
+        # Shared worker threads for screens' background fetches
+        self.bg_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ui-bg")
         self.installer = Installer(self.cdn_api, self.repo)
         self.updater = Updater(self.repo, self.cdn_api)
         self.parental_controls = ParentalControls(self.config.data_dir)
         
+        # Per-device server state, fetched once at boot and shared by screens
+        self.device_sync = DeviceSync(self.cdn_api)
+        device_id = get_device_id()
+        if device_id:
+            self.bg_pool.submit(self.device_sync.get, device_id)
+        
         self.input_manager = InputManager()
         
         # Screens
@@ -187,6 +203,28 @@ class App:
         else:
             self.change_screen("MainMenu")
 
+    def present(self, dirty_rects=None):
+        """
+        Upscale the canvas to the display.
+        With dirty_rects only those canvas regions are scaled and updated.
+        """
+        if dirty_rects is None or len(dirty_rects) > MAX_DIRTY_RECTS:
+            scaled_surface = pygame.transform.scale(self.canvas, (PHYSICAL_WIDTH, PHYSICAL_HEIGHT))
+            self.screen.blit(scaled_surface, (0, 0))
+            pygame.display.flip()
+            return
+        
+        canvas_rect = self.canvas.get_rect()
+        updated = []
+        for rect in dirty_rects:
+            rect = rect.clip(canvas_rect)
+            if not rect.width or not rect.height:
+                continue
+            dest = pygame.Rect(rect.x * SCALE, rect.y * SCALE, rect.width * SCALE, rect.height * SCALE)
+            self.screen.blit(pygame.transform.scale(self.canvas.subsurface(rect), dest.size), dest)
+            updated.append(dest)
+        pygame.display.update(updated)
+
     def run(self):
         logging.info('Starting Game Bird Store Client...')
         
@@ -195,6 +233,8 @@ class App:
             with EmulationStationStopper():
                 logging.info('Entering main loop...')
                 frame_count = 0
+                last_drawn = None
+                last_state = None
                 
                 while self.running:
                     # 1. Input
@@ -207,13 +247,18 @@ class App:
                     # 2. Update
                     self.current_screen.update(actions)
                     
-                    # 3. Draw
-                    self.current_screen.draw(self.canvas)
-                    
-                    # 4. Upscale and Flip
-                    scaled_surface = pygame.transform.scale(self.canvas, (PHYSICAL_WIDTH, PHYSICAL_HEIGHT))
-                    self.screen.blit(scaled_surface, (0, 0))
-                    pygame.display.flip()
+                    # 3. Draw, unless the screen reports nothing visible changed
+                    screen = self.current_screen
+                    state = screen.view_state()
+                    if screen is not last_drawn or state is None or state != last_state:
+                        dirty_rects = screen.draw(self.canvas)
+                        
+                        # 4. Upscale and present (everything after a screen change)
+                        if screen is not last_drawn:
+                            dirty_rects = None
+                            last_drawn = screen
+                        self.present(dirty_rects)
+                        last_state = state
                     
                     self.clock.tick(30)
                     
@@ -226,6 +271,7 @@ class App:
         except Exception as e:
             logging.error(f'Error in main loop: {e}', exc_info=True)
             # On error, try to reboot to ensure clean state
+            widgets.clear_caches()
             pygame.quit()
             subprocess.run(['sudo', 'reboot'], check=False)
 
@@ -2,7 +2,7 @@ from typing import List, Optional, Dict, Any
 from pathlib import Path
 from dataclasses import dataclass
 import logging
-from .http_client import HttpClient
+from .http_client import HttpClient, NOT_MODIFIED, NOT_FOUND
 from .models import CatalogEntry, GameManifest, DownloadInfo, ChangelogEntry
 
 
@@ -14,6 +14,7 @@ class CatalogPage:
     per_page: int
     total: int
     total_pages: int
+    etag: Optional[str] = None  # Server validator for conditional re-fetches
 
 
 class CdnApi:
@@ -21,6 +22,10 @@ class CdnApi:
         """Initialize with API client for metadata and optional CDN client for downloads."""
         self.api_client = api_client
         self.cdn_client = cdn_client or api_client
+        # Set once the server reports it has no bulk catalog endpoint
+        self._bulk_unavailable = False
+        # Set once the server reports it has no device sync endpoint
+        self._sync_unavailable = False
 
     def fetch_catalog(
         self,
@@ -29,7 +34,8 @@ class CdnApi:
         tags: Optional[List[str]] = None,
         min_rating: Optional[float] = None,
         include_mature: bool = True,
-        sort_by: str = "title"  # title, rating, release_date
+        sort_by: str = "title",  # title, rating, release_date
+        cached: Optional[CatalogPage] = None
     ) -> CatalogPage:
         """
         Fetch paginated catalog from D1-backed API.
@@ -41,6 +47,8 @@ class CdnApi:
             min_rating: Minimum rating filter (1-5)
             include_mature: Whether to include mature content
             sort_by: Sort field
+            cached: Previously fetched copy of this page; if it has an ETag the
+                request is conditional and the copy is returned on 304
         """
         # Build query params
         params = [f"page={page}", f"per_page={per_page}", f"sort={sort_by}"]
@@ -56,13 +64,67 @@ class CdnApi:
             params.append("mature=false")
         
         query = "&".join(params)
-        data = self.api_client.get_json(f"api/catalog?{query}")
+        data, etag = self.api_client.get_json_conditional(
+            f"api/catalog?{query}", cached.etag if cached else None
+        )
+        if data is NOT_MODIFIED:
+            return cached
         
-        if data is None:
+        if data is None or data is NOT_FOUND:
             raise Exception("Failed to connect to store")
 
+        games = self._parse_catalog_entries(data.get("games", []))
+        
+        return CatalogPage(
+            games=games,
+            page=data.get("page", page),
+            per_page=data.get("per_page", per_page),
+            total=data.get("total", len(games)),
+            total_pages=data.get("total_pages", 1),
+            etag=etag
+        )
+
+    def fetch_catalog_bulk(self, cached: Optional[CatalogPage] = None) -> Optional[CatalogPage]:
+        """
+        Fetch the whole catalog in a single response from /api/catalog/bulk.
+        
+        Returns a single CatalogPage holding every game, or None if the bulk
+        endpoint is unavailable so the caller can fall back to pagination.
+        A 404 is remembered and the endpoint is not asked again.
+        
+        Args:
+            cached: Previous bulk result; if it has an ETag the request is
+                conditional and the copy is returned on 304
+        """
+        if self._bulk_unavailable:
+            return None
+        
+        data, etag = self.api_client.get_json_conditional(
+            "api/catalog/bulk", cached.etag if cached else None
+        )
+        if data is NOT_MODIFIED:
+            return cached
+        if data is NOT_FOUND:
+            logging.info("Bulk catalog endpoint not available, using pagination")
+            self._bulk_unavailable = True
+            return None
+        if data is None:
+            return None
+        
+        games = self._parse_catalog_entries(data.get("games", []))
+        return CatalogPage(
+            games=games,
+            page=1,
+            per_page=len(games),
+            total=data.get("total", len(games)),
+            total_pages=1,
+            etag=etag
+        )
+
+    @staticmethod
+    def _parse_catalog_entries(items: List[Dict[str, Any]]) -> List[CatalogEntry]:
         games = []
-        for item in data.get("games", []):
+        for item in items:
             try:
                 games.append(CatalogEntry(
                     id=item["id"],
@@ -81,14 +143,7 @@ class CdnApi:
                 ))
             except KeyError as e:
                 logging.warning(f"Skipping invalid catalog entry: {e}")
-        
-        return CatalogPage(
-            games=games,
-            page=data.get("page", page),
-            per_page=data.get("per_page", per_page),
-            total=data.get("total", len(games)),
-            total_pages=data.get("total_pages", 1)
-        )
+        return games
 
     def fetch_catalog_all(self) -> List[CatalogEntry]:
         """Legacy method - fetch first page of catalog."""
@@ -176,6 +231,29 @@ class CdnApi:
         
         return data.get("ratings", {})
 
+    def fetch_device_sync(self, device_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch all per-device state in one call from /api/device/sync.
+        
+        Args:
+            device_id: The device's unique identifier (16 hex chars)
+            
+        Returns:
+            Dict with "ratings" (game_slug -> rating) and "code" (pending
+            developer code, may be missing), or None if the endpoint is
+            unavailable or the request failed. A 404 is remembered and the
+            endpoint is not asked again.
+        """
+        if self._sync_unavailable:
+            return None
+        
+        data, _ = self.api_client.get_json_conditional(f"api/device/sync?device_id={device_id}")
+        if data is NOT_FOUND:
+            logging.info("Device sync endpoint not available, using individual endpoints")
+            self._sync_unavailable = True
+            return None
+        return data
+
     def rate_game(self, device_id: str, game_slug: str, rating: int) -> bool:
         """
         Rate a game on the server (1-5 stars).
@@ -0,0 +1,60 @@
+"""
+Device Sync
+Caches the combined per-device state (ratings, developer code) fetched
+from the server so screens don't each make their own round trip.
+"""
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .cdn_api import CdnApi
+
+
+class DeviceSync:
+    """Short-lived cache of the server's per-device state."""
+
+    # How long a fetched state is reused before asking the server again
+    TTL_SECONDS = 30.0
+
+    def __init__(self, cdn_api: CdnApi):
+        self.cdn_api = cdn_api
+        # Guards the fields below only; never held across a request
+        self._lock = threading.Lock()
+        self._state: Optional[Dict[str, Any]] = None
+        self._failed = False
+        self._device_id: Optional[str] = None
+        self._fetched_at = 0.0
+        # Bumped by invalidate() so fetches started before it are discarded
+        self._generation = 0
+
+    def get(self, device_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the device state, fetching it if the cached copy is stale.
+        Returns None if the server has no sync endpoint or the request failed;
+        callers then fall back to the individual endpoints. A failure is
+        remembered for TTL_SECONDS so callers fall back without retrying,
+        and a fetch overtaken by invalidate() also returns None.
+        """
+        with self._lock:
+            fresh = time.monotonic() - self._fetched_at < self.TTL_SECONDS
+            if self._device_id == device_id and fresh and (self._state is not None or self._failed):
+                return self._state
+            generation = self._generation
+
+        state = self.cdn_api.fetch_device_sync(device_id)
+
+        with self._lock:
+            if generation != self._generation:
+                return None
+            self._state = state
+            self._failed = state is None
+            self._device_id = device_id
+            self._fetched_at = time.monotonic()
+        return state
+
+    def invalidate(self):
+        """Drop the cached state, e.g. after the device changed it on the server."""
+        with self._lock:
+            self._generation += 1
+            self._state = None
+            self._failed = False
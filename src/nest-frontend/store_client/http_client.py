@@ -1,20 +1,62 @@
 import time
 import logging
 import requests
-from typing import Optional, Dict, Any, Iterable
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, Iterable, Tuple
+
+# Returned by get_json_conditional when the server answers 304 Not Modified
+NOT_MODIFIED = object()
+# Returned by get_json_conditional when the server answers 404 Not Found
+NOT_FOUND = object()
+
+def create_session() -> requests.Session:
+    """
+    Create a keep-alive session that can be shared by several HttpClients.
+    Retries are left to HttpClient, so the adapter does not retry on its own.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 class HttpClient:
-    def __init__(self, base_url: str, timeout: float = 10.0, max_retries: int = 3):
+    def __init__(self, base_url: str, timeout: float = 10.0, max_retries: int = 3, session: Optional[requests.Session] = None):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.max_retries = max_retries
-        self.session = requests.Session()
+        self.session = session or create_session()
 
     def get_json(self, path: str) -> Optional[Dict[str, Any]]:
+        data, _ = self._get_json_response(path)
+        return None if data is NOT_FOUND else data
+
+    def get_json_conditional(self, path: str, etag: Optional[str] = None) -> Tuple[Any, Optional[str]]:
+        """
+        GET JSON with If-None-Match so unchanged resources cost no body.
+        
+        Returns:
+            (NOT_MODIFIED, etag) on 304, (NOT_FOUND, None) on 404,
+            (data, new_etag) on success, (None, None) on failure
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        data, response = self._get_json_response(path, headers)
+        if data is NOT_MODIFIED:
+            return NOT_MODIFIED, etag
+        if data is None or data is NOT_FOUND:
+            return data, None
+        return data, response.headers.get("ETag")
+
+    def _get_json_response(self, path: str, headers: Optional[Dict[str, str]] = None) -> Tuple[Any, Optional[requests.Response]]:
+        """
+        GET and decode JSON with rate-limit handling and exponential backoff.
+        Returns (data, response); data is NOT_MODIFIED on 304, NOT_FOUND on 404
+        (which is not retried) and None on failure.
+        """
         url = f"{self.base_url}/{path.lstrip('/')}"
         for attempt in range(self.max_retries + 1):
             try:
-                response = self.session.get(url, timeout=self.timeout)
+                response = self.session.get(url, timeout=self.timeout, headers=headers)
                 
                 if response.status_code == 429:
                     retry_after = int(response.headers.get("Retry-After", 30))
@@ -22,8 +64,15 @@ class HttpClient:
                     time.sleep(retry_after)
                     continue
                 
+                if response.status_code == 304:
+                    return NOT_MODIFIED, response
+                
+                if response.status_code == 404:
+                    logging.warning(f"Not found: {url}")
+                    return NOT_FOUND, response
+                
                 response.raise_for_status()
-                return response.json()
+                return response.json(), response
             
             except requests.RequestException as e:
                 logging.warning(f"Request failed (attempt {attempt + 1}/{self.max_retries + 1}): {e}")
@@ -32,8 +81,8 @@ class HttpClient:
                     time.sleep(sleep_time)
                 else:
                     logging.error(f"Max retries reached for {url}")
-                    return None
-        return None
+                    return None, None
+        return None, None
 
     def get_stream(self, path: str) -> Optional[requests.Response]:
         url = f"{self.base_url}/{path.lstrip('/')}"
@@ -63,9 +63,8 @@ class Installer:
                     # Extract path from full URL if needed
                     icon_path = manifest.icon_url
                     if manifest.icon_url.startswith('http'):
-                        # Use requests to download directly
-                        import requests
-                        response = requests.get(manifest.icon_url, timeout=30)
+                        # Download directly over the CDN client's keep-alive session
+                        response = self.cdn_api.cdn_client.session.get(manifest.icon_url, timeout=30)
                         if response.status_code == 200:
                             with open(temp_icon, 'wb') as f:
                                 f.write(response.content)
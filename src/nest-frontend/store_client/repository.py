@@ -1,25 +1,41 @@
 import json
 import logging
 import os
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from .models import InstalledGame, CatalogEntry
 from .config import StoreConfig
+from .cdn_api import CatalogPage
 
 class Repository:
     def __init__(self, config: StoreConfig):
         self.config = config
         self.installed_games_path = self.config.data_dir / "installed_games.json"
         self.catalog_cache_path = self.config.data_dir / "cache" / "catalog.json"
+        self.catalog_pages_path = self.config.data_dir / "cache" / "catalog_pages.json"
         self.ratings_path = self.config.data_dir / "ratings.json"
+        # (mtime_ns, entries) of the last catalog cache read or written, so
+        # an unchanged cache file is returned without re-parsing it
+        self._cached_catalog: Optional[Tuple[int, List[CatalogEntry]]] = None
+        # Same for installed_games.json, which is read on every update check
+        self._installed_games: Optional[Tuple[int, Dict[str, InstalledGame]]] = None
         
         # Ensure directories exist
         self.config.data_dir.mkdir(parents=True, exist_ok=True)
         (self.config.data_dir / "cache").mkdir(parents=True, exist_ok=True)
 
     def load_installed_games(self) -> Dict[str, InstalledGame]:
-        if not self.installed_games_path.exists():
+        """
+        Load installed games keyed by id. The file is only re-parsed when it
+        changed; callers get their own dict and may modify it before saving.
+        """
+        try:
+            mtime = self.installed_games_path.stat().st_mtime_ns
+        except OSError:
             return {}
+        if self._installed_games is not None and self._installed_games[0] == mtime:
+            return dict(self._installed_games[1])
         
         try:
             with open(self.installed_games_path, 'r') as f:
@@ -33,7 +49,8 @@ class Repository:
                         install_path=Path(item["install_path"]),
                         installed_files=item.get("installed_files", [])
                     )
-                return games
+                self._installed_games = (mtime, games)
+                return dict(games)
         except json.JSONDecodeError:
             logging.error("Failed to parse installed_games.json")
             return {}
@@ -58,64 +75,134 @@ class Repository:
             with open(temp_path, 'w') as f:
                 json.dump(data, f, indent=2)
             os.replace(temp_path, self.installed_games_path)
+            self._installed_games = (self.installed_games_path.stat().st_mtime_ns, dict(games))
         except Exception as e:
+            self._installed_games = None
             logging.error(f"Failed to save installed games: {e}")
 
+    @staticmethod
+    def _entry_to_dict(e: CatalogEntry) -> dict:
+        return {
+            "id": e.id,
+            "slug": e.slug,
+            "title": e.title,
+            "description": e.description,
+            "version": e.version,
+            "icon_url": e.icon_url,
+            "screenshot_urls": e.screenshot_urls,
+            "tags": e.tags,
+            "rating": e.rating,
+            "mature_content": e.mature_content,
+            "size_bytes": e.size_bytes,
+            "sha256": e.sha256,
+            "download_path": e.download_path
+        }
+
+    @staticmethod
+    def _entry_from_dict(item: dict) -> CatalogEntry:
+        return CatalogEntry(
+            id=item["id"],
+            slug=item.get("slug", item["id"]),
+            title=item["title"],
+            description=item.get("description", ""),
+            version=item.get("version", ""),
+            icon_url=item.get("icon_url", ""),
+            screenshot_urls=item.get("screenshot_urls", []),
+            tags=item.get("tags", []),
+            rating=item.get("rating"),
+            mature_content=item.get("mature_content", False),
+            size_bytes=item.get("size_bytes", 0),
+            sha256=item.get("sha256", ""),
+            download_path=item.get("download_path", "")
+        )
+
     def cache_catalog(self, catalog: List[CatalogEntry]):
         data = {
-            "games": [
-                {
-                    "id": e.id,
-                    "slug": e.slug,
-                    "title": e.title,
-                    "description": e.description,
-                    "version": e.version,
-                    "icon_url": e.icon_url,
-                    "screenshot_urls": e.screenshot_urls,
-                    "tags": e.tags,
-                    "rating": e.rating,
-                    "mature_content": e.mature_content,
-                    "size_bytes": e.size_bytes,
-                    "sha256": e.sha256,
-                    "download_path": e.download_path
-                }
-                for e in catalog
-            ]
+            "games": [self._entry_to_dict(e) for e in catalog]
         }
         try:
             with open(self.catalog_cache_path, 'w') as f:
                 json.dump(data, f, indent=2)
+            self._cached_catalog = (self.catalog_cache_path.stat().st_mtime_ns, list(catalog))
         except Exception as e:
+            self._cached_catalog = None
             logging.error(f"Failed to cache catalog: {e}")
 
     def load_cached_catalog(self) -> List[CatalogEntry]:
-        if not self.catalog_cache_path.exists():
+        """
+        Load the cached catalog. While the file is unchanged the same list
+        object is returned, so callers may key their own caches on it.
+        """
+        try:
+            mtime = self.catalog_cache_path.stat().st_mtime_ns
+        except OSError:
             return []
+        if self._cached_catalog is not None and self._cached_catalog[0] == mtime:
+            return self._cached_catalog[1]
         
         try:
             with open(self.catalog_cache_path, 'r') as f:
                 data = json.load(f)
-                entries = []
-                for item in data.get("games", []):
-                    entries.append(CatalogEntry(
-                        id=item["id"],
-                        slug=item.get("slug", item["id"]),
-                        title=item["title"],
-                        description=item.get("description", ""),
-                        version=item.get("version", ""),
-                        icon_url=item.get("icon_url", ""),
-                        screenshot_urls=item.get("screenshot_urls", []),
-                        tags=item.get("tags", []),
-                        rating=item.get("rating"),
-                        mature_content=item.get("mature_content", False),
-                        size_bytes=item.get("size_bytes", 0),
-                        sha256=item.get("sha256", ""),
-                        download_path=item.get("download_path", "")
-                    ))
-                return entries
+                catalog = [self._entry_from_dict(item) for item in data.get("games", [])]
         except json.JSONDecodeError:
             logging.error("Failed to parse cached catalog")
             return []
+        self._cached_catalog = (mtime, catalog)
+        return catalog
+
+    def catalog_cache_age(self) -> Optional[float]:
+        """Seconds since the full catalog was last cached, or None if never."""
+        try:
+            return time.time() - self.catalog_cache_path.stat().st_mtime
+        except OSError:
+            return None
+
+    def save_catalog_pages(self, pages: Dict[int, CatalogPage]):
+        """Save full-catalog pages with their ETags for conditional re-fetches."""
+        data = {
+            "pages": {
+                str(number): {
+                    "etag": p.etag,
+                    "per_page": p.per_page,
+                    "total": p.total,
+                    "total_pages": p.total_pages,
+                    "games": [self._entry_to_dict(e) for e in p.games]
+                }
+                for number, p in pages.items()
+                if p.etag
+            }
+        }
+        
+        temp_path = self.catalog_pages_path.with_suffix(".tmp")
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.catalog_pages_path)
+        except Exception as e:
+            logging.error(f"Failed to save catalog pages: {e}")
+
+    def load_catalog_pages(self) -> Dict[int, CatalogPage]:
+        """Load pages saved by save_catalog_pages, keyed by page number."""
+        if not self.catalog_pages_path.exists():
+            return {}
+        
+        try:
+            with open(self.catalog_pages_path, 'r') as f:
+                data = json.load(f)
+            return {
+                int(number): CatalogPage(
+                    games=[self._entry_from_dict(item) for item in p.get("games", [])],
+                    page=int(number),
+                    per_page=p.get("per_page", 100),
+                    total=p.get("total", 0),
+                    total_pages=p.get("total_pages", 1),
+                    etag=p.get("etag")
+                )
+                for number, p in data.get("pages", {}).items()
+            }
+        except (json.JSONDecodeError, KeyError, ValueError):
+            logging.error("Failed to parse cached catalog pages")
+            return {}
 
     def load_ratings(self) -> Dict[str, int]:
         """Load dict of game ratings {game_slug: rating} from local storage."""
@@ -11,6 +11,9 @@ BTN_R      = 2
 BTN_SELECT = 6
 BTN_START  = 7
 
+# Posted by a one-shot timer when RebootScreen's delay has elapsed
+REBOOT_EVENT = pygame.USEREVENT + 1
+
 class InputManager:
     def __init__(self):
         if pygame.joystick.get_count() > 0:
@@ -20,58 +23,61 @@ class InputManager:
             self.joy = None
 
     def get_events(self):
-        actions = []
+        actions = set()
         for event in pygame.event.get():
             if event.type == QUIT:
-                actions.append("QUIT")
+                actions.add("QUIT")
+            
+            elif event.type == REBOOT_EVENT:
+                actions.add("REBOOT")
             
             elif event.type == JOYBUTTONDOWN:
                 if event.button == BTN_A:
-                    actions.append("A")
+                    actions.add("A")
                 elif event.button == BTN_B:
-                    actions.append("B")
+                    actions.add("B")
                 elif event.button == BTN_X:
-                    actions.append("X")
+                    actions.add("X")
                 elif event.button == BTN_Y:
-                    actions.append("Y")
+                    actions.add("Y")
                 elif event.button == BTN_L:
-                    actions.append("L")
+                    actions.add("L")
                 elif event.button == BTN_R:
-                    actions.append("R")
+                    actions.add("R")
                 elif event.button == BTN_START:
-                    actions.append("START")
+                    actions.add("START")
                 elif event.button == BTN_SELECT:
-                    actions.append("SELECT")
+                    actions.add("SELECT")
             
             elif event.type == JOYHATMOTION:
                 dx, dy = event.value
-                if dy == 1: actions.append("UP")
-                elif dy == -1: actions.append("DOWN")
-                elif dx == -1: actions.append("LEFT")
-                elif dx == 1: actions.append("RIGHT")
+                if dy == 1: actions.add("UP")
+                elif dy == -1: actions.add("DOWN")
+                elif dx == -1: actions.add("LEFT")
+                elif dx == 1: actions.add("RIGHT")
                 
             elif event.type == JOYAXISMOTION:
                 if event.axis == 1: # Vertical
-                    if event.value < -0.5: actions.append("UP")
-                    elif event.value > 0.5: actions.append("DOWN")
+                    if event.value < -0.5: actions.add("UP")
+                    elif event.value > 0.5: actions.add("DOWN")
                 elif event.axis == 0: # Horizontal
-                    if event.value < -0.5: actions.append("LEFT")
-                    elif event.value > 0.5: actions.append("RIGHT")
+                    if event.value < -0.5: actions.add("LEFT")
+                    elif event.value > 0.5: actions.add("RIGHT")
                     
             elif event.type == KEYDOWN:
                 # Fallback for keyboard testing
-                if event.key == K_UP: actions.append("UP")
-                elif event.key == K_DOWN: actions.append("DOWN")
-                elif event.key == K_LEFT: actions.append("LEFT")
-                elif event.key == K_RIGHT: actions.append("RIGHT")
-                elif event.key == K_w: actions.append("A")
-                elif event.key == K_a: actions.append("B")
-                elif event.key == K_s: actions.append("X")
-                elif event.key == K_d: actions.append("Y")
-                elif event.key == K_RETURN: actions.append("START")
-                elif event.key == K_RSHIFT or event.key == K_LSHIFT: actions.append("SELECT")
-                elif event.key == K_q: actions.append("L")
-                elif event.key == K_e: actions.append("R")
-                elif event.key == K_ESCAPE: actions.append("QUIT")
+                if event.key == K_UP: actions.add("UP")
+                elif event.key == K_DOWN: actions.add("DOWN")
+                elif event.key == K_LEFT: actions.add("LEFT")
+                elif event.key == K_RIGHT: actions.add("RIGHT")
+                elif event.key == K_w: actions.add("A")
+                elif event.key == K_a: actions.add("B")
+                elif event.key == K_s: actions.add("X")
+                elif event.key == K_d: actions.add("Y")
+                elif event.key == K_RETURN: actions.add("START")
+                elif event.key == K_RSHIFT or event.key == K_LSHIFT: actions.add("SELECT")
+                elif event.key == K_q: actions.add("L")
+                elif event.key == K_e: actions.add("R")
+                elif event.key == K_ESCAPE: actions.add("QUIT")
 
         return actions
@@ -6,11 +6,48 @@ import pygame
 import requests
 import logging
 import hashlib
+import os
+import tempfile
+import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Callable
 from io import BytesIO
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_CACHE_DIR = Path.home() / "gamebird" / "cache" / "images"
+
+# Keep-alive session for all image downloads (one TLS handshake per CDN host)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=2))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=2))
+
+# Background loaders; pool size matches the connection pool
+_LOADER_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="image-load")
+
+# Shared caches, one per target size (see ImageCache.get_shared)
+_shared_caches: dict = {}
+_shared_lock = threading.Lock()
+
+# Cache dirs already swept of the old flat layout this run
+_purged_dirs: set = set()
+
+
+def _purge_flat_layout(cache_dir: Path):
+    """Delete images left at the top level by the old md5-named flat layout."""
+    removed = 0
+    for pattern in ("*.png", "*.jpg", "*.jpeg"):
+        for path in cache_dir.glob(pattern):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                logging.debug(f"Could not remove old cached image {path}: {e}")
+    if removed:
+        logging.info(f"Removed {removed} images from the old cache layout in {cache_dir}")
 
 
 class ImageCache:
@@ -24,11 +61,22 @@ class ImageCache:
     # 100 surfaces ≈ 10MB memory cap
     MAX_CACHED_SURFACES = 100
     
+    # Disk entries older than this are revalidated with the CDN (If-None-Match)
+    REVALIDATE_AFTER = 24 * 60 * 60
+    
     def __init__(self, cache_dir: Path, target_size: tuple = (160, 160)):
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.target_size = target_size
         
+        # Entries now live in sha1-prefix subdirectories; sweep the old flat
+        # files once per dir, off the UI thread
+        with _shared_lock:
+            purge = cache_dir not in _purged_dirs
+            _purged_dirs.add(cache_dir)
+        if purge:
+            _LOADER_POOL.submit(_purge_flat_layout, cache_dir)
+        
         # In-memory LRU cache of loaded surfaces (OrderedDict for LRU)
         self._surfaces: OrderedDict[str, pygame.Surface] = OrderedDict()
         # URLs currently being loaded
@@ -38,13 +86,51 @@ class ImageCache:
         # Lock for thread safety
         self._lock = threading.Lock()
     
+    @classmethod
+    def get_shared(cls, target_size: tuple = (160, 160)) -> "ImageCache":
+        """
+        Get the process-wide cache for a target size.
+        Screens showing the same images at different sizes share decoded
+        surfaces through these instances instead of each owning a cache.
+        """
+        with _shared_lock:
+            cache = _shared_caches.get(target_size)
+            if cache is None:
+                cache = cls(DEFAULT_CACHE_DIR, target_size=target_size)
+                _shared_caches[target_size] = cache
+            return cache
+    
+    def _find_in_shared(self, url: str) -> Optional[pygame.Surface]:
+        """Return a surface already decoded at an equal or larger size by another shared cache."""
+        with _shared_lock:
+            others = [c for c in _shared_caches.values()
+                      if c is not self and c.target_size[0] >= self.target_size[0]]
+        for cache in others:
+            with cache._lock:
+                surface = cache._surfaces.get(url)
+            if surface is not None:
+                return surface
+        return None
+    
     def _url_to_cache_path(self, url: str) -> Path:
-        """Convert URL to a cache file path."""
-        url_hash = hashlib.md5(url.encode()).hexdigest()
+        """Convert URL to a cache file path, keyed by sha1(url) and sharded by prefix."""
+        key = hashlib.sha1(url.encode()).hexdigest()
         ext = url.split('.')[-1].lower()
         if ext not in ('png', 'jpg', 'jpeg'):
             ext = 'png'
-        return self.cache_dir / f"{url_hash}.{ext}"
+        return self.cache_dir / key[:2] / f"{key}.{ext}"
+    
+    @staticmethod
+    def _etag_path(cache_path: Path) -> Path:
+        """Sidecar file holding the ETag the cached image was served with."""
+        return cache_path.with_name(cache_path.name + ".etag")
+    
+    def _is_fresh(self, cache_path: Path) -> bool:
+        """True if a disk entry exists and doesn't need revalidating yet."""
+        try:
+            return time.time() - cache_path.stat().st_mtime < self.REVALIDATE_AFTER
+        except OSError:
+            return False
     
     def get(self, url: str, callback: Optional[Callable[[pygame.Surface], None]] = None) -> Optional[pygame.Surface]:
         """
@@ -81,9 +167,8 @@ class ImageCache:
             if callback:
                 self._callbacks[url] = [callback]
         
-        # Load in background thread
-        thread = threading.Thread(target=self._load_image, args=(url,), daemon=True)
-        thread.start()
+        # Load on the background pool
+        _LOADER_POOL.submit(self._load_image, url)
         return None
     
     def _load_image(self, url: str):
@@ -92,8 +177,11 @@ class ImageCache:
         cache_path = self._url_to_cache_path(url)
         
         try:
-            # Try disk cache first
-            if cache_path.exists():
+            # Reuse a surface another shared cache already decoded
+            surface = self._find_in_shared(url)
+            
+            # Then try disk cache
+            if surface is None and self._is_fresh(cache_path):
                 surface = self._load_from_disk(cache_path)
             
             # Download if not cached
@@ -132,26 +220,62 @@ class ImageCache:
             return None
     
     def _download_and_cache(self, url: str, cache_path: Path) -> Optional[pygame.Surface]:
-        """Download image and save to cache."""
+        """
+        Download image and write it through to the disk cache.
+        A stale disk entry is revalidated with If-None-Match; on 304 the
+        cached file is reused without downloading the body again.
+        """
+        etag_path = self._etag_path(cache_path)
         try:
-            response = requests.get(url, timeout=10)
+            headers = {}
+            if cache_path.exists() and etag_path.exists():
+                headers["If-None-Match"] = etag_path.read_text().strip()
+            
+            response = _SESSION.get(url, timeout=10, headers=headers)
+            
+            if response.status_code == 304:
+                # Unchanged on the CDN - mark fresh and use the disk copy
+                os.utime(cache_path)
+                return self._load_from_disk(cache_path)
+            
             response.raise_for_status()
             
-            # Save to disk
-            cache_path.write_bytes(response.content)
+            # Atomic write to disk. Each download gets its own temp file, since
+            # caches of different sizes can fetch the same URL at once
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(response.content)
+                os.replace(temp_name, cache_path)
+            except BaseException:
+                try:
+                    os.unlink(temp_name)
+                except OSError:
+                    pass
+                raise
+            
+            etag = response.headers.get("ETag")
+            if etag:
+                etag_path.write_text(etag)
+            elif etag_path.exists():
+                etag_path.unlink()
             
             # Load as surface
             return pygame.image.load(BytesIO(response.content))
         
         except Exception as e:
             logging.warning(f"Failed to download image {url}: {e}")
+            # Offline: a stale copy is better than nothing
+            if cache_path.exists():
+                return self._load_from_disk(cache_path)
             return None
     
     def preload(self, urls: list):
-        """Preload a list of images in background."""
+        """Preload a list of images in background (fans out across the loader pool)."""
         for url in urls:
-            if url and url not in self._surfaces and url not in self._loading:
-                self.get(url)
+            # get() skips URLs that are cached or already loading
+            self.get(url)
     
     def clear_memory(self):
         """Clear in-memory cache (keeps disk cache)."""
@@ -191,7 +315,9 @@ class ImageCache:
         surface = None
         
         try:
-            if cache_path.exists():
+            surface = self._find_in_shared(url)
+            
+            if surface is None and self._is_fresh(cache_path):
                 surface = self._load_from_disk(cache_path)
             
             if surface is None:
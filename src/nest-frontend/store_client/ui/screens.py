@@ -2,40 +2,82 @@ import pygame
 import threading
 import logging
 import subprocess
-import time
 import requests
-from typing import List, Optional
-from pathlib import Path
+import functools
+import queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Optional, Set, Tuple
 from .widgets import (
-    draw_text, draw_list_item, draw_progress_bar, draw_button_hint,
+    draw_text, draw_list_item, draw_list_highlight, draw_progress_bar, draw_button_hint,
     draw_browse_list_item, draw_tags_row, draw_star_rating,
     draw_mature_banner, draw_nav_arrow, draw_page_indicator, draw_heart,
-    draw_rating_stars, _get_star_image, BG_COLOR, ACCENT_COLOR, STAR_YELLOW
+    draw_rating_stars, draw_image_frame, _get_star_image, BG_COLOR, ACCENT_COLOR, STAR_YELLOW,
+    TEXT_COLOR, SELECTED_TEXT_COLOR
 )
 from .image_cache import ImageCache
+from .controller_input import REBOOT_EVENT
 from ..models import CatalogEntry, GameManifest, InstalledGame, UpdateInfo
 from ..cdn_api import CatalogPage
 
 class Screen:
     def __init__(self, app):
         self.app = app
+        # Pre-rendered fixed strings: (text, color) -> pygame.Surface
+        self._static = {}
 
     def on_enter(self):
         pass
 
-    def update(self, actions: List[str]):
+    def update(self, actions: Set[str]):
         pass
 
     def draw(self, surface):
+        """
+        Draw the screen onto the canvas.
+        May return a list of canvas Rects that changed since the previous
+        frame; returning None presents the whole canvas.
+        """
         pass
 
+    def draw_static_text(self, surface, text, x, y, color=TEXT_COLOR):
+        """Draw fixed text centered at (x, y), rendering it only the first time."""
+        key = (text, color)
+        label = self._static.get(key)
+        if label is None:
+            label = self.app.font.render(text, True, color)
+            self._static[key] = label
+        surface.blit(label, label.get_rect(center=(x, y)))
+
+    def view_state(self):
+        """
+        Return a hashable snapshot of everything draw() depends on.
+        When it equals the previous frame's snapshot the app skips drawing
+        and presenting. None (the default) redraws every frame.
+        """
+        return None
+
 class MainMenu(Screen):
+    START_Y = 80
+    GAP = 25
+    ITEM_WIDTH = 180
+
     def __init__(self, app):
         super().__init__(app)
         self.items = ["Browse Catalog", "Installed Games", "Check for Updates", "Parental Controls", "Developer Code", "Exit"]
         self.selected_index = 0
+        # Item highlighted by the previous draw, whose row must be presented again
+        self._drawn_index = 0
+        
+        # Labels never change, so render them once: (normal, selected, dest)
+        self._labels = []
+        for i, item in enumerate(self.items):
+            normal = app.font.render(item, True, TEXT_COLOR)
+            selected = app.font.render(item, True, SELECTED_TEXT_COLOR)
+            dest = normal.get_rect(center=(120, self.START_Y + i * self.GAP))
+            self._labels.append((normal, selected, dest))
 
-    def update(self, actions: List[str]):
+    def update(self, actions: Set[str]):
         if "UP" in actions:
             self.selected_index = (self.selected_index - 1) % len(self.items)
         elif "DOWN" in actions:
@@ -55,17 +97,30 @@ class MainMenu(Screen):
             elif selection == "Exit":
                 self.app.change_screen("RebootScreen")
 
+    def view_state(self):
+        return self.selected_index
+
+    def _row_rect(self, index):
+        """Canvas area covered by an item's highlight box."""
+        return pygame.Rect(0, self.START_Y + index * self.GAP - 13, 240, 26)
+
     def draw(self, surface):
         surface.fill(BG_COLOR)
         draw_text(surface, self.app.font, "GAME BIRD NEST", 120, 30, center=True)
         pygame.draw.line(surface, ACCENT_COLOR, (0, 50), (240, 50), 2)
         
-        start_y = 80
-        gap = 25
-        for i, item in enumerate(self.items):
-            draw_list_item(surface, self.app.font, item, start_y + i * gap, 180, i == self.selected_index)
+        draw_list_highlight(surface, self.START_Y + self.selected_index * self.GAP, self.ITEM_WIDTH)
+        surface.blits([
+            (selected if i == self.selected_index else normal, dest)
+            for i, (normal, selected, dest) in enumerate(self._labels)
+        ], False)
             
         draw_text(surface, self.app.font, "A: Select         B: Back", 120, 230, (200, 200, 200), center=True)
+        
+        # Only the old and new highlighted rows differ from the last frame
+        dirty = [self._row_rect(self._drawn_index), self._row_rect(self.selected_index)]
+        self._drawn_index = self.selected_index
+        return dirty
 
 
 class CatalogList(Screen):
@@ -83,6 +138,7 @@ class CatalogList(Screen):
     """
     
     GAMES_PER_PAGE = 25
+    PAGE_CACHE_SIZE = 8
     
     def __init__(self, app):
         super().__init__(app)
@@ -107,12 +163,22 @@ class CatalogList(Screen):
         self.screenshot_index = 0  # 0 = icon, 1-3 = screenshots
         
         # Image cache
-        cache_dir = Path.home() / "gamebird" / "cache" / "images"
-        self.image_cache = ImageCache(cache_dir, target_size=(160, 160))
+        self.image_cache = ImageCache.get_shared((160, 160))
         
         # Current displayed image (icon or screenshot)
         self.current_image: Optional[pygame.Surface] = None
         self.image_loading = False
+        
+        # Display strings, rebuilt only when the page or filters change
+        self._topbar_strings = ("", "", "")  # (filters, games, page)
+        self._numbered_titles: List[str] = []
+        
+        # Top bar contents of the last frame, to skip presenting it when unchanged
+        self._last_topbar_key = None
+        
+        # Recently fetched pages, so paging back and forth skips the network.
+        # Keyed by (page, tags, min_rating, include_mature); cleared on filter changes.
+        self._page_cache: "OrderedDict[tuple, CatalogPage]" = OrderedDict()
 
     def on_enter(self):
         self.loading = True
@@ -123,29 +189,35 @@ class CatalogList(Screen):
         self.viewing_screenshot = False
         self.screenshot_index = 0
         # Keep filter_tags across re-entries unless explicitly cleared
-        threading.Thread(target=self._fetch_catalog, daemon=True).start()
+        self.app.bg_pool.submit(self._fetch_catalog)
 
     def _fetch_catalog(self):
         try:
             include_mature = not self.app.parental_controls.should_filter_mature()
+            key = (self.current_page, tuple(sorted(self.filter_tags)), self.min_rating, include_mature)
             
-            result: CatalogPage = self.app.cdn_api.fetch_catalog(
-                page=self.current_page,
-                per_page=self.GAMES_PER_PAGE,
-                include_mature=include_mature,
-                tags=self.filter_tags if self.filter_tags else None,
-                min_rating=self.min_rating
-            )
+            result = self._page_cache.get(key)
+            if result is None:
+                result = self.app.cdn_api.fetch_catalog(
+                    page=self.current_page,
+                    per_page=self.GAMES_PER_PAGE,
+                    include_mature=include_mature,
+                    tags=self.filter_tags if self.filter_tags else None,
+                    min_rating=self.min_rating
+                )
+                self._page_cache[key] = result
+                if len(self._page_cache) > self.PAGE_CACHE_SIZE:
+                    self._page_cache.popitem(last=False)
+            else:
+                self._page_cache.move_to_end(key)
             
             self.games = result.games
             self.total_pages = result.total_pages
             self.total_games = result.total
             
-            # Preload icons for visible games
+            # Preload icons for the whole page in one batch
             if self.games:
-                for game in self.games[:5]:
-                    if game.icon_url:
-                        self.image_cache.preload([game.icon_url])
+                self.image_cache.preload([g.icon_url for g in self.games if g.icon_url])
                 # Load first game's icon
                 self._load_current_image()
                 
@@ -153,8 +225,21 @@ class CatalogList(Screen):
             logging.error(f"Catalog fetch error: {e}")
             self.error = str(e)
         finally:
+            self._refresh_labels()
             self.loading = False
 
+    def _refresh_labels(self):
+        """Rebuild the top bar and numbered title strings for the current page."""
+        filter_count = len(self.filter_tags) + (1 if self.min_rating else 0)
+        self._topbar_strings = (
+            f"Filters: {filter_count}",
+            f"Games: {self.total_games}",
+            f"P.{self.current_page}/{self.total_pages}",
+        )
+        # Global game number: (page-1) * per_page + index + 1
+        first_num = (self.current_page - 1) * self.GAMES_PER_PAGE + 1
+        self._numbered_titles = [f"{first_num + i}.{g.title}" for i, g in enumerate(self.games)]
+
     def _load_current_image(self):
         """Load the current game's icon or screenshot."""
         if not self.games:
@@ -198,16 +283,17 @@ class CatalogList(Screen):
         self.viewing_screenshot = False
         self.screenshot_index = 0
         self.loading = True
-        threading.Thread(target=self._fetch_catalog, daemon=True).start()
+        self.app.bg_pool.submit(self._fetch_catalog)
 
     def set_filters(self, tags: List[str] = None, min_rating: Optional[float] = None):
         """Set filter tags and rating, then reload catalog."""
         self.filter_tags = tags or []
         self.min_rating = min_rating
+        self._page_cache.clear()
         self.current_page = 1
         self.selected_index = 0
         self.loading = True
-        threading.Thread(target=self._fetch_catalog, daemon=True).start()
+        self.app.bg_pool.submit(self._fetch_catalog)
 
     def clear_filters(self):
         """Clear all filters and reload catalog."""
@@ -225,7 +311,7 @@ class CatalogList(Screen):
             self.filter_tags.remove(tag)
             self.set_filters(self.filter_tags)
 
-    def update(self, actions: List[str]):
+    def update(self, actions: Set[str]):
         if self.loading:
             if "B" in actions:
                 self.app.change_screen("MainMenu")
@@ -309,19 +395,25 @@ class CatalogList(Screen):
             else:
                 self.app.change_screen("MainMenu")
 
+    # Everything below the top bar: image, overlays and the game list
+    BROWSE_RECT = pygame.Rect(0, 22, 240, 218)
+
     def draw(self, surface):
         surface.fill(BG_COLOR)
         
         if self.loading:
+            self._last_topbar_key = None
             draw_text(surface, self.app.font, "Loading...", 120, 120, center=True)
             return
             
         if self.error:
+            self._last_topbar_key = None
             draw_text(surface, self.app.font, "Error loading catalog", 120, 100, center=True)
             draw_text(surface, self.app.font, "Press B to go back", 120, 130, center=True)
             return
 
         if not self.games:
+            self._last_topbar_key = None
             draw_text(surface, self.app.font, "No games found", 120, 100, center=True)
             if self.filter_tags:
                 draw_text(surface, self.app.font, "START: Change Filters", 120, 130, (120, 120, 140), center=True)
@@ -336,13 +428,13 @@ class CatalogList(Screen):
         top_y = 6
         
         if self.filter_tags or self.min_rating:
+            filters_text, games_text, page_text = self._topbar_strings
             # Show filter count
-            filter_count = len(self.filter_tags) + (1 if self.min_rating else 0)
-            draw_text(surface, self.app.font, f"Filters: {filter_count}", 2, top_y)
+            draw_text(surface, self.app.font, filters_text, 2, top_y)
             # Games count (center)
-            draw_text(surface, self.app.font, f"Games: {self.total_games}", 83, top_y)
+            draw_text(surface, self.app.font, games_text, 83, top_y)
             # Page count (right)
-            draw_text(surface, self.app.font, f"P.{self.current_page}/{self.total_pages}", 194, top_y)
+            draw_text(surface, self.app.font, page_text, 194, top_y)
         
         else:
             # Show hint to apply filters
@@ -363,7 +455,7 @@ class CatalogList(Screen):
         img_y = 22  # Fixed position below top bar
         
         # Draw image background
-        pygame.draw.rect(surface, (30, 30, 50), (img_x, img_y, img_size, img_size))
+        draw_image_frame(surface, img_x, img_y, img_size)
         
         if self.current_image:
             surface.blit(self.current_image, (img_x, img_y))
@@ -405,12 +497,15 @@ class CatalogList(Screen):
         end_idx = min(start_idx + visible_count, len(self.games))
         
         for i in range(start_idx, end_idx):
-            g = self.games[i]
             y = list_y + (i - start_idx) * list_gap
-            # Calculate global game number: (page-1) * per_page + index + 1
-            game_num = (self.current_page - 1) * self.GAMES_PER_PAGE + i + 1
-            numbered_title = f"{game_num}.{g.title}"
-            draw_browse_list_item(surface, self.app.font, numbered_title, y, selected=(i == self.selected_index))
+            draw_browse_list_item(surface, self.app.font, self._numbered_titles[i], y, selected=(i == self.selected_index))
+        
+        # The top bar only changes with the page/filters; present just the rest otherwise
+        topbar_key = (self._topbar_strings, bool(self.filter_tags or self.min_rating))
+        if topbar_key == self._last_topbar_key:
+            return [self.BROWSE_RECT]
+        self._last_topbar_key = topbar_key
+        return None
 
 class GameDetail(Screen):
     """
@@ -442,9 +537,15 @@ class GameDetail(Screen):
         self.max_scroll = 0
         self.content_height = 0
         
-        # Image cache for icon and screenshots
-        cache_dir = Path.home() / "gamebird" / "cache" / "images"
-        self.image_cache = ImageCache(cache_dir, target_size=(self.ICON_SIZE, self.ICON_SIZE))
+        # Wrapped text, computed once per manifest
+        self.tag_lines: List[str] = []
+        self.desc_lines: List[str] = []
+        
+        # Footer state of the last frame, to skip presenting it when unchanged
+        self._last_footer_key = None
+        
+        # Image cache for icon and screenshots (shared with CatalogList's decodes)
+        self.image_cache = ImageCache.get_shared((self.ICON_SIZE, self.ICON_SIZE))
         self.icon_surface: Optional[pygame.Surface] = None
         self.screenshot_surfaces: List[Optional[pygame.Surface]] = []
         
@@ -459,10 +560,13 @@ class GameDetail(Screen):
         self.loading = True
         self.error = None
         self.scroll_y = 0
+        self.content_height = 0
+        self.tag_lines = []
+        self.desc_lines = []
         self.icon_surface = None
         self.screenshot_surfaces = []
         self.installed_game = self.app.repo.load_installed_games().get(slug)
-        threading.Thread(target=self._fetch_manifest, daemon=True).start()
+        self.app.bg_pool.submit(self._fetch_manifest)
 
     def _fetch_manifest(self):
         try:
@@ -470,6 +574,7 @@ class GameDetail(Screen):
             if not self.manifest:
                 self.error = "Failed to load game details"
             else:
+                self._layout_content()
                 # Load icon
                 if self.manifest.icon_url:
                     self.image_cache.get(self.manifest.icon_url, callback=self._on_icon_loaded)
@@ -490,6 +595,28 @@ class GameDetail(Screen):
         if idx < len(self.screenshot_surfaces):
             self.screenshot_surfaces[idx] = surface
 
+    def _layout_content(self):
+        """Wrap tags/description and compute content height once per manifest."""
+        m = self.manifest
+        self.tag_lines = self._wrap_text("Tags: " + ", ".join(m.tags), 28) if m.tags else []
+        self.desc_lines = self._wrap_text(m.description, 28)
+        
+        height = 5 + 20 + self.ICON_SIZE + 10
+        if m.author:
+            height += self.LINE_HEIGHT + 4
+        if self.tag_lines:
+            height += len(self.tag_lines) * self.LINE_HEIGHT + 8
+        height += self.LINE_HEIGHT + 2 + len(self.desc_lines) * self.LINE_HEIGHT + 10
+        if m.screenshot_urls:
+            height += 20 + len(m.screenshot_urls) * (self.ICON_SIZE + 10)
+        self.content_height = height
+
+    def _visible_range(self, top: int, count: int):
+        """Return (first, last) indices of lines starting at y=top that fall on screen."""
+        first = max(0, -top // self.LINE_HEIGHT)
+        last = min(count, (200 - top + self.LINE_HEIGHT - 1) // self.LINE_HEIGHT)
+        return first, last
+
     def _wrap_text(self, text: str, max_chars: int = 30) -> List[str]:
         """Wrap text to fit within max characters per line."""
         words = text.split()
@@ -508,7 +635,7 @@ class GameDetail(Screen):
             lines.append(" ".join(current_line))
         return lines
 
-    def update(self, actions: List[str]):
+    def update(self, actions: Set[str]):
         if "B" in actions:
             self.app.go_back()
             return
@@ -536,19 +663,25 @@ class GameDetail(Screen):
             self.installed_game = None
             self.app.go_back()
 
+    # Scrollable area above the fixed footer
+    CONTENT_RECT = pygame.Rect(0, 0, 240, 200)
+
     def draw(self, surface):
         surface.fill(BG_COLOR)
         
         if self.loading:
+            self._last_footer_key = None
             draw_text(surface, self.app.font, "Loading details...", 120, 120, center=True)
             return
             
         if self.error:
+            self._last_footer_key = None
             draw_text(surface, self.app.font, "Error:", 120, 100, center=True)
             draw_text(surface, self.app.font, self.error, 120, 130, center=True)
             return
 
         if not self.manifest:
+            self._last_footer_key = None
             return
         
         version = self.manifest.version or self.manifest.current_version
@@ -570,7 +703,7 @@ class GameDetail(Screen):
         
         # Draw icon
         if icon_y > -self.ICON_SIZE and icon_y < 200:
-            pygame.draw.rect(surface, (30, 30, 50), (icon_x, icon_y, self.ICON_SIZE, self.ICON_SIZE))
+            draw_image_frame(surface, icon_x, icon_y, self.ICON_SIZE)
             if self.icon_surface:
                 surface.blit(self.icon_surface, (icon_x, icon_y))
             # Installed banner at bottom of icon
@@ -620,49 +753,44 @@ class GameDetail(Screen):
         y += self.ICON_SIZE + 10
         
         # === AUTHOR ===
-        if self.manifest.author and y > -20 and y < 200:
-            draw_text(surface, self.app.font, f"Author: {self.manifest.author}", 5, y, (200, 200, 200))
+        if self.manifest.author:
+            if y > -20 and y < 200:
+                draw_text(surface, self.app.font, f"Author: {self.manifest.author}", 5, y, (200, 200, 200))
             y += self.LINE_HEIGHT + 4
         
         # === TAGS ===
-        if self.manifest.tags and y > -50 and y < 200:
-            tag_text = "Tags: " + ", ".join(self.manifest.tags)
-            tag_lines = self._wrap_text(tag_text, 28)
-            for line in tag_lines:
-                if y > -self.LINE_HEIGHT and y < 200:
-                    draw_text(surface, self.app.font, line, 5, y, (200, 200, 200))
-                y += self.LINE_HEIGHT
-            y += 8
+        if self.tag_lines:
+            first, last = self._visible_range(y, len(self.tag_lines))
+            for i in range(first, last):
+                draw_text(surface, self.app.font, self.tag_lines[i], 5, y + i * self.LINE_HEIGHT, (200, 200, 200))
+            y += len(self.tag_lines) * self.LINE_HEIGHT + 8
         
         # === DESCRIPTION ===
         if y > -20 and y < 200:
             draw_text(surface, self.app.font, "Description:", 5, y, (180, 180, 180))
         y += self.LINE_HEIGHT + 2
         
-        desc_lines = self._wrap_text(self.manifest.description, 28)
-        for line in desc_lines:
-            if y > -self.LINE_HEIGHT and y < 200:
-                draw_text(surface, self.app.font, line, 5, y)
-            y += self.LINE_HEIGHT
-        y += 10
+        first, last = self._visible_range(y, len(self.desc_lines))
+        for i in range(first, last):
+            draw_text(surface, self.app.font, self.desc_lines[i], 5, y + i * self.LINE_HEIGHT)
+        y += len(self.desc_lines) * self.LINE_HEIGHT + 10
         
         # === SCREENSHOTS ===
-        if self.manifest.screenshot_urls:
-            if y > -20 and y < 200:
+        if self.manifest.screenshot_urls and y < 200:
+            if y > -20:
                 draw_text(surface, self.app.font, "Screenshots:", 5, y, (180, 180, 180))
             y += 20
             
             for i, ss_surface in enumerate(self.screenshot_surfaces):
-                if y > -self.ICON_SIZE and y < 200:
+                if y >= 200:
+                    break
+                if y > -self.ICON_SIZE:
                     ss_x = (240 - self.ICON_SIZE) // 2
-                    pygame.draw.rect(surface, (30, 30, 50), (ss_x, y, self.ICON_SIZE, self.ICON_SIZE))
+                    draw_image_frame(surface, ss_x, y, self.ICON_SIZE)
                     if ss_surface:
                         surface.blit(ss_surface, (ss_x, y))
                 y += self.ICON_SIZE + 10
         
-        # Store content height for scroll calculations
-        self.content_height = y + self.scroll_y
-        
         # === FOOTER (fixed at bottom) ===
         footer_y = 200
         pygame.draw.rect(surface, BG_COLOR, (0, footer_y, 240, 40))
@@ -677,6 +805,13 @@ class GameDetail(Screen):
             draw_text(surface, self.app.font, action, 5, footer_y + 22, (200, 200, 200))
         
         draw_text(surface, self.app.font, "B: Back", 235, footer_y + 22, (200, 200, 200), right=True)
+        
+        # Scrolling only touches the content area while the footer is unchanged
+        footer_key = (is_installed, self.installed_game is not None)
+        if footer_key == self._last_footer_key:
+            return [self.CONTENT_RECT]
+        self._last_footer_key = footer_key
+        return None
 
 
 class DownloadScreen(Screen):
@@ -714,7 +849,7 @@ class DownloadScreen(Screen):
         else:
             self.status = "Installation Failed."
 
-    def update(self, actions: List[str]):
+    def update(self, actions: Set[str]):
         if self.finished:
             if self.success and not self.showing_cta:
                 # Show CTA after successful install
@@ -765,6 +900,13 @@ class DownloadScreen(Screen):
                 draw_text(surface, self.app.font, "A: Continue", 120, 230, (200, 200, 200), center=True)
 
 class UpdateCheck(Screen):
+    CATALOG_PER_PAGE = 100
+    MAX_FETCH_WORKERS = 8
+    # Shared by every check so page workers are started once, not per check
+    _fetch_pool = ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS, thread_name_prefix="catalog-page")
+    # A cached catalog younger than this is used without touching the network
+    CATALOG_TTL = 5 * 60
+    
     def __init__(self, app):
         super().__init__(app)
         self.updates: List[UpdateInfo] = []
@@ -775,40 +917,90 @@ class UpdateCheck(Screen):
         self.loading = True
         self.updates = []
         self.message = "Checking..."
-        threading.Thread(target=self._check_updates, daemon=True).start()
+        self.app.bg_pool.submit(self._check_updates)
+
+    def _iter_catalog_pages(self) -> Iterator[Tuple[int, CatalogPage]]:
+        """
+        Yield (page number, page) for every catalog page as it arrives.
+        The bulk endpoint is tried first and yielded as page 0. Otherwise page 1
+        is fetched to learn total_pages and the rest are fetched concurrently.
+        Pages are revalidated by ETag, so unchanged pages cost a 304.
+        """
+        cached_pages = self.app.repo.load_catalog_pages()
+        
+        bulk = self.app.cdn_api.fetch_catalog_bulk(cached=cached_pages.get(0))
+        if bulk is not None:
+            logging.info(f"Fetched bulk catalog, got {len(bulk.games)} games")
+            yield 0, bulk
+            return
+        
+        def fetch(page: int) -> CatalogPage:
+            return self.app.cdn_api.fetch_catalog(
+                page=page, per_page=self.CATALOG_PER_PAGE, cached=cached_pages.get(page)
+            )
+        
+        first = fetch(1)
+        logging.info(f"Fetched page 1/{first.total_pages}, got {len(first.games)} games")
+        yield 1, first
+        
+        if first.total_pages > 1:
+            futures = {self._fetch_pool.submit(fetch, p): p for p in range(2, first.total_pages + 1)}
+            try:
+                for future in as_completed(futures):
+                    page = futures[future]
+                    result = future.result()
+                    logging.info(f"Fetched page {page}/{first.total_pages}, got {len(result.games)} games")
+                    yield page, result
+            finally:
+                # On failure, drop pages that have not started yet
+                for future in futures:
+                    future.cancel()
 
     def _check_updates(self):
         try:
-            # Refresh catalog first (fetch ALL games for update check)
-            all_games = []
-            page = 1
-            while True:
-                catalog_page = self.app.cdn_api.fetch_catalog(page=page, per_page=100)
-                all_games.extend(catalog_page.games)
-                logging.info(f"Fetched page {page}/{catalog_page.total_pages}, got {len(catalog_page.games)} games")
-                if page >= catalog_page.total_pages:
-                    break
-                page += 1
+            age = self.app.repo.catalog_cache_age()
+            if age is not None and age < self.CATALOG_TTL:
+                catalog = self.app.repo.load_cached_catalog()
+                if catalog:
+                    logging.info(f"Using cached catalog ({int(age)}s old): {len(catalog)} games")
+                    self._finish_check(catalog)
+                    return
+            
+            # Refresh catalog (ALL games), comparing each page as it arrives
+            fetched_pages = {}
+            
+            def page_games():
+                for number, page in self._iter_catalog_pages():
+                    fetched_pages[number] = page
+                    yield from page.games
+            
+            updates = self.app.updater.get_update_list(page_games())
+            all_games = [g for number in sorted(fetched_pages) for g in fetched_pages[number].games]
             
             if all_games:
+                self.app.repo.save_catalog_pages(fetched_pages)
                 self.app.repo.cache_catalog(all_games)
-                catalog = all_games
-            else:
-                catalog = self.app.repo.load_cached_catalog()
-            
-            logging.info(f"Total catalog: {len(catalog)} games")
-            self.updates = self.app.updater.get_update_list(catalog)
-            if not self.updates:
-                self.message = "No updates available."
+                logging.info(f"Total catalog: {len(all_games)} games")
+                self._show_updates(updates)
             else:
-                self.message = f"Found {len(self.updates)} updates."
+                self._finish_check(self.app.repo.load_cached_catalog())
         except Exception as e:
             logging.error(f"Update check failed: {e}", exc_info=True)
             self.message = f"Error: {e}"
         finally:
             self.loading = False
 
-    def update(self, actions: List[str]):
+    def _finish_check(self, catalog: List[CatalogEntry]):
+        self._show_updates(self.app.updater.get_update_list(catalog))
+
+    def _show_updates(self, updates: List[UpdateInfo]):
+        self.updates = updates
+        if not self.updates:
+            self.message = "No updates available."
+        else:
+            self.message = f"Found {len(self.updates)} updates."
+
+    def update(self, actions: Set[str]):
         if self.loading:
             return
 
@@ -821,18 +1013,23 @@ class UpdateCheck(Screen):
             # Let's just go to the first one's detail page
             self.app.show_game_detail(self.updates[0].game_id)
 
+    def view_state(self):
+        return (self.loading, self.message)
+
     def draw(self, surface):
         surface.fill(BG_COLOR)
-        draw_text(surface, self.app.font, "UPDATES", 120, 20, center=True)
+        self.draw_static_text(surface, "UPDATES", 120, 20)
         
         draw_text(surface, self.app.font, self.message, 120, 120, center=True)
         
         if not self.loading:
 
-            draw_text(surface, self.app.font, "A: View First         B: Back", 120, 230, (200, 200, 200), center=True)
+            self.draw_static_text(surface, "A: View First         B: Back", 120, 230, (200, 200, 200))
 
+@functools.lru_cache(maxsize=1)
 def get_device_id() -> Optional[str]:
-    """Get the device ID (Pi serial number). Returns None if not available."""
+    """Get the device ID (Pi serial number). Returns None if not available.
+    The serial number never changes, so it is read once per process."""
     try:
         with open('/sys/firmware/devicetree/base/serial-number', 'r') as f:
             return f.read().replace('\x00', '').strip().lower()
@@ -840,19 +1037,61 @@ def get_device_id() -> Optional[str]:
         return None
 
 
+# Rating submissions are sent by one background worker, started on first use
+_rating_queue: "queue.Queue[tuple]" = queue.Queue()
+_rating_worker: Optional[threading.Thread] = None
+_rating_worker_lock = threading.Lock()
+
+
+def _queue_rating(cdn_api, device_id: str, game_slug: str, rating: int) -> None:
+    """Queue a rating for the background worker to send to the server."""
+    global _rating_worker
+    _rating_queue.put((cdn_api, device_id, game_slug, rating))
+    with _rating_worker_lock:
+        if _rating_worker is None:
+            _rating_worker = threading.Thread(target=_rating_worker_loop, name="rating-submit", daemon=True)
+            _rating_worker.start()
+
+
+def _rating_worker_loop() -> None:
+    while True:
+        batch = [_rating_queue.get()]
+        while True:
+            try:
+                batch.append(_rating_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        # Only the latest rating per game needs sending
+        latest = {}
+        for cdn_api, device_id, game_slug, rating in batch:
+            latest[(device_id, game_slug)] = (cdn_api, rating)
+        for (device_id, game_slug), (cdn_api, rating) in latest.items():
+            try:
+                cdn_api.rate_game(device_id, game_slug, rating)
+            except Exception as e:
+                logging.warning(f"Failed to submit rating for {game_slug}: {e}")
+
+
 class InstalledList(Screen):
     # Layout constants
     LIST_START_Y = 50
     ITEM_HEIGHT = 30
     VISIBLE_AREA_HEIGHT = 155  # From LIST_START_Y to footer background
     FOOTER_BG_Y = 205  # Where footer background starts
+    MAX_VISIBLE = VISIBLE_AREA_HEIGHT // ITEM_HEIGHT
+    FOOTER_RECT = pygame.Rect(0, FOOTER_BG_Y, 240, 35)
+    # Everything below the title, the only part that changes while listing
+    BODY_RECT = pygame.Rect(0, 35, 240, 205)
     
     def __init__(self, app):
         super().__init__(app)
         self.games: List[InstalledGame] = []
         self.selected_index = 0
         self.scroll_offset = 0  # How many items scrolled from top
-        self.game_ratings: dict = {}  # Dict of game_slug -> rating (1-5)
+        # Dict of game_slug -> rating (1-5). Never mutated in place: writers
+        # swap in a new dict, so the sync thread and draw() can't race on it.
+        self.game_ratings: dict = {}
         self.device_id: Optional[str] = None
         
         # Rating mode
@@ -869,40 +1108,43 @@ class InstalledList(Screen):
         self.game_ratings = self.app.repo.load_ratings()
         # Sync ratings from server in background
         if self.device_id:
-            threading.Thread(target=self._sync_ratings, daemon=True).start()
+            self.app.bg_pool.submit(self._sync_ratings)
 
     def _sync_ratings(self):
         """Sync ratings with server."""
         try:
-            server_ratings = self.app.cdn_api.fetch_device_ratings(self.device_id)
+            state = self.app.device_sync.get(self.device_id)
+            if state is not None and "ratings" in state:
+                server_ratings = state["ratings"]
+            else:
+                server_ratings = self.app.cdn_api.fetch_device_ratings(self.device_id)
             if server_ratings:
                 self.game_ratings = server_ratings
-                self.app.repo.save_ratings(self.game_ratings)
+                self.app.repo.save_ratings(server_ratings)
         except Exception as e:
             logging.warning(f"Failed to sync ratings from server: {e}")
 
     def _submit_rating(self, game_slug: str, rating: int):
         """Submit a rating for a game."""
-        self.game_ratings[game_slug] = rating
+        ratings = dict(self.game_ratings)
+        ratings[game_slug] = rating
+        self.game_ratings = ratings
         self.app.repo.set_rating(game_slug, rating)
         if self.device_id:
-            threading.Thread(
-                target=lambda: self.app.cdn_api.rate_game(self.device_id, game_slug, rating),
-                daemon=True
-            ).start()
+            _queue_rating(self.app.cdn_api, self.device_id, game_slug, rating)
+            # The cached server ratings no longer include this one
+            self.app.device_sync.invalidate()
 
     def _adjust_scroll(self):
         """Adjust scroll offset to keep selected item visible."""
-        max_visible = self.VISIBLE_AREA_HEIGHT // self.ITEM_HEIGHT
-        
         # Scroll down if selected is below visible area
-        if self.selected_index >= self.scroll_offset + max_visible:
-            self.scroll_offset = self.selected_index - max_visible + 1
+        if self.selected_index >= self.scroll_offset + self.MAX_VISIBLE:
+            self.scroll_offset = self.selected_index - self.MAX_VISIBLE + 1
         # Scroll up if selected is above visible area
         elif self.selected_index < self.scroll_offset:
             self.scroll_offset = self.selected_index
 
-    def update(self, actions: List[str]):
+    def update(self, actions: Set[str]):
         if not self.games:
             if "B" in actions:
                 self.app.change_screen("MainMenu")
@@ -944,25 +1186,34 @@ class InstalledList(Screen):
                 # Start with current rating or 3 if unrated
                 self.pending_rating = self.game_ratings.get(game.id, 3)
 
+    def view_state(self):
+        visible = self.games[self.scroll_offset:self.scroll_offset + self.MAX_VISIBLE]
+        ratings = self.game_ratings
+        return (
+            len(self.games), self.selected_index, self.scroll_offset,
+            self.rating_mode, self.pending_rating,
+            tuple(ratings.get(g.id, 0) for g in visible),
+        )
+
     def draw(self, surface):
         surface.fill(BG_COLOR)
-        draw_text(surface, self.app.font, "INSTALLED GAMES", 120, 20, center=True)
+        self.draw_static_text(surface, "INSTALLED GAMES", 120, 20)
         
         if not self.games:
-            draw_text(surface, self.app.font, "No games installed", 120, 120, center=True)
-            draw_text(surface, self.app.font, "B: Back", 120, 230, (200, 200, 200), center=True)
+            self.draw_static_text(surface, "No games installed", 120, 120)
+            self.draw_static_text(surface, "B: Back", 120, 230, (200, 200, 200))
             return
 
         # Calculate visible range
-        max_visible = self.VISIBLE_AREA_HEIGHT // self.ITEM_HEIGHT
         start_idx = self.scroll_offset
-        end_idx = min(start_idx + max_visible, len(self.games))
+        end_idx = min(start_idx + self.MAX_VISIBLE, len(self.games))
+        ratings = self.game_ratings
         
         # Draw visible games
         for i in range(start_idx, end_idx):
             game = self.games[i]
             y = self.LIST_START_Y + (i - start_idx) * self.ITEM_HEIGHT
-            rating = self.game_ratings.get(game.id, 0)
+            rating = ratings.get(game.id, 0)
             is_selected = i == self.selected_index
             
             # In rating mode for this game, show pending rating
@@ -979,14 +1230,15 @@ class InstalledList(Screen):
                 draw_list_item(surface, self.app.font, game.title, y, 200, is_selected)
         
         # Draw footer background to prevent text overlap
-        pygame.draw.rect(surface, BG_COLOR, (0, self.FOOTER_BG_Y, 240, 35))
+        pygame.draw.rect(surface, BG_COLOR, self.FOOTER_RECT)
         
         # Footer hints
         if self.rating_mode:
-            draw_text(surface, self.app.font, "LEFT/RIGHT: Adjust Stars", 120, 213, (200, 200, 200), center=True)
-            draw_text(surface, self.app.font, "A: Confirm  B: Cancel", 120, 230, (200, 200, 200), center=True)
+            self.draw_static_text(surface, "LEFT/RIGHT: Adjust Stars", 120, 213, (200, 200, 200))
+            self.draw_static_text(surface, "A: Confirm  B: Cancel", 120, 230, (200, 200, 200))
         else:
-            draw_text(surface, self.app.font, "A: Select  Y: Rate  B: Back", 120, 230, (200, 200, 200), center=True)
+            self.draw_static_text(surface, "A: Select  Y: Rate  B: Back", 120, 230, (200, 200, 200))
+        return [self.BODY_RECT]
 
 
 class ParentalControlsScreen(Screen):
@@ -997,14 +1249,30 @@ class ParentalControlsScreen(Screen):
     STATE_ENTER_PIN = "enter_pin"
     STATE_CONFIRM_PIN = "confirm_pin"
     
+    # Menu (label, action) items for each parental-controls status
+    MENUS = {
+        "disabled": (("Enable Child Safe Mode", "enable"), ("Back", "back")),
+        "locked": (("Unlock (Enter PIN)", "unlock"), ("Back", "back")),
+        "unlocked": (("Lock Now", "lock"), ("Remove PIN", "remove"), ("Back", "back")),
+    }
+    
+    # PIN editing shared by entry and confirmation: action -> (digit step, cursor move).
+    # Checked in order and only the first pressed action applies.
+    PIN_EDIT_ACTIONS = {
+        "UP": (1, 0),
+        "DOWN": (-1, 0),
+        "RIGHT": (0, 1),
+        "LEFT": (0, -1),
+    }
+    
     def __init__(self, app):
         super().__init__(app)
         self.state = self.STATE_MENU
-        self.menu_items = []
+        self.menu_items = ()
         self.selected_index = 0
-        self.pin_digits = ["0", "0", "0", "0"]
+        self.pin_value = 0  # 4-digit PIN as an int; cursor 0 is the thousands digit
         self.pin_cursor = 0
-        self.confirm_digits = ["0", "0", "0", "0"]
+        self.confirm_value = 0
         self.pin_action = None  # "enable", "unlock", "remove"
         self.message = ""
         self.message_timer = 0
@@ -1017,28 +1285,39 @@ class ParentalControlsScreen(Screen):
 
     def _update_menu_items(self):
         pc = self.app.parental_controls
-        self.menu_items = []
-        
         if not pc.is_enabled():
-            self.menu_items.append(("Enable Child Safe Mode", "enable"))
+            self.menu_items = self.MENUS["disabled"]
+        elif pc.is_locked():
+            self.menu_items = self.MENUS["locked"]
         else:
-            if pc.is_locked():
-                self.menu_items.append(("Unlock (Enter PIN)", "unlock"))
-            else:
-                self.menu_items.append(("Lock Now", "lock"))
-                self.menu_items.append(("Remove PIN", "remove"))
-        
-        self.menu_items.append(("Back", "back"))
+            self.menu_items = self.MENUS["unlocked"]
 
     def _reset_pin_entry(self):
-        self.pin_digits = ["0", "0", "0", "0"]
+        self.pin_value = 0
         self.pin_cursor = 0
-        self.confirm_digits = ["0", "0", "0", "0"]
+        self.confirm_value = 0
 
     def _get_pin_string(self):
-        return "".join(self.pin_digits)
+        return f"{self.pin_value:04d}"
+
+    def _edit_pin(self, value: int, actions: Set[str]) -> Optional[int]:
+        """
+        Apply the first pressed digit/cursor action to a PIN value.
+        Returns the new value, or None if no edit action was pressed.
+        """
+        for action, (step, move) in self.PIN_EDIT_ACTIONS.items():
+            if action in actions:
+                if step:
+                    # Step the digit under the cursor, wrapping 9 <-> 0
+                    place = 10 ** (3 - self.pin_cursor)
+                    digit = (value // place) % 10
+                    value += ((digit + step) % 10 - digit) * place
+                else:
+                    self.pin_cursor = min(3, max(0, self.pin_cursor + move))
+                return value
+        return None
 
-    def update(self, actions: List[str]):
+    def update(self, actions: Set[str]):
         # Handle temporary messages
         if self.message_timer > 0:
             self.message_timer -= 1
@@ -1082,23 +1361,16 @@ class ParentalControlsScreen(Screen):
             self.app.change_screen("MainMenu")
 
     def _update_pin_entry(self, actions):
-        if "UP" in actions:
-            # Increment current digit
-            current = int(self.pin_digits[self.pin_cursor])
-            self.pin_digits[self.pin_cursor] = str((current + 1) % 10)
-        elif "DOWN" in actions:
-            # Decrement current digit
-            current = int(self.pin_digits[self.pin_cursor])
-            self.pin_digits[self.pin_cursor] = str((current - 1) % 10)
-        elif "RIGHT" in actions:
-            self.pin_cursor = min(3, self.pin_cursor + 1)
-        elif "LEFT" in actions:
-            self.pin_cursor = max(0, self.pin_cursor - 1)
-        elif "A" in actions:
+        edited = self._edit_pin(self.pin_value, actions)
+        if edited is not None:
+            self.pin_value = edited
+            return
+        
+        if "A" in actions:
             # Confirm PIN entry
             if self.pin_action == "enable":
                 # Need to confirm PIN
-                self.confirm_digits = ["0", "0", "0", "0"]
+                self.confirm_value = 0
                 self.pin_cursor = 0
                 self.state = self.STATE_CONFIRM_PIN
             elif self.pin_action == "unlock":
@@ -1126,19 +1398,14 @@ class ParentalControlsScreen(Screen):
             self._reset_pin_entry()
 
     def _update_pin_confirm(self, actions):
-        if "UP" in actions:
-            current = int(self.confirm_digits[self.pin_cursor])
-            self.confirm_digits[self.pin_cursor] = str((current + 1) % 10)
-        elif "DOWN" in actions:
-            current = int(self.confirm_digits[self.pin_cursor])
-            self.confirm_digits[self.pin_cursor] = str((current - 1) % 10)
-        elif "RIGHT" in actions:
-            self.pin_cursor = min(3, self.pin_cursor + 1)
-        elif "LEFT" in actions:
-            self.pin_cursor = max(0, self.pin_cursor - 1)
-        elif "A" in actions:
+        edited = self._edit_pin(self.confirm_value, actions)
+        if edited is not None:
+            self.confirm_value = edited
+            return
+        
+        if "A" in actions:
             # Check if PINs match
-            if self.pin_digits == self.confirm_digits:
+            if self.pin_value == self.confirm_value:
                 if self.app.parental_controls.set_pin(self._get_pin_string()):
                     self.message = "PIN Set!"
                     self.message_timer = 60
@@ -1156,9 +1423,17 @@ class ParentalControlsScreen(Screen):
             self.state = self.STATE_ENTER_PIN
             self.pin_cursor = 0
 
+    def view_state(self):
+        # Lock status only changes through this screen's actions, which also
+        # change the menu or message, so it need not be polled here
+        return (
+            self.state, self.menu_items, self.selected_index, self.message,
+            self.pin_value, self.confirm_value, self.pin_cursor,
+        )
+
     def draw(self, surface):
         surface.fill(BG_COLOR)
-        draw_text(surface, self.app.font, "PARENTAL CONTROLS", 120, 20, center=True)
+        self.draw_static_text(surface, "PARENTAL CONTROLS", 120, 20)
         pygame.draw.line(surface, ACCENT_COLOR, (0, 40), (240, 40), 2)
         
         # Show current status
@@ -1191,12 +1466,12 @@ class ParentalControlsScreen(Screen):
             draw_list_item(surface, self.app.font, label, y, 200, i == self.selected_index)
             y += 28
         
-        draw_text(surface, self.app.font, "A: Select         B: Back", 120, 230, (200, 200, 200), center=True)
+        self.draw_static_text(surface, "A: Select         B: Back", 120, 230, (200, 200, 200))
 
     def _draw_pin_entry(self, surface, title, confirm=False):
         draw_text(surface, self.app.font, title, 120, 80, center=True)
         
-        digits = self.confirm_digits if confirm else self.pin_digits
+        digits = f"{self.confirm_value if confirm else self.pin_value:04d}"
         
         # Draw PIN digits with cursor highlight
         digit_width = 30
@@ -1212,10 +1487,10 @@ class ParentalControlsScreen(Screen):
             if i == self.pin_cursor:
                 pygame.draw.line(surface, ACCENT_COLOR, (x + 5, y + 18), (x + digit_width - 5, y + 18), 2)
         
-        draw_text(surface, self.app.font, "UP/DOWN: Change", 120, 145, center=True)
-        draw_text(surface, self.app.font, "LEFT/RIGHT: Move", 120, 165, center=True)
+        self.draw_static_text(surface, "UP/DOWN: Change", 120, 145)
+        self.draw_static_text(surface, "LEFT/RIGHT: Move", 120, 165)
         
-        draw_text(surface, self.app.font, "A: Confirm         B: Cancel", 120, 230, (200, 200, 200), center=True)
+        self.draw_static_text(surface, "A: Confirm         B: Cancel", 120, 230, (200, 200, 200))
 
 
 class DeveloperCodeScreen(Screen):
@@ -1231,15 +1506,21 @@ class DeveloperCodeScreen(Screen):
         self.loading = True
         self.code = None
         self.error = None
-        threading.Thread(target=self._fetch_code, daemon=True).start()
+        self.app.bg_pool.submit(self._fetch_code)
 
     def _fetch_code(self):
         try:
-            # Read Pi serial number as device ID (strip null bytes and whitespace)
-            with open('/sys/firmware/devicetree/base/serial-number', 'r') as f:
-                device_id = f.read().replace('\x00', '').strip().lower()
+            device_id = get_device_id()
+            if device_id is None:
+                self.error = "Device ID not found"
+                return
+            
+            state = self.app.device_sync.get(device_id)
+            if state is not None and state.get("code"):
+                self.code = state["code"]
+                return
             
-            response = requests.post(
+            response = self.app.api_client.session.post(
                 'https://dbworker.suntank.workers.dev/api/device/request-code',
                 json={'device_id': device_id},
                 timeout=10
@@ -1249,8 +1530,6 @@ class DeveloperCodeScreen(Screen):
                 self.code = response.json().get('code')
             else:
                 self.error = response.json().get('error', 'Request failed')
-        except FileNotFoundError:
-            self.error = "Device ID not found"
         except requests.RequestException as e:
             self.error = "Network error"
         except Exception as e:
@@ -1258,46 +1537,54 @@ class DeveloperCodeScreen(Screen):
         finally:
             self.loading = False
 
-    def update(self, actions: List[str]):
+    def update(self, actions: Set[str]):
         if "B" in actions:
             self.app.change_screen("MainMenu")
 
+    def view_state(self):
+        return (self.loading, self.code, self.error)
+
     def draw(self, surface):
         surface.fill(BG_COLOR)
-        draw_text(surface, self.app.font, "DEVELOPER CODE", 120, 20, center=True)
+        self.draw_static_text(surface, "DEVELOPER CODE", 120, 20)
         pygame.draw.line(surface, ACCENT_COLOR, (0, 40), (240, 40), 2)
         
         if self.loading:
-            draw_text(surface, self.app.font, "Fetching code...", 120, 120, center=True)
+            self.draw_static_text(surface, "Fetching code...", 120, 120)
         elif self.error:
-            draw_text(surface, self.app.font, "Error:", 120, 80, center=True)
+            self.draw_static_text(surface, "Error:", 120, 80)
             draw_text(surface, self.app.font, self.error, 120, 110, center=True)
         elif self.code:
-            draw_text(surface, self.app.font, "Your code:", 120, 70, center=True)
+            self.draw_static_text(surface, "Your code:", 120, 70)
             draw_text(surface, self.app.font, self.code, 120, 110, ACCENT_COLOR, center=True)
-            draw_text(surface, self.app.font, "Enter this code on", 120, 150, center=True)
-            draw_text(surface, self.app.font, "the website to link", 120, 170, center=True)
-            draw_text(surface, self.app.font, "your account.", 120, 190, center=True)
+            self.draw_static_text(surface, "Enter this code on", 120, 150)
+            self.draw_static_text(surface, "the website to link", 120, 170)
+            self.draw_static_text(surface, "your account.", 120, 190)
         
-        draw_text(surface, self.app.font, "B: Back", 120, 230, (200, 200, 200), center=True)
+        self.draw_static_text(surface, "B: Back", 120, 230, (200, 200, 200))
 
 
 class RebootScreen(Screen):
     """Shows a reboot message and reboots the system after 2 seconds."""
-    def __init__(self, app):
-        super().__init__(app)
-        self.start_time = None
+    REBOOT_DELAY_MS = 2000
     
     def on_enter(self):
-        self.start_time = time.time()
+        # One-shot timer; InputManager turns it into a "REBOOT" action
+        pygame.time.set_timer(REBOOT_EVENT, self.REBOOT_DELAY_MS, 1)
         logging.info("Reboot screen entered, will reboot in 2 seconds...")
     
-    def update(self, actions: List[str]):
-        if self.start_time and (time.time() - self.start_time) >= 2.0:
-            logging.info("Initiating system reboot...")
-            pygame.quit()
-            subprocess.run(['sudo', 'reboot'], check=False)
-            self.app.running = False  # Fallback if reboot doesn't happen immediately
+    def update(self, actions: Set[str]):
+        if "REBOOT" in actions:
+            self._do_reboot()
+
+    def _do_reboot(self):
+        logging.info("Initiating system reboot...")
+        pygame.quit()
+        subprocess.run(['sudo', 'reboot'], check=False)
+        self.app.running = False  # Fallback if reboot doesn't happen immediately
+
+    def view_state(self):
+        return ()
     
     def draw(self, surface):
         surface.fill(BG_COLOR)
@@ -1326,10 +1613,12 @@ class FilterScreen(Screen):
         self.all_tags: List[dict] = []    # Flat list for navigation
         self.all_items: List[dict] = []   # Combined rating options + tags
         self.selected_index = 0
-        self.selected_tags: set = set()   # Set of selected tag IDs
+        self.selected_mask = 0            # Selected tags, one bit per tag item (item["bit"])
+        self._preselected_tags: set = set()  # Tag IDs to select once tags are loaded
         self.selected_rating: Optional[int] = None  # 3, 4, 5, or None
         self.loading = False
         self.error = None
+        self._count_cache = (-1, "")  # (count, "N filters selected")
 
     def on_enter(self):
         self.loading = True
@@ -1337,12 +1626,13 @@ class FilterScreen(Screen):
         # Pre-select any existing filters from CatalogList
         catalog_screen = self.app.screens.get("CatalogList")
         if catalog_screen:
-            self.selected_tags = set(catalog_screen.filter_tags) if catalog_screen.filter_tags else set()
+            self._preselected_tags = set(catalog_screen.filter_tags) if catalog_screen.filter_tags else set()
             self.selected_rating = int(catalog_screen.min_rating) if catalog_screen.min_rating else None
         else:
-            self.selected_tags = set()
+            self._preselected_tags = set()
             self.selected_rating = None
-        threading.Thread(target=self._fetch_tags, daemon=True).start()
+        self.selected_mask = 0
+        self.app.bg_pool.submit(self._fetch_tags)
 
     def _fetch_tags(self):
         try:
@@ -1383,6 +1673,20 @@ class FilterScreen(Screen):
                     "category": tag["category"]
                 })
             
+            # Display strings are fixed per item, so build them once here
+            for item in self.all_items:
+                item["label_off"] = f"[ ] {item['name']}"
+                item["label_on"] = f"[X] {item['name']}"
+                item["category_label"] = item["category"].upper()
+            
+            # Give each tag its own bit so selection is a single int
+            mask = 0
+            for idx, item in enumerate(i for i in self.all_items if i["type"] == "tag"):
+                item["bit"] = 1 << idx
+                if item["id"] in self._preselected_tags:
+                    mask |= item["bit"]
+            self.selected_mask = mask
+            
             self.selected_index = 0
         except Exception as e:
             logging.error(f"Failed to fetch tags: {e}")
@@ -1390,7 +1694,7 @@ class FilterScreen(Screen):
         finally:
             self.loading = False
 
-    def update(self, actions: List[str]):
+    def update(self, actions: Set[str]):
         if self.loading:
             if "B" in actions:
                 self.app.go_back()
@@ -1417,11 +1721,7 @@ class FilterScreen(Screen):
                     self.selected_rating = item["value"]
             else:
                 # Toggle tag selection
-                tag_id = item["id"]
-                if tag_id in self.selected_tags:
-                    self.selected_tags.discard(tag_id)
-                else:
-                    self.selected_tags.add(tag_id)
+                self.selected_mask ^= item["bit"]
         elif "START" in actions:
             # Apply filters and go back to catalog
             self._apply_filters()
@@ -1430,7 +1730,7 @@ class FilterScreen(Screen):
             self.app.go_back()
         elif "X" in actions:
             # Clear all filters
-            self.selected_tags.clear()
+            self.selected_mask = 0
             self.selected_rating = None
 
     def _apply_filters(self):
@@ -1438,33 +1738,43 @@ class FilterScreen(Screen):
         catalog_screen = self.app.screens.get("CatalogList")
         if catalog_screen:
             catalog_screen.set_filters(
-                tags=list(self.selected_tags),
+                tags=sorted(
+                    item["id"] for item in self.all_items
+                    if item["type"] == "tag" and item["bit"] & self.selected_mask
+                ),
                 min_rating=float(self.selected_rating) if self.selected_rating else None
             )
         self.app.change_screen("CatalogList")
 
+    def view_state(self):
+        return (
+            self.loading, self.error, len(self.all_items), self.selected_index,
+            self.selected_mask, self.selected_rating,
+        )
+
     def draw(self, surface):
         surface.fill(BG_COLOR)
-        draw_text(surface, self.app.font, "SELECT FILTERS", 120, 12, center=True)
+        self.draw_static_text(surface, "SELECT FILTERS", 120, 12)
         pygame.draw.line(surface, ACCENT_COLOR, (0, 28), (240, 28), 2)
         
         if self.loading:
-            draw_text(surface, self.app.font, "Loading tags...", 120, 120, center=True)
+            self.draw_static_text(surface, "Loading tags...", 120, 120)
             return
             
         if self.error:
-            draw_text(surface, self.app.font, "Error loading tags", 120, 100, center=True)
-            draw_text(surface, self.app.font, "Press B to go back", 120, 130, center=True)
+            self.draw_static_text(surface, "Error loading tags", 120, 100)
+            self.draw_static_text(surface, "Press B to go back", 120, 130)
             return
 
         if not self.all_items:
-            draw_text(surface, self.app.font, "No filters available", 120, 120, center=True)
+            self.draw_static_text(surface, "No filters available", 120, 120)
             return
 
         # Show selected count
-        count = len(self.selected_tags) + (1 if self.selected_rating else 0)
-        count_text = f"{count} filter{'s' if count != 1 else ''} selected"
-        draw_text(surface, self.app.font, count_text, 102, 34, (150, 150, 150))
+        count = bin(self.selected_mask).count("1") + (1 if self.selected_rating else 0)
+        if count != self._count_cache[0]:
+            self._count_cache = (count, f"{count} filter{'s' if count != 1 else ''} selected")
+        draw_text(surface, self.app.font, self._count_cache[1], 102, 34, (150, 150, 150))
 
         # Draw scrolling filter list (rating options + tags)
         max_visible = 8
@@ -1481,7 +1791,7 @@ class FilterScreen(Screen):
         
         # Show category of selected item at top-left
         if self.all_items:
-            selected_cat = self.all_items[self.selected_index]["category"].upper()
+            selected_cat = self.all_items[self.selected_index]["category_label"]
             draw_text(surface, self.app.font, selected_cat, 15, 34, (200, 200, 200))
         
         y = 55
@@ -1493,10 +1803,10 @@ class FilterScreen(Screen):
             if item["type"] == "rating":
                 is_checked = self.selected_rating == item["value"]
             else:
-                is_checked = item["id"] in self.selected_tags
+                is_checked = bool(item["bit"] & self.selected_mask)
             
             # Draw checkbox and item name
-            checkbox = "[X]" if is_checked else "[ ]"
+            label = item["label_on"] if is_checked else item["label_off"]
             color = ACCENT_COLOR if is_selected else ((200, 200, 200) if is_checked else (150, 150, 150))
             
             # Highlight background for selected item
@@ -1504,9 +1814,9 @@ class FilterScreen(Screen):
                 rect = pygame.Rect(5, y - 2, 230, 18)
                 pygame.draw.rect(surface, (40, 40, 60), rect, border_radius=3)
             
-            draw_text(surface, self.app.font, f"{checkbox} {item['name']}", 15, y, color)
+            draw_text(surface, self.app.font, label, 15, y, color)
             y += 18
 
         # Bottom hints
-        draw_text(surface, self.app.font, "A: Toggle   X: Clear", 120, 213, (255, 255, 255), center=True)
-        draw_text(surface, self.app.font, "B: Cancel   Start: Apply", 120, 230, (255, 255, 255), center=True)
\ No newline at end of file
+        self.draw_static_text(surface, "A: Toggle   X: Clear", 120, 213, (255, 255, 255))
+        self.draw_static_text(surface, "B: Cancel   Start: Apply", 120, 230, (255, 255, 255))
\ No newline at end of file
@@ -1,3 +1,4 @@
+import math
 import pygame
 from typing import List, Optional, Tuple
 from pathlib import Path
@@ -12,31 +13,161 @@ MATURE_RED = (180, 40, 40)
 STAR_YELLOW = (255, 215, 0)
 TAG_BG = (60, 60, 80)
 TAG_BORDER = (100, 100, 120)
+IMAGE_FRAME_COLOR = (30, 30, 50)
 
-# Star image cache (loaded lazily)
+# Unit offsets of a 5-point star's outer tips and inner corners, top tip first
+_STAR_OUTER = tuple((math.cos(math.radians(-90 + i * 72)), math.sin(math.radians(-90 + i * 72))) for i in range(5))
+_STAR_INNER = tuple((math.cos(math.radians(-90 + i * 72 + 36)), math.sin(math.radians(-90 + i * 72 + 36))) for i in range(5))
+
+# Parametric heart curve sampled at 30 points, in a 32-unit-wide box
+_HEART_CURVE = tuple(
+    (16 * (math.sin(t) ** 3),
+     -(13 * math.cos(t) - 5 * math.cos(2*t) - 2 * math.cos(3*t) - math.cos(4*t)))
+    for t in (i * 2 * math.pi / 30 for i in range(30))
+)
+
+def _star_points(cx: float, cy: float, outer: float, inner: float) -> List[Tuple[float, float]]:
+    """Polygon points for a star centered at (cx, cy) with the given radii."""
+    points = []
+    for (ox, oy), (ix, iy) in zip(_STAR_OUTER, _STAR_INNER):
+        points.append((cx + outer * ox, cy + outer * oy))
+        points.append((cx + inner * ix, cy + inner * iy))
+    return points
+
+# Star image from the same directory as this file
+_STAR_PATH = Path(__file__).parent / "star.png.png"
+# Full-size star, read from disk once; False if it could not be loaded
+_star_original = None
+
+# Star image cache (loaded lazily, or up front by warm_caches)
 _star_image_cache: dict = {}  # size -> pygame.Surface
+# Star sizes the screens draw at
+STAR_SIZES = (12, 14, 16, 18)
+# Sizes of the rating strips shown in the installed list
+RATING_STRIP_SIZES = (12, 14)
+
+def _get_star_original() -> Optional[pygame.Surface]:
+    """Load the full-size star image on first use."""
+    global _star_original
+    if _star_original is None:
+        try:
+            _star_original = pygame.image.load(str(_STAR_PATH)).convert_alpha()
+        except Exception:
+            # Missing or unreadable; fall back to polygons from now on
+            _star_original = False
+    return _star_original or None
 
 def _get_star_image(size: int) -> Optional[pygame.Surface]:
     """Get a cached star image scaled to the given size."""
     if size in _star_image_cache:
         return _star_image_cache[size]
     
-    # Load star image from same directory as this file
-    star_path = Path(__file__).parent / "star.png.png"
-    if not star_path.exists():
+    original = _get_star_original()
+    if original is None:
         return None
     
-    try:
-        original = pygame.image.load(str(star_path)).convert_alpha()
-        scaled = pygame.transform.smoothscale(original, (size, size))
-        _star_image_cache[size] = scaled
-        return scaled
-    except Exception:
-        return None
+    # smoothscale may hand back a different pixel layout, so convert
+    # again to keep later blits on the display-format fast path
+    scaled = pygame.transform.smoothscale(original, (size, size)).convert_alpha()
+    _star_image_cache[size] = scaled
+    return scaled
+
+
+_dark_star_cache: dict = {}  # size -> pygame.Surface
+
+def _get_dark_star_image(size: int) -> Optional[pygame.Surface]:
+    """Get a cached darkened star image used for empty rating stars."""
+    dark_star = _dark_star_cache.get(size)
+    if dark_star is None:
+        star_img = _get_star_image(size)
+        if star_img is None:
+            return None
+        dark_star = star_img.copy()
+        dark_star.fill((60, 60, 60, 255), special_flags=pygame.BLEND_RGBA_MULT)
+        _dark_star_cache[size] = dark_star
+    return dark_star
+
+
+# Solid placeholder frames drawn behind icons/screenshots
+_image_frame_cache: dict = {}  # size -> pygame.Surface
+
+def draw_image_frame(surface, x: int, y: int, size: int) -> None:
+    """
+    Draw the dark square shown behind an icon or screenshot.
+    The frame is filled once per size and blitted on later calls.
+    """
+    frame = _image_frame_cache.get(size)
+    if frame is None:
+        # No depth given, so the surface matches the display format
+        frame = pygame.Surface((size, size))
+        frame.fill(IMAGE_FRAME_COLOR)
+        _image_frame_cache[size] = frame
+    surface.blit(frame, (x, y))
+
+
+# Pre-composited widget layers, keyed by everything that affects their pixels
+_star_rating_cache: dict = {}  # (font, rating text) -> pygame.Surface
+_mature_banner_cache: dict = {}  # (font, width) -> pygame.Surface
+_rating_stars_cache: dict = {}  # (rating, max_stars, size, colors) -> pygame.Surface
+_tag_pill_cache: dict = {}  # (font, tag) -> pygame.Surface
+_nav_arrow_cache: dict = {}  # (direction, size) -> pygame.Surface
+_heart_cache: dict = {}  # (size, color, filled) -> pygame.Surface
+_list_highlight_cache: dict = {}  # width -> pygame.Surface
+_browse_highlight_cache: dict = {}  # width -> pygame.Surface
+
+# Rendered text, keyed by (font, text, color); cleared when full
+_text_cache: dict = {}
+_TEXT_CACHE_SIZE = 512
+
+
+def warm_caches() -> None:
+    """
+    Load the star images for every size in use and compose the rating
+    strips, so the first frames of the rating screens don't stall on image
+    loading. Call during startup, once a display mode is set.
+    """
+    if not pygame.display.get_init() or pygame.display.get_surface() is None:
+        return
+    for size in STAR_SIZES:
+        _get_star_image(size)
+        _get_dark_star_image(size)
+    for size in RATING_STRIP_SIZES:
+        for rating in range(6):
+            _get_rating_strip(rating, 5, size, STAR_YELLOW, (80, 80, 80))
+
+
+def clear_caches() -> None:
+    """Drop every cached widget surface, e.g. before pygame.quit()."""
+    global _star_original
+    _star_original = None
+    _star_image_cache.clear()
+    _dark_star_cache.clear()
+    _image_frame_cache.clear()
+    _star_rating_cache.clear()
+    _mature_banner_cache.clear()
+    _rating_stars_cache.clear()
+    _tag_pill_cache.clear()
+    _nav_arrow_cache.clear()
+    _heart_cache.clear()
+    _list_highlight_cache.clear()
+    _browse_highlight_cache.clear()
+    _text_cache.clear()
+
+
+def _render_text(font, text, color) -> pygame.Surface:
+    """Render antialiased text, reusing the surface from an earlier call."""
+    key = (font, text, tuple(color))
+    surf = _text_cache.get(key)
+    if surf is None:
+        if len(_text_cache) >= _TEXT_CACHE_SIZE:
+            _text_cache.clear()
+        surf = font.render(text, True, color)
+        _text_cache[key] = surf
+    return surf
 
 
 def draw_text(surface, font, text, x, y, color=TEXT_COLOR, center=False, right=False):
-    surf = font.render(text, True, color)
+    surf = _render_text(font, text, color)
     if center:
         rect = surf.get_rect(center=(x, y))
         surface.blit(surf, rect)
@@ -48,14 +179,32 @@ def draw_text(surface, font, text, x, y, color=TEXT_COLOR, center=False, right=F
     return surf.get_width()
 
 
+def draw_list_highlight(surface, y, width, x_offset=0):
+    """Draw the rounded selection box used behind a selected list item."""
+    x = (surface.get_width() - width) // 2 + x_offset
+    box = _get_list_highlight(width)
+    surface.blit(box, (x, y - box.get_height() // 2))
+
+
+def _get_list_highlight(width: int) -> pygame.Surface:
+    """Get the cached selection box for the given width."""
+    box = _list_highlight_cache.get(width)
+    if box is None:
+        rect_height = 24
+        box = pygame.Surface((width, rect_height), pygame.SRCALPHA)
+        rect = box.get_rect()
+        pygame.draw.rect(box, ACCENT_COLOR, rect, border_radius=5)
+        pygame.draw.rect(box, (255, 255, 255), rect, width=2, border_radius=5)
+        _list_highlight_cache[width] = box
+    return box
+
+
 def draw_list_item(surface, font, text, y, width, selected=False, x_offset=0):
-    rect_height = 24
     x = (surface.get_width() - width) // 2 + x_offset
     
     if selected:
-        rect = pygame.Rect(x, y - rect_height//2, width, rect_height)
-        pygame.draw.rect(surface, ACCENT_COLOR, rect, border_radius=5)
-        pygame.draw.rect(surface, (255, 255, 255), rect, width=2, border_radius=5)
+        box = _get_list_highlight(width)
+        surface.blit(box, (x, y - box.get_height() // 2))
         color = SELECTED_TEXT_COLOR
     else:
         color = TEXT_COLOR
@@ -71,19 +220,26 @@ def draw_browse_list_item(surface, font, text: str, y: int, selected: bool = Fal
     rect_height = 18
     padding = 8
     
+    surface_width = surface.get_width()
+    
     # Measure text
-    text_surf = font.render(text, True, (0, 0, 0) if selected else TEXT_COLOR)
-    text_width = min(text_surf.get_width(), surface.get_width() - 20)
+    text_surf = _render_text(font, text, (0, 0, 0) if selected else TEXT_COLOR)
+    text_width = min(text_surf.get_width(), surface_width - 20)
     
     # Center horizontally
-    x = (surface.get_width() - text_width - padding * 2) // 2
+    x = (surface_width - text_width - padding * 2) // 2
     
     if selected:
-        # White rounded rectangle background
-        rect = pygame.Rect(x, y, text_width + padding * 2, rect_height)
-        pygame.draw.rect(surface, (255, 255, 255), rect, border_radius=4)
-        # Black text
-        text_surf = font.render(text, True, (0, 0, 0))
+        # White rounded rectangle background, baked once per width
+        width = text_width + padding * 2
+        box = _browse_highlight_cache.get(width)
+        if box is None:
+            if len(_browse_highlight_cache) >= _TEXT_CACHE_SIZE:
+                _browse_highlight_cache.clear()
+            box = pygame.Surface((width, rect_height), pygame.SRCALPHA)
+            pygame.draw.rect(box, (255, 255, 255), box.get_rect(), border_radius=4)
+            _browse_highlight_cache[width] = box
+        surface.blit(box, (x, y))
     
     # Blit text centered in the rect
     text_x = x + padding
@@ -95,22 +251,38 @@ def draw_tag_pill(surface, font, tag: str, x: int, y: int) -> int:
     """
     Draw a tag pill and return its width.
     """
+    pill = _get_tag_pill(font, tag)
+    surface.blit(pill, (x, y))
+    return pill.get_width()
+
+
+def _get_tag_pill(font, tag: str) -> pygame.Surface:
+    """Get a cached pill surface with background, border and text baked in."""
+    key = (font, tag)
+    pill = _tag_pill_cache.get(key)
+    if pill is not None:
+        return pill
+    
     padding_x = 6
     padding_y = 2
     
-    text_surf = font.render(tag, True, TEXT_COLOR)
+    text_surf = _render_text(font, tag, TEXT_COLOR)
     width = text_surf.get_width() + padding_x * 2
     height = text_surf.get_height() + padding_y * 2
     
     # Draw pill background
-    rect = pygame.Rect(x, y, width, height)
-    pygame.draw.rect(surface, TAG_BG, rect, border_radius=3)
-    pygame.draw.rect(surface, TAG_BORDER, rect, width=1, border_radius=3)
+    pill = pygame.Surface((width, height), pygame.SRCALPHA)
+    rect = pill.get_rect()
+    pygame.draw.rect(pill, TAG_BG, rect, border_radius=3)
+    pygame.draw.rect(pill, TAG_BORDER, rect, width=1, border_radius=3)
     
     # Draw text
-    surface.blit(text_surf, (x + padding_x, y + padding_y))
+    pill.blit(text_surf, (padding_x, padding_y))
     
-    return width
+    if len(_tag_pill_cache) >= _TEXT_CACHE_SIZE:
+        _tag_pill_cache.clear()
+    _tag_pill_cache[key] = pill
+    return pill
 
 
 def draw_tags_row(surface, font, tags: List[str], x: int, y: int, max_width: int) -> None:
@@ -120,16 +292,19 @@ def draw_tags_row(surface, font, tags: List[str], x: int, y: int, max_width: int
     current_x = x
     gap = 4
     
+    # Lay out the pre-composed pills first, then blit them in one call
+    pills = []
     for tag in tags:
-        # Measure tag width
-        text_surf = font.render(tag, True, TEXT_COLOR)
-        pill_width = text_surf.get_width() + 12  # padding
+        # Measure with font metrics so a tag that doesn't fit is never rendered
+        pill_width = font.size(tag)[0] + 12  # padding
         
         if current_x + pill_width > x + max_width:
             break  # No more room
         
-        draw_tag_pill(surface, font, tag, current_x, y)
+        pills.append((_get_tag_pill(font, tag), (current_x, y)))
         current_x += pill_width + gap
+    
+    surface.blits(pills, doreturn=False)
 
 
 def draw_star_rating(surface, font, rating: Optional[float], x: int, y: int) -> None:
@@ -143,24 +318,24 @@ def draw_star_rating(surface, font, rating: Optional[float], x: int, y: int) ->
     star_img = _get_star_image(star_size)
     
     if star_img:
-        # Draw star image centered at position
-        surface.blit(star_img, (x - star_size // 2, y))
-        # Draw rating number next to star
+        # Star and number are composited once per displayed value
         rating_text = f"{rating:.1f}"
-        draw_text(surface, font, rating_text, x + star_size // 2 + 2, y + 2, STAR_YELLOW)
+        key = (font, rating_text)
+        layer = _star_rating_cache.get(key)
+        if layer is None:
+            text_surf = font.render(rating_text, True, STAR_YELLOW)
+            layer = pygame.Surface(
+                (star_size + 2 + text_surf.get_width(), max(star_size, text_surf.get_height() + 2)),
+                pygame.SRCALPHA
+            )
+            # Star image centered at x, rating number next to it
+            layer.blit(star_img, (0, 0))
+            layer.blit(text_surf, (star_size + 2, 2))
+            _star_rating_cache[key] = layer
+        surface.blit(layer, (x - star_size // 2, y))
     else:
         # Fallback to polygon if image not available
-        import math
-        star_x = x
-        star_y = y + 6
-        points = []
-        for i in range(5):
-            angle = math.radians(-90 + i * 72)
-            points.append((star_x + star_size * 0.5 * math.cos(angle), 
-                           star_y + star_size * 0.5 * math.sin(angle)))
-            angle = math.radians(-90 + i * 72 + 36)
-            points.append((star_x + star_size * 0.2 * math.cos(angle),
-                           star_y + star_size * 0.2 * math.sin(angle)))
+        points = _star_points(x, y + 6, star_size * 0.5, star_size * 0.2)
         pygame.draw.polygon(surface, STAR_YELLOW, points)
         rating_text = f"{rating:.1f}"
         draw_text(surface, font, rating_text, x + star_size // 2 + 4, y, STAR_YELLOW)
@@ -171,42 +346,55 @@ def draw_mature_banner(surface, font, x: int, y: int, width: int) -> None:
     Draw a red "Mature" banner across the bottom of an image.
     """
     banner_height = 18
-    rect = pygame.Rect(x, y, width, banner_height)
-    pygame.draw.rect(surface, MATURE_RED, rect)
-    
-    # Center text
-    text_surf = font.render("Mature", True, (255, 255, 255))
-    text_x = x + (width - text_surf.get_width()) // 2
-    text_y = y + (banner_height - text_surf.get_height()) // 2
-    surface.blit(text_surf, (text_x, text_y))
+    key = (font, width)
+    banner = _mature_banner_cache.get(key)
+    if banner is None:
+        banner = pygame.Surface((width, banner_height))
+        banner.fill(MATURE_RED)
+        
+        # Center text
+        text_surf = font.render("Mature", True, (255, 255, 255))
+        text_x = (width - text_surf.get_width()) // 2
+        text_y = (banner_height - text_surf.get_height()) // 2
+        banner.blit(text_surf, (text_x, text_y))
+        _mature_banner_cache[key] = banner
+    surface.blit(banner, (x, y))
 
 
 def draw_nav_arrow(surface, x: int, y: int, direction: str, size: int = 12) -> None:
     """
     Draw a navigation arrow (left or right).
+    The tip points away from (x, y); the flat side is at x.
     """
-    if direction == "right":
-        points = [
-            (x, y - size),
-            (x + size, y),
-            (x, y + size)
-        ]
-    else:  # left
-        points = [
-            (x, y - size),
-            (x - size, y),
-            (x, y + size)
-        ]
+    key = (direction, size)
+    arrow = _nav_arrow_cache.get(key)
+    if arrow is None:
+        arrow = pygame.Surface((size + 1, size * 2 + 1), pygame.SRCALPHA)
+        if direction == "right":
+            points = [
+                (0, 0),
+                (size, size),
+                (0, size * 2)
+            ]
+        else:  # left
+            points = [
+                (size, 0),
+                (0, size),
+                (size, size * 2)
+            ]
+        pygame.draw.polygon(arrow, (255, 255, 0), points)
+        _nav_arrow_cache[key] = arrow
     
-    pygame.draw.polygon(surface, (255, 255, 0), points)
+    left = x if direction == "right" else x - size
+    surface.blit(arrow, (left, y - size))
 
 
 def draw_page_indicator(surface, font, page: int, total_pages: int, y: int) -> None:
     """
     Draw page indicator at the bottom (e.g., "Page 1/5").
     """
-    text = f"Page {page}/{total_pages}"
-    draw_text(surface, font, text, surface.get_width() // 2, y, (150, 150, 150), center=True)
+    text_surf = _render_text(font, f"Page {page}/{total_pages}", (150, 150, 150))
+    surface.blit(text_surf, text_surf.get_rect(center=(surface.get_width() // 2, y)))
 
 
 def draw_rating_stars(surface, x: int, y: int, rating: int, max_stars: int = 5, size: int = 12, filled_color: Tuple[int, int, int] = STAR_YELLOW, empty_color: Tuple[int, int, int] = (80, 80, 80)) -> int:
@@ -224,43 +412,44 @@ def draw_rating_stars(surface, x: int, y: int, rating: int, max_stars: int = 5,
         filled_color: Color for filled stars
         empty_color: Color for empty stars
     """
+    strip = _get_rating_strip(rating, max_stars, size, filled_color, empty_color)
+    surface.blit(strip, (x, y - size // 2))
+    return strip.get_width()
+
+
+def _get_rating_strip(rating: int, max_stars: int, size: int, filled_color: Tuple[int, int, int], empty_color: Tuple[int, int, int]) -> pygame.Surface:
+    """The whole strip is rendered once per rating/style and blitted afterwards."""
+    key = (rating, max_stars, size, filled_color, empty_color)
+    strip = _rating_stars_cache.get(key)
+    if strip is None:
+        strip = _render_rating_stars(rating, max_stars, size, filled_color, empty_color)
+        _rating_stars_cache[key] = strip
+    return strip
+
+
+def _render_rating_stars(rating: int, max_stars: int, size: int, filled_color: Tuple[int, int, int], empty_color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render a strip of filled and empty stars onto a transparent surface."""
     gap = 2
-    total_width = 0
+    strip = pygame.Surface((max_stars * (size + gap), size), pygame.SRCALPHA)
     star_img = _get_star_image(size)
+    dark_star = _get_dark_star_image(size)
     
+    if star_img:
+        # Filled stars use the normal image, empty ones the darkened version
+        strip.blits([
+            (star_img if i < rating else dark_star, (i * (size + gap), 0))
+            for i in range(max_stars)
+        ], doreturn=False)
+        return strip
+    
+    # Fallback to polygon
     for i in range(max_stars):
-        star_x = x + i * (size + gap)
-        star_y = y - size // 2
-        is_filled = i < rating
-        
-        if star_img:
-            if is_filled:
-                # Draw filled star (normal image)
-                surface.blit(star_img, (star_x, star_y))
-            else:
-                # Draw empty star (darkened version)
-                dark_star = star_img.copy()
-                dark_star.fill((60, 60, 60, 255), special_flags=pygame.BLEND_RGBA_MULT)
-                surface.blit(dark_star, (star_x, star_y))
-        else:
-            # Fallback to polygon
-            import math
-            cx = star_x + size // 2
-            cy = y
-            color = filled_color if is_filled else empty_color
-            points = []
-            for j in range(5):
-                angle = math.radians(-90 + j * 72)
-                points.append((cx + (size // 2) * math.cos(angle), 
-                               cy + (size // 2) * math.sin(angle)))
-                angle = math.radians(-90 + j * 72 + 36)
-                points.append((cx + (size // 2) * 0.4 * math.cos(angle),
-                               cy + (size // 2) * 0.4 * math.sin(angle)))
-            pygame.draw.polygon(surface, color, points)
-        
-        total_width = (i + 1) * (size + gap)
+        star_x = i * (size + gap)
+        color = filled_color if i < rating else empty_color
+        points = _star_points(star_x + size // 2, size // 2, size // 2, (size // 2) * 0.4)
+        pygame.draw.polygon(strip, color, points)
     
-    return total_width
+    return strip
 
 
 def draw_heart(surface, x: int, y: int, size: int = 12, color: Tuple[int, int, int] = (255, 100, 100), filled: bool = True) -> None:
@@ -268,30 +457,33 @@ def draw_heart(surface, x: int, y: int, size: int = 12, color: Tuple[int, int, i
     Draw a heart shape at the given position.
     The heart is centered at (x, y).
     """
-    import math
-    
-    # Heart shape using parametric equations
-    points = []
-    for i in range(30):
-        t = i * 2 * math.pi / 30
-        # Parametric heart curve
-        hx = 16 * (math.sin(t) ** 3)
-        hy = -(13 * math.cos(t) - 5 * math.cos(2*t) - 2 * math.cos(3*t) - math.cos(4*t))
-        # Scale and translate
+    # Rasterized once around the center of a surface with room on every side
+    half = size + 2
+    key = (size, tuple(color), filled)
+    heart = _heart_cache.get(key)
+    if heart is None:
+        # Scale and translate the heart curve
         scale = size / 32
-        points.append((x + hx * scale, y + hy * scale))
-    
-    if filled:
-        pygame.draw.polygon(surface, color, points)
-    else:
-        pygame.draw.polygon(surface, color, points, width=2)
+        points = [(half + hx * scale, half + hy * scale) for hx, hy in _HEART_CURVE]
+        
+        heart = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        if filled:
+            pygame.draw.polygon(heart, color, points)
+        else:
+            pygame.draw.polygon(heart, color, points, width=2)
+        _heart_cache[key] = heart
+    surface.blit(heart, (x - half, y - half))
 
 
 def draw_progress_bar(surface, x, y, width, height, progress):
+    fill_width = int(width * progress)
+    if fill_width >= width:
+        # Complete: the fill covers the whole background
+        pygame.draw.rect(surface, ACCENT_COLOR, (x, y, width, height), border_radius=3)
+        return
     # Background
     pygame.draw.rect(surface, (50, 50, 50), (x, y, width, height), border_radius=3)
     # Fill
-    fill_width = int(width * progress)
     if fill_width > 0:
         pygame.draw.rect(surface, ACCENT_COLOR, (x, y, fill_width, height), border_radius=3)
 
@@ -1,32 +1,73 @@
+import functools
 import logging
-from typing import List, Dict
+from typing import Iterable, List, Dict, Optional, Tuple
 from .repository import Repository
 from .cdn_api import CdnApi
 from .models import UpdateInfo, CatalogEntry
 
+@functools.lru_cache(maxsize=4096)
+def _parse_version(version: str) -> Optional[Tuple[int, ...]]:
+    """
+    Parse "x.y.z" (any number of parts) into a tuple of ints, with trailing
+    zeros dropped so "1.0" and "1" compare equal. Returns None if a part is
+    not a number.
+    """
+    try:
+        parts = [int(x) for x in version.split('.')]
+    except ValueError:
+        return None
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
 class Updater:
     def __init__(self, repo: Repository, cdn_api: CdnApi):
         self.repo = repo
         self.cdn_api = cdn_api
+        # (catalog list, installed versions, updates) from the last check
+        # against a list, reused while neither side has changed
+        self._last_check = None
 
-    def get_update_list(self, catalog: List[CatalogEntry]) -> List[UpdateInfo]:
+    def get_update_list(self, catalog: Iterable[CatalogEntry]) -> List[UpdateInfo]:
+        """
+        Compare catalog entries against installed games.
+        
+        catalog may be any iterable, e.g. a generator over pages as they are
+        fetched; each entry is matched against the installed games as it is
+        consumed. Updates are returned in installed-games order.
+        """
         installed_games = self.repo.load_installed_games()
-        updates = []
+        installed_key = tuple((g.id, g.installed_version) for g in installed_games.values())
+        
+        # Generators can't be compared, but a catalog list handed back by
+        # Repository.load_cached_catalog stays the same object until it changes
+        if isinstance(catalog, list):
+            last = self._last_check
+            if last is not None and last[0] is catalog and last[1] == installed_key:
+                logging.info(f"Catalog unchanged, reusing {len(last[2])} updates")
+                return list(last[2])
         
-        logging.info(f"Checking updates for {len(installed_games)} installed games against {len(catalog)} catalog entries")
+        # Installed game id -> matching catalog entry. An id match wins over a
+        # slug match wherever either arrives, so the result doesn't depend on
+        # the order pages complete in
+        by_id = {}
+        by_slug = {}
+        entry_count = 0
         
-        # Map by both id and slug for compatibility
-        catalog_by_id = {entry.id: entry for entry in catalog}
-        catalog_by_slug = {entry.slug: entry for entry in catalog}
+        for catalog_entry in catalog:
+            entry_count += 1
+            if catalog_entry.id in installed_games:
+                by_id[catalog_entry.id] = catalog_entry
+            if catalog_entry.slug in installed_games:
+                by_slug[catalog_entry.slug] = catalog_entry
         
+        updates = []
         for game_id, installed_game in installed_games.items():
-            # Try to find by id first, then by slug
-            catalog_entry = catalog_by_id.get(game_id) or catalog_by_slug.get(game_id)
-            
+            catalog_entry = by_id.get(game_id) or by_slug.get(game_id)
             if not catalog_entry:
                 logging.debug(f"Game '{game_id}' not found in catalog")
                 continue
-                
+            
             latest_version = catalog_entry.version or ""
             installed_version = installed_game.installed_version or ""
             
@@ -41,8 +82,11 @@ class Updater:
                     latest_version=latest_version
                 ))
         
+        logging.info(f"Checked {len(installed_games)} installed games against {entry_count} catalog entries")
         logging.info(f"Found {len(updates)} updates")
-        return updates
+        if isinstance(catalog, list):
+            self._last_check = (catalog, installed_key, updates)
+        return list(updates)
 
     def _is_newer(self, latest: str, current: str) -> bool:
         """
@@ -56,18 +100,12 @@ class Updater:
         latest = latest.lstrip('v')
         current = current.lstrip('v')
         
-        try:
-            # Split and pad with zeros for comparison
-            l_parts = [int(x) for x in latest.split('.')]
-            c_parts = [int(x) for x in current.split('.')]
-            
-            # Pad shorter list with zeros
-            max_len = max(len(l_parts), len(c_parts))
-            l_parts.extend([0] * (max_len - len(l_parts)))
-            c_parts.extend([0] * (max_len - len(c_parts)))
-            
+        # Parsed versions are cached, since many games share version strings
+        l_parts = _parse_version(latest)
+        c_parts = _parse_version(current)
+        if l_parts is not None and c_parts is not None:
             return l_parts > c_parts
-        except ValueError as e:
-            logging.warning(f"Version comparison failed for '{latest}' vs '{current}': {e}")
-            # Fallback: string comparison
-            return latest != current and latest > current
+        
+        logging.warning(f"Version comparison failed for '{latest}' vs '{current}': not a numeric version")
+        # Fallback: string comparison
+        return latest != current and latest > current
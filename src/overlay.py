@@ -10,7 +10,7 @@
 # 2025-05-01 • Austin edition
 
 import os, re, time, subprocess, logging, logging.handlers,fcntl,errno
-import sys
+import sys, socket, struct, select, io
 
 # ───────────────────────────────────────────────────────────────
 # Single-instance lock - prevent multiple overlay.py from running
@@ -37,7 +37,7 @@ if not acquire_lock():
 import threading
 from datetime import datetime
 from collections import deque
-from statistics import median
+from bisect import bisect_left, insort
 from enum import Enum
 import json  # for config persistence
 import urllib.request
@@ -49,7 +49,9 @@ my_logger = logging.getLogger("overlay")
 my_logger.setLevel(logging.INFO)
 fh = logging.handlers.RotatingFileHandler(logfile, maxBytes=102400, backupCount=1)
 my_logger.addHandler(fh)
-my_logger.addHandler(logging.StreamHandler())
+# Under systemd stderr goes to the journal; the log file already has everything
+if sys.stderr is not None and sys.stderr.isatty():
+    my_logger.addHandler(logging.StreamHandler())
 
 # ───────────────────────────────────────────────────────────────
 # ---- OPTIONAL 3rd-party python modules ----
@@ -57,6 +59,10 @@ my_logger.addHandler(logging.StreamHandler())
 # ───────────────────────────────────────────────────────────────
 from evdev import ecodes, InputDevice, list_devices            # game-pad events
 from PIL import Image, ImageDraw, ImageFont                    # build OSD PNG
+try:
+    import alsaaudio        # sudo apt install python3-alsaaudio (optional)
+except ImportError:
+    alsaaudio = None        # fall back to calling amixer
 
 # ╭────────────────────────────────────────────────────────────╮
 # │  SECTION 1  -  CONFIG                                     │
@@ -65,6 +71,8 @@ pngview_path   = "/usr/local/bin/pngview"
 dpi            = 36                                            # overlay icon size
 pngview_call   = [pngview_path, "-d", "0", "-b", "0x0000",
                   "-n", "-l", "15000", "-y", "0", "-x", "0"]   # base argv
+PNGVIEW_X_IDX  = pngview_call.index("-x") + 1                  # argv slots filled per overlay
+PNGVIEW_Y_IDX  = pngview_call.index("-y") + 1
 # place this near the top of the file (right after the other constants)
 NAME_KEYWORDS = ("arcade", "joystick", "gamepad", "gpio", "controller")
 
@@ -77,6 +85,9 @@ logfile        = f"{here}/overlay.log"
 speaker_icon   = overlay_icons + "speaker.png"
 FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"  # any TTF is fine
 
+# Generated OSD PNGs live in RAM; /tmp is not tmpfs on every image
+osd_dir        = "/dev/shm" if os.path.isdir("/dev/shm") else "/tmp"
+
 # Input-event key codes (tweak if your pad uses others)
 BTN_START = ecodes.BTN_START  if hasattr(ecodes, "BTN_START") else ecodes.KEY_START
 
@@ -86,26 +97,51 @@ os.makedirs(CONFIG_DIR, exist_ok=True)  # ensure directory exists
 
 config_path = os.path.join(CONFIG_DIR, 'overlay_config.json')
 persisted_volume_level = None
+pad_path = None             # event node the pad was found on last time; tried first
+
+# GitHub is asked at most this often; in between the saved remote HEAD is used
+UPDATE_CHECK_INTERVAL = 6 * 60 * 60
+last_update_check = 0.0     # epoch seconds of the last GitHub request
+last_remote_head = None     # commit GitHub reported for main at that time
+# Changes are only flagged here; the main loop writes the file once they
+# have settled, so volume auto-repeat doesn't write the SD card 5x a second
+CONFIG_SAVE_DELAY = 2.0
+config_dirty = False
+config_changed_at = 0.0
 
 # Default HUD position before loading config
 osd_position = 'bottom'    # 'top' or 'bottom'
 
 
 def load_config():
-    global osd_position, persisted_volume_level
+    global osd_position, persisted_volume_level, last_update_check, last_remote_head, pad_path
     try:
         with open(config_path, 'r') as f:
             cfg = json.load(f)
             osd_position = cfg.get('osd_position', osd_position)
             persisted_volume_level = cfg.get('volume_level')
+            last_update_check = cfg.get('last_update_check', 0.0)
+            last_remote_head = cfg.get('last_remote_head')
+            pad_path = cfg.get('pad_path')
     except FileNotFoundError:
         pass
 
+def mark_config_dirty():
+    """Schedule a save_config() from the main loop (main thread only)."""
+    global config_dirty, config_changed_at
+    config_dirty = True
+    config_changed_at = time.time()
+
 def save_config():
-    cfg = {'osd_position': osd_position, 'volume_level': vol_get()}
+    cfg = {'osd_position': osd_position, 'volume_level': vol_get(),
+           'last_update_check': last_update_check, 'last_remote_head': last_remote_head,
+           'pad_path': pad_path}
+    # Atomic write
+    temp_path = config_path + '.tmp'
     try:
-        with open(config_path, 'w') as f:
+        with open(temp_path, 'w') as f:
             json.dump(cfg, f)
+        os.replace(temp_path, config_path)
     except Exception as e:
         my_logger.error(f"Failed to save config: {e}")
 
@@ -116,7 +152,7 @@ def load_and_apply_config():
     global persisted_volume_level
     if isinstance(persisted_volume_level, int):
         try:
-            _alsa_volume(f"{persisted_volume_level}%")
+            _alsa_volume(persisted_volume_level)
         except Exception:
             pass
 
@@ -124,32 +160,41 @@ def load_and_apply_config():
 import urllib.request
 
 def check_for_git_update():
+    global last_update_check, last_remote_head, config_dirty
     try:
         local_head = subprocess.check_output(
             ["git", "rev-parse", "HEAD"], cwd="/home/pi/gamebird-os", timeout=5
         ).decode().strip()
-        url = "https://api.github.com/repos/suntank/gamebird-os/commits/main"
-        with urllib.request.urlopen(url, timeout=3) as response:
-            remote_data = json.loads(response.read())
-            remote_head = remote_data["sha"]
+        # Compare against the saved remote HEAD while it is recent; the local
+        # HEAD is always re-read so installing the update clears the notice
+        if last_remote_head and 0 <= time.time() - last_update_check < UPDATE_CHECK_INTERVAL:
+            remote_head = last_remote_head
+            my_logger.info(f"GitHub update check (cached): local={local_head} remote={remote_head}")
+        else:
+            url = "https://api.github.com/repos/suntank/gamebird-os/commits/main"
+            with urllib.request.urlopen(url, timeout=3) as response:
+                remote_data = json.loads(response.read())
+                remote_head = remote_data["sha"]
             my_logger.info(f"GitHub update check: local={local_head} remote={remote_head}")
-            if remote_head != local_head:
-                my_logger.info("Update available!")
-                return True
-            else:
-                my_logger.info("No update available.")
-                return False
+            last_update_check = time.time()
+            last_remote_head = remote_head
+            config_dirty = True
+        if remote_head != local_head:
+            my_logger.info("Update available!")
+            return True
+        else:
+            my_logger.info("No update available.")
+            return False
     except Exception as e:
         my_logger.warning(f"Update check failed: {e}")
     return False
 
 def show_update_notice():
-    png_path = "/tmp/update_notice.png"
-    font = ImageFont.truetype(FONT_PATH, 24)
+    global update_notice_until
+    png_path = f"{osd_dir}/update_notice.png"
+    hide_overlay("update")          # the PNG is rewritten below
+    font = get_font(24)
     text = "New system update available.\nGo to Tools > Update."
-    # Get screen resolution (assume global 'resolution' is available)
-    screen_w = int(resolution[0])
-    screen_h = int(resolution[1])
     text_w, text_h = font.getsize_multiline(text)
     padding = 24
     img_w = text_w + padding * 2
@@ -158,13 +203,18 @@ def show_update_notice():
     draw = ImageDraw.Draw(img)
     # White text, centered
     draw.multiline_text((padding, padding//2), text, font=font, fill=(255, 255, 255, 255), align="center")
-    img.save(png_path)
+    save_osd_png(img, png_path)
     # Center horizontally, place at bottom with a margin
     x = (screen_w - img_w) // 2
     y = screen_h - img_h - 40  # 40px bottom margin
     spawn_overlay("update", png_path, x, y)
-    time.sleep(10)
-    if "update" in overlay_processes:
+    # Removed by maybe_clear_update_notice() so the main loop keeps running
+    update_notice_until = time.time() + 10
+
+update_notice_until = 0.0                                      # epoch seconds
+
+def maybe_clear_update_notice():
+    if "update" in overlay_processes and time.time() >= update_notice_until:
         overlay_processes["update"].kill()
         del overlay_processes["update"]
 
@@ -177,6 +227,12 @@ from adafruit_ina219 import INA219
 i2c   = busio.I2C(board.SCL, board.SDA)
 ina   = INA219(i2c, addr=0x43)
 
+# Raw INA219 registers, read directly by read_ina() on the 1 Hz battery tick
+INA_REG_SHUNT = 0x01
+INA_REG_BUS   = 0x02
+ina_cmd = bytearray(1)
+ina_buf = bytearray(2)
+
 vmax = {"discharging": 4.0,  "charging": 4.3}
 vmin = {"discharging": 3.3,  "charging": 3.9}
 icons = { "discharging": [ "alert_red","alert","20","30","30","50","60",
@@ -185,12 +241,17 @@ icons = { "discharging": [ "alert_red","alert","20","30","30","50","60",
                            "charging_50","charging_50","charging_60","charging_60",
                            "charging_80","charging_90","charging_90","charging_full" ]}
 
+# Patterns for parsing amixer / vcgencmd output
+scontrol_re  = re.compile(r"'([^']+)'")                       # amixer scontrols
+volume_re    = re.compile(r"\[(\d+)%\]")                     # amixer get
+throttled_re = re.compile(r"0x[\da-f]+")                      # vcgencmd get_throttled
+
 # Mixer to control (amixer scontrols will list options)
 
 def _detect_volume_control() -> str:
     out = subprocess.check_output(["amixer", "scontrols"], timeout=2).decode()
     # look for any control that, when you run `amixer sget`, shows a [%] in its output
-    for name in re.findall(r"'([^']+)'", out):
+    for name in scontrol_re.findall(out):
         sget = subprocess.check_output(["amixer", "sget", name], timeout=2).decode()
         if "%" in sget:
             return name
@@ -202,6 +263,14 @@ except Exception as e:
     my_logger.warning(f"_detect_volume_control() failed: {e}")
     alsa_mixer_name = "Master"
 
+# In-process mixer handle, so reading the volume doesn't fork amixer
+alsa_mixer = None
+if alsaaudio is not None:
+    try:
+        alsa_mixer = alsaaudio.Mixer(alsa_mixer_name)
+    except alsaaudio.ALSAAudioError as e:
+        my_logger.warning(f"alsaaudio.Mixer({alsa_mixer_name!r}) failed, using amixer: {e}")
+
 
 class InterfaceState(Enum):
     DISABLED=0; ENABLED=1; CONNECTED=2
@@ -219,8 +288,12 @@ wifi_icons = {
 icon_battery_critical_shutdown = iconpath2 + "alert-outline-red.png"
 wifi_carrier   = "/sys/class/net/wlan0/carrier"
 wifi_linkmode  = "/sys/class/net/wlan0/link_mode"
+wifi_operstate = "/sys/class/net/wlan0/operstate"
+SIOCGIFADDR    = 0x8915                                        # get IPv4 address ioctl
 bt_devices_dir = "/sys/class/bluetooth"
 env_cmd        = "vcgencmd get_throttled"
+# Same bits as vcgencmd, exposed by the firmware driver without a fork
+throttled_file = "/sys/devices/platform/soc/soc:firmware/get_throttled"
 fbfile         = "tvservice -s"
 
 # ───────────────────────────────────────────────────────────────
@@ -231,12 +304,22 @@ fbfile         = "tvservice -s"
 # Hardcoded resolution - tvservice queries can interfere with fbcp-ili9341
 resolution = ["480", "480"]
 my_logger.info(f"Using hardcoded resolution: {resolution}")
+screen_w, screen_h = int(resolution[0]), int(resolution[1])
+
+# HUD coordinates, fixed for the resolution above
+hud_y      = {'top': 0, 'bottom': screen_h - dpi - 8}          # by osd_position
+x_bat      = screen_w - dpi
+x_wifi     = screen_w - dpi * 2
+x_env_base = screen_w - dpi * 4
 
 overlay_processes = {}
 battery_history   = deque(maxlen=15)
+battery_sorted    = []      # same samples as battery_history, kept in order
 wifi_state = bt_state = None  # Bluetooth icon overlay is hidden; state is tracked for logging only.
 battery_level = None
 prev_charging_state = None  # Track charging state to detect plug-in events
+SHUTDOWN_DELAY = 20.0       # seconds between the critical-battery warning and poweroff
+shutdown_at = None          # armed once by battery(), acted on by maybe_power_off()
 # Track dpad state for emulated key-presses
 prev_abs_x = 0
 prev_abs_y = 0
@@ -260,43 +343,129 @@ start_hud_shown = False  # track if we've already shown HUD for this START hold
 # Track last OSD position to force overlay respawn on position change
 last_osd_position = osd_position
 
+# (png, x, y) each running overlay was spawned with
+overlay_args = {}
+
+# PNG bytes last written to each OSD path
+_osd_png_bytes = {}
+
+def save_osd_png(img, path):
+    """
+    Encode img with light compression and write it to path, unless path
+    already holds exactly these bytes. The write is atomic so a pngview
+    starting up never reads a half-written file.
+    """
+    buf = io.BytesIO()
+    img.save(buf, "PNG", compress_level=1)   # tiny images: zlib effort buys nothing
+    data = buf.getvalue()
+    if _osd_png_bytes.get(path) == data and os.path.exists(path):
+        return
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    _osd_png_bytes[path] = data
+
 # Helper to spawn overlays at correct position (x, y)
 def spawn_overlay(name, png, x, y):
-    if name in overlay_processes:
-        overlay_processes[name].kill()
-        del overlay_processes[name]
-    call = pngview_call.copy()
-    call[call.index('-x') + 1] = str(x)
-    call[call.index('-y') + 1] = str(y)
-    call.append(png)
-    overlay_processes[name] = subprocess.Popen(call)
+    old = overlay_processes.get(name)
+    # Already showing exactly this; don't kill and fork pngview again
+    if old is not None and overlay_args.get(name) == (png, x, y) and old.poll() is None:
+        return
+    call = pngview_call + [png]
+    call[PNGVIEW_X_IDX] = str(x)
+    call[PNGVIEW_Y_IDX] = str(y)
+    # With close_fds=False and an absolute path, Popen uses posix_spawn
+    # rather than fork+exec; our own fds are non-inheritable anyway
+    overlay_processes[name] = subprocess.Popen(call, close_fds=False)
+    overlay_args[name] = (png, x, y)
+    # pngview can't reload its image, so replacing is unavoidable; start the
+    # new one before killing the old so the icon doesn't blink off between
+    if old is not None:
+        old.kill()
 
 # ───────────────────────────────────────────────────────────────
 #  SECTION 4  -  Volume control and On-Screen Display
 # ───────────────────────────────────────────────────────────────
-def _alsa_volume(sign_percent: str):
-    """Low level call to ALSA via amixer."""
-    subprocess.call(["amixer", "-q", "sset", alsa_mixer_name, sign_percent])
+# Last volume read or set through amixer, and when; reused for a moment so
+# auto-repeat and the held-START HUD don't fork amixer several times a tick
+VOL_CACHE_SECONDS = 1.0
+_vol_cached = None
+_vol_cached_at = 0.0
+
+def _alsa_volume(pct: int):
+    """Low level call to ALSA, via the mixer handle or amixer."""
+    global _vol_cached, _vol_cached_at
+    if alsa_mixer is not None:
+        try:
+            alsa_mixer.setvolume(pct)
+            return
+        except alsaaudio.ALSAAudioError as e:
+            my_logger.warning(f"setvolume failed, using amixer: {e}")
+    subprocess.call(["amixer", "-q", "sset", alsa_mixer_name, f"{pct}%"])
+    _vol_cached, _vol_cached_at = pct, time.time()
 
 def vol_get() -> int:
+    global _vol_cached, _vol_cached_at
+    if alsa_mixer is not None:
+        try:
+            alsa_mixer.handleevents()       # pick up changes made by others
+            return alsa_mixer.getvolume()[0]
+        except alsaaudio.ALSAAudioError as e:
+            my_logger.warning(f"getvolume failed, using amixer: {e}")
+    # ES can change the volume too, so the amixer reading is only kept briefly
+    if _vol_cached is not None and time.time() - _vol_cached_at < VOL_CACHE_SECONDS:
+        return _vol_cached
     out = subprocess.check_output(["amixer", "get", alsa_mixer_name]).decode()
-    m = re.search(r"\[(\d+)%\]", out)
-    return int(m.group(1)) if m else 0
+    m = volume_re.search(out)
+    _vol_cached, _vol_cached_at = (int(m.group(1)) if m else 0), time.time()
+    return _vol_cached
 
 def vol_change(delta: int) -> int:
     cur = vol_get()
     new = max(0, min(100, cur + delta))
     # Avoid extra amixer calls at the clamp
     if new != cur:
-        _alsa_volume(f"{new}%")
+        _alsa_volume(new)
     return new
 
 # OSD helpers
-def build_volume_png(vol_pct: int, path_out="/tmp/vol_osd.png") -> str:
+# Font, speaker icon and finished PNGs are loaded/rendered once and reused;
+# volume auto-repeat would otherwise rebuild the same PNG many times a second
+_fonts = {}                # point size -> ImageFont
+_speaker_icon_img = None
+_vol_png_cache = {}        # percent -> PNG path
+_time_png = None           # (text, PNG path, width) of the last time OSD
+
+def get_font(size: int):
+    """FONT_PATH at the given size, parsed once per size."""
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = ImageFont.truetype(FONT_PATH, size)
+    return font
+
+def _get_osd_font():
+    return get_font(int(dpi * 0.7))     # approx 25 px when dpi=36
+
+def _get_speaker_icon():
+    global _speaker_icon_img
+    if _speaker_icon_img is None:
+        _speaker_icon_img = Image.open(speaker_icon).convert("RGBA")
+    return _speaker_icon_img
+
+def build_volume_png(vol_pct: int) -> str:
+    """Return a transparent PNG of 'speaker  98%', rendering it on first use."""
+    path_out = _vol_png_cache.get(vol_pct)
+    if path_out is None:
+        # One file per percent, so a running pngview never sees it rewritten
+        path_out = _render_volume_png(vol_pct, f"{osd_dir}/vol_osd_{vol_pct}.png")
+        _vol_png_cache[vol_pct] = path_out
+    return path_out
+
+def _render_volume_png(vol_pct: int, path_out: str) -> str:
     """Compose 'speaker  98%' into a transparent PNG."""
-    icon = Image.open(speaker_icon).convert("RGBA")
-    font_size = int(dpi * 0.7)          # approx 25 px when dpi=36
-    font = ImageFont.truetype(FONT_PATH, font_size)
+    icon = _get_speaker_icon()
+    font = _get_osd_font()
 
     txt = f"{vol_pct}%"
     text_w, text_h = font.getsize(txt)
@@ -309,15 +478,18 @@ def build_volume_png(vol_pct: int, path_out="/tmp/vol_osd.png") -> str:
     draw = ImageDraw.Draw(img)
     draw.text((icon.width + 8, (img.height - text_h)//2),
               txt, font=font, fill=(255,255,255,255))
-    img.save(path_out)
+    save_osd_png(img, path_out)
     return path_out
 
 vol_osd_until = 0.0                                            # epoch seconds
 
-def build_time_png(path_out="/tmp/time_osd.png") -> str:
-    """Build a transparent PNG with current time in 12-hour format."""
-    font_size = int(dpi * 0.7)          # same size as volume percent
-    font = ImageFont.truetype(FONT_PATH, font_size)
+def build_time_png(path_out=f"{osd_dir}/time_osd.png"):
+    """
+    Build a transparent PNG with current time in 12-hour format.
+    Returns (path, width); the PNG is only re-rendered when the minute changes.
+    """
+    global _time_png
+    font = _get_osd_font()              # same size as volume percent
     
     now = datetime.now()
     hour_12 = now.hour % 12
@@ -325,23 +497,34 @@ def build_time_png(path_out="/tmp/time_osd.png") -> str:
         hour_12 = 12
     am_pm = "AM" if now.hour < 12 else "PM"
     txt = f"{hour_12}:{now.minute:02d} {am_pm}"
+    if _time_png is not None and _time_png[0] == txt and _time_png[1] == path_out:
+        return _time_png[1], _time_png[2]
     
     text_w, text_h = font.getsize(txt)
     img = Image.new("RGBA", (text_w + 8, text_h + 4), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
     draw.text((4, 2), txt, font=font, fill=(255, 255, 255, 255))
-    img.save(path_out)
-    return path_out
+    save_osd_png(img, path_out)
+    _time_png = (txt, path_out, img.width)
+    return path_out, img.width
 
 def show_time_osd(position='bottom'):
     """Show current time overlay in the center of the HUD."""
-    png = build_time_png()
+    previous = _time_png
+    png, width = build_time_png()
+    if _time_png is not previous:
+        # Same path, new minute: make spawn_overlay replace the running pngview
+        overlay_args.pop('time', None)
     # Center horizontally
-    img = Image.open(png)
-    x_pos = (int(resolution[0]) - img.width) // 2
-    y_pos = 0 if position == 'top' else int(resolution[1]) - dpi - 8
+    x_pos = (screen_w - width) // 2
+    y_pos = hud_y.get(position, hud_y['bottom'])
     spawn_overlay('time', png, x_pos, y_pos)
 
+def hide_overlay(name):
+    if name in overlay_processes:
+        overlay_processes[name].kill()
+        del overlay_processes[name]
+
 def hide_time_osd():
     """Hide the time overlay."""
     if 'time' in overlay_processes:
@@ -353,7 +536,7 @@ def show_volume_osd(vol_pct: int, duration=2.0, position='bottom'):
     global vol_osd_until
     png = build_volume_png(vol_pct)
     x_pos = 0  # volume OSD always at left edge
-    y_pos = 0 if position == 'top' else int(resolution[1]) - dpi - 8
+    y_pos = hud_y.get(position, hud_y['bottom'])
     spawn_overlay('vol', png, x_pos, y_pos)
     vol_osd_until = time.time() + duration
 
@@ -365,48 +548,73 @@ def maybe_clear_volume_osd():
 # ───────────────────────────────────────────────────────────────
 #  SECTION 5  -  Battery / Wi-Fi / BT / env
 # ───────────────────────────────────────────────────────────────
-def is_charging():
+def _ina_register(dev, reg):
+    ina_cmd[0] = reg
+    dev.write_then_readinto(ina_cmd, ina_buf)
+    return (ina_buf[0] << 8) | ina_buf[1]
+
+def read_ina():
+    """
+    (bus volts, shunt volts) under a single hold of the I2C bus.
+    The shunt voltage has the same sign as the current, so > 0 means charging;
+    unlike ina.current it needs no calibration register write first.
+    """
+    with ina.i2c_device as dev:
+        shunt = _ina_register(dev, INA_REG_SHUNT)
+        bus   = _ina_register(dev, INA_REG_BUS)
+    if shunt & 0x8000:
+        shunt -= 0x10000
+    return (bus >> 3) * 4e-3, shunt * 10e-6
+
+# (vmin, span, last icon index) per state, for translate_bat
+bat_scale = {state: (vmin[state], vmax[state] - vmin[state], len(icons[state]) - 1)
+             for state in icons}
+
+def translate_bat(voltage, charging):
+    """Battery icon name for a voltage; charging comes from the caller's INA219 read."""
     try:
-        return ina.current > 0
-    except Exception:
-        return False
-
-def translate_bat(voltage):
-    try:
-        state = "charging" if is_charging() else "discharging"
-        span  = vmax[state]-vmin[state]
-        idx   = int(round(max(0.0, min(1.0,
-                                    (voltage - vmin[state]) / span))
-                           * (len(icons[state])-1)))
+        state = "charging" if charging else "discharging"
+        low, span, last = bat_scale[state]
+        idx   = int(round(max(0.0, min(1.0, (voltage - low) / span)) * last))
         return icons[state][idx]
     except Exception as e:
         my_logger.error(f"translate_bat(): {e}")
         return "unknown"
 
+def add_battery_sample(value_v):
+    """Append to the sliding window, keeping its sorted copy in step."""
+    if len(battery_history) == battery_history.maxlen:
+        del battery_sorted[bisect_left(battery_sorted, battery_history[0])]
+    battery_history.append(value_v)
+    insort(battery_sorted, value_v)
+
+def battery_median():
+    n = len(battery_sorted)
+    mid = n // 2
+    if n % 2:
+        return battery_sorted[mid]
+    return (battery_sorted[mid - 1] + battery_sorted[mid]) / 2
+
 def battery(force=False):
-    global battery_level, battery_visible_until
+    global battery_level, battery_visible_until, shutdown_at
+    # One INA219 read per tick, shared by the icon and visibility logic
     try:
-        value_v = ina.bus_voltage
+        value_v, shunt_v = read_ina()
     except Exception:
-        value_v = 0.0
+        value_v, shunt_v = 0.0, 0.0
+    charging = shunt_v > 0
 
-    battery_history.append(value_v)
-    level_icon = translate_bat(median(battery_history))
+    add_battery_sample(value_v)
+    level_icon = translate_bat(battery_median(), charging)
 
-    # Critical shutdown logic is unchanged
-    if value_v <= 3.3:
-        my_logger.warning("Battery ≤3.3 V, shutdown in 20 s")
-        subprocess.Popen(pngview_call+[
-            str(int(int(resolution[0]) / 2 - 64)),"-y",str(int(int(resolution[1]) / 2 - 64)),
-            icon_battery_critical_shutdown])
-        os.system("sleep 20 && sudo poweroff &")
+    # Critical shutdown: warn once, then power off from the main loop
+    if value_v <= 3.3 and shutdown_at is None:
+        my_logger.warning(f"Battery ≤3.3 V, shutdown in {SHUTDOWN_DELAY:.0f} s")
+        spawn_overlay('critical', icon_battery_critical_shutdown,
+                      screen_w // 2 - 64, screen_h // 2 - 64)
+        shutdown_at = time.time() + SHUTDOWN_DELAY
 
     # Decide if battery icon should be "always" visible
-    try:
-        charging = is_charging()
-    except Exception:
-        charging = False
-
     # Conditions where battery should stay on:
     #  - red level while discharging (alert_red) - always visible
     #  - START button held
@@ -432,8 +640,7 @@ def battery(force=False):
 
     visible = always_on or (time.time() < battery_visible_until)
 
-    y_pos = 0 if osd_position == 'top' else int(resolution[1]) - dpi - 8
-    x_bat = int(resolution[0]) - dpi
+    y_pos = hud_y.get(osd_position, hud_y['bottom'])
     icon = f"ic_battery_{level_icon}_white_{dpi}dp.png"
 
     if visible:
@@ -447,21 +654,46 @@ def battery(force=False):
 
     return level_icon, value_v
 
+def maybe_power_off():
+    """Power off once the critical-battery grace period has run out."""
+    global shutdown_at
+    if shutdown_at is None or time.time() < shutdown_at:
+        return
+    # Leave nothing half-written on the SD card
+    save_config()
+    for handler in my_logger.handlers:
+        handler.flush()
+    subprocess.Popen(["sudo", "poweroff"])
+    # If poweroff didn't happen, battery() warns and re-arms on a later tick
+    shutdown_at = None
+
+# Socket used only to ask the kernel for wlan0's address
+_ifaddr_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+def wlan_has_ipv4() -> bool:
+    """True if wlan0 has an IPv4 address and isn't down (what `ip addr` showed)."""
+    try:
+        fcntl.ioctl(_ifaddr_sock.fileno(), SIOCGIFADDR, struct.pack("256s", b"wlan0"))
+    except OSError:
+        return False                # no address, or no such interface
+    try:
+        with open(wifi_operstate) as f:
+            return f.read().strip() != "down"
+    except IOError:
+        return False
+
 def wifi(force=False):
     global wifi_state, wifi_visible_until, wifi_always_visible
 
     st_new = InterfaceState.DISABLED
     try:
-        # First check if wlan0 even exists (avoid subprocess if not)
+        # First check if wlan0 even exists
         if not os.path.exists('/sys/class/net/wlan0'):
             st_new = InterfaceState.DISABLED
         else:
-            # Check for actual IP address (more reliable than carrier file)
-            ip_out = subprocess.check_output(['ip', 'addr', 'show', 'wlan0'], 
-                                             timeout=2, stderr=subprocess.DEVNULL).decode()
-            has_ip = 'inet ' in ip_out and 'DOWN' not in ip_out
-            
-            if has_ip:
+            # Check for actual IP address (more reliable than carrier file),
+            # asking the kernel directly rather than forking `ip addr`
+            if wlan_has_ipv4():
                 st_new = InterfaceState.CONNECTED
             else:
                 # Check if interface is up but no IP (enabled but not connected)
@@ -485,8 +717,7 @@ def wifi(force=False):
         elif prev_state == InterfaceState.CONNECTED and st_new != InterfaceState.CONNECTED:
             wifi_visible_until = time.time() + 5.0
 
-    y_pos = 0 if osd_position == 'top' else int(resolution[1]) - dpi - 8
-    x_wifi = int(resolution[0]) - dpi*2
+    y_pos = hud_y.get(osd_position, hud_y['bottom'])
     key  = ("connected" if st_new == InterfaceState.CONNECTED else
             "enabled"   if st_new == InterfaceState.ENABLED    else
             "disabled")
@@ -521,14 +752,35 @@ def bluetooth(force=False):
     bt_state = st_new
     return st_new
 
+# Throttle state rarely changes; when vcgencmd has to be forked for it,
+# the result is reused for a few seconds
+ENV_CMD_INTERVAL = 5.0
+use_throttled_file = os.path.exists(throttled_file)
+_env_cmd_val = 0
+_env_cmd_at = 0.0
+
+def read_throttled() -> int:
+    global use_throttled_file, _env_cmd_val, _env_cmd_at
+    if use_throttled_file:
+        try:
+            with open(throttled_file) as f:
+                return int(f.read().strip(), 16)
+        except (OSError, ValueError) as e:
+            my_logger.warning(f"{throttled_file} unreadable, using vcgencmd: {e}")
+            use_throttled_file = False
+    now = time.time()
+    if now - _env_cmd_at >= ENV_CMD_INTERVAL:
+        _env_cmd_val = int(throttled_re.search(
+            subprocess.check_output(env_cmd.split()).decode()).group(), 16)
+        _env_cmd_at = now
+    return _env_cmd_val
+
 def environment():
-    val = int(re.search(r"0x[\da-f]+",
-                        subprocess.check_output(env_cmd.split()).decode()).group(), 16)
+    val = read_throttled()
     flags = {"under-voltage": bool(val & 0x01),
              "freq-capped":   bool(val & 0x02),
              "throttled":     bool(val & 0x04)}
-    y_pos = 0 if osd_position == 'top' else int(resolution[1]) - dpi - 8
-    x_env_base = int(resolution[0]) - dpi * 4
+    y_pos = hud_y.get(osd_position, hud_y['bottom'])
     for idx,(k,v) in enumerate(flags.items()):
         if v and k not in overlay_processes:
             x_env = x_env_base - idx * dpi
@@ -550,22 +802,39 @@ def _background_update_check():
 # ───────────────────────────────────────────────────────────────
 def find_pad_device(timeout_sec: float = 10.0) -> InputDevice:
     """Return a joystick-like /dev/input device, waiting timeout_sec if needed."""
+    global pad_path
     deadline = time.time() + timeout_sec
+    not_pads = set()                              # opened once and didn't match
     while time.time() < deadline:
-        for path in list_devices():
-            dev = InputDevice(path)
-            if any(kw in dev.name.lower() for kw in NAME_KEYWORDS):
-
-                # non blocking for old or new evdev
-                if hasattr(dev, "set_nonblocking"):
-                    dev.set_nonblocking(True)
-                else:                             # evdev < 1.6
-                    flags = fcntl.fcntl(dev.fd, fcntl.F_GETFL)
-                    fcntl.fcntl(dev.fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
-                return dev
+        paths = [p for p in list_devices() if p not in not_pads]
+        if pad_path in paths:                     # usually the same node as last boot
+            paths.remove(pad_path)
+            paths.insert(0, pad_path)
+        for path in paths:
+            try:
+                dev = InputDevice(path)
+            except OSError:
+                continue                          # node went away since listing
+            if not any(kw in dev.name.lower() for kw in NAME_KEYWORDS):
+                dev.close()                       # don't hold fds of other devices
+                not_pads.add(path)
+                continue
+
+            if path != pad_path:
+                pad_path = path
+                mark_config_dirty()
+
+            # non blocking for old or new evdev
+            if hasattr(dev, "set_nonblocking"):
+                dev.set_nonblocking(True)
+            else:                                 # evdev < 1.6
+                flags = fcntl.fcntl(dev.fd, fcntl.F_GETFL)
+                fcntl.fcntl(dev.fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+            return dev
         time.sleep(0.2)                           # wait and retry
     raise RuntimeError("Timed out waiting for a game-pad input device")
 
+load_and_apply_config()     # before the pad lookup, which starts at the saved path
 pad = find_pad_device()
 
 # repeat handling for volume buttons
@@ -575,9 +844,10 @@ repeat_last_time = 0.0
 repeat_initial_delay = 0.5  # seconds before auto-repeat
 repeat_interval = 0.2       # seconds between repeats (was 0.1)
 repeat_step = 2             # percent per repeat
-last_status_log = 0         # timestamp for periodic status logs
-
-load_and_apply_config()
+last_status_log = 0         # timestamp of the last status step
+STATUS_STEP = 0.25          # battery, wifi, env and config each get one step per second
+status_phase = 0
+status_force = False
 
 # Wait for EmulationStation to be running before starting overlays
 # This prevents framebuffer conflicts that cause glitchy/corrupt display
@@ -652,7 +922,7 @@ try:
                                 delta = -repeat_step
                                 pct = vol_change(delta)
                                 show_volume_osd(pct, position=osd_position)
-                                save_config()
+                                mark_config_dirty()
                                 repeat_direction = -1
                                 repeat_start_time = time.time()
                                 repeat_last_time = repeat_start_time
@@ -660,7 +930,7 @@ try:
                                 delta = repeat_step
                                 pct = vol_change(delta)
                                 show_volume_osd(pct, position=osd_position)
-                                save_config()
+                                mark_config_dirty()
                                 repeat_direction = 1
                                 repeat_start_time = time.time()
                                 repeat_last_time = repeat_start_time
@@ -673,7 +943,7 @@ try:
                         if prev_abs_y != ev.value:
                             if ev.value == -1:  # up pressed
                                 osd_position = 'top'
-                                save_config()
+                                mark_config_dirty()
                                 pct = vol_get()
                                 show_volume_osd(pct, position=osd_position)
 
@@ -689,7 +959,7 @@ try:
 
                             elif ev.value == 1:  # down pressed
                                 osd_position = 'bottom'
-                                save_config()
+                                mark_config_dirty()
                                 pct = vol_get()
                                 show_volume_osd(pct, position=osd_position)
 
@@ -740,28 +1010,54 @@ try:
             if now - repeat_start_time >= repeat_initial_delay and now - repeat_last_time >= repeat_interval:
                 pct = vol_change(repeat_direction * repeat_step)
                 show_volume_osd(pct, position=osd_position)
-                save_config()
+                mark_config_dirty()
                 repeat_last_time = now
 
-        # 2. Periodic overlay updates (1 Hz)
-        if now - last_status_log >= 1.0:
-            force_update = False
-            if osd_position != last_osd_position:
-                force_update = True
-                last_osd_position = osd_position
-            bat_icon, v = battery(force=force_update)
-            wst = wifi(force=force_update)
-            if not update_check_started and wst == InterfaceState.CONNECTED:
-                update_check_started = True
-                threading.Thread(target=_background_update_check, daemon=True).start()
-            env_val = environment()  # env overlays always update as before
+        # 2. Periodic overlay updates (1 Hz each), staggered so the checks
+        #    and any pngview respawns don't all land in the same iteration
+        if now - last_status_log >= STATUS_STEP:
+            if status_phase == 0:
+                status_force = False
+                if osd_position != last_osd_position:
+                    status_force = True
+                    last_osd_position = osd_position
+                bat_icon, v = battery(force=status_force)
+            elif status_phase == 1:
+                wst = wifi(force=status_force)
+                if not update_check_started and wst == InterfaceState.CONNECTED:
+                    update_check_started = True
+                    threading.Thread(target=_background_update_check, daemon=True).start()
+            elif status_phase == 2:
+                env_val = environment()  # env overlays always update as before
+            elif config_dirty and now - config_changed_at >= CONFIG_SAVE_DELAY:
+                config_dirty = False
+                save_config()
+            status_phase = (status_phase + 1) % 4
             last_status_log = now
 
-        # 3. Clear volume OSD if time elapsed
+        # 3. Clear volume OSD and update notice if time elapsed
         maybe_clear_volume_osd()
-
-        time.sleep(0.01)  # tiny sleep keeps CPU usage civil
+        maybe_clear_update_notice()
+        maybe_power_off()
+
+        # 4. Sleep until the pad has input or the next timed job is due
+        deadlines = [last_status_log + STATUS_STEP]
+        if "vol" in overlay_processes:
+            deadlines.append(vol_osd_until)
+        if "update" in overlay_processes:
+            deadlines.append(update_notice_until)
+        if shutdown_at is not None:
+            deadlines.append(shutdown_at)
+        if start_held and start_pressed_at is not None and not start_hud_shown:
+            deadlines.append(start_pressed_at + 1.0)
+        if start_held and repeat_direction != 0:
+            deadlines.append(max(repeat_start_time + repeat_initial_delay,
+                                 repeat_last_time + repeat_interval))
+        timeout = max(0.0, min(deadlines) - time.time())
+        select.select([pad.fd], [], [], timeout)
 except KeyboardInterrupt:
+    if config_dirty:
+        save_config()
     for p in overlay_processes.values():
         p.kill()
     raise
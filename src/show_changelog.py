@@ -5,6 +5,8 @@ Reads a CHANGELOG.md file and displays it in a smooth scrolling UI.
 """
 import os
 import sys
+import hashlib
+import functools
 import pygame
 from pygame.locals import *
 
@@ -12,6 +14,7 @@ SCREEN_WIDTH, SCREEN_HEIGHT = 480, 480
 FONT_SIZE = 44
 TITLE_FONT_SIZE = 56
 CHANGELOG_PATH = '/home/pi/gamebird-os/CHANGELOG.md'
+RENDER_CACHE_DIR = '/tmp'   # rendered changelog PNGs, keyed by file and layout
 
 # Colors (matching nest-frontend style)
 BG_COLOR = (20, 24, 40)
@@ -30,12 +33,29 @@ BTN_R      = 2
 BTN_SELECT = 6
 BTN_START  = 7
 
+# Buttons and keys that map straight to an action
+BUTTON_ACTIONS = {BTN_A: "A", BTN_B: "B", BTN_L: "L", BTN_R: "R",
+                  BTN_START: "START", BTN_SELECT: "SELECT"}
+KEY_ACTIONS = {K_UP: "UP", K_DOWN: "DOWN", K_PAGEUP: "L", K_PAGEDOWN: "R",
+               K_ESCAPE: "B", K_a: "B", K_q: "QUIT"}
+KEY_RELEASES = {K_UP: "UP", K_DOWN: "DOWN"}
+# D-pad hat value -> direction; any other value releases UP/DOWN
+HAT_ACTIONS = {(-1, 1): "UP", (0, 1): "UP", (1, 1): "UP",
+               (-1, -1): "DOWN", (0, -1): "DOWN", (1, -1): "DOWN"}
+
 # Scroll settings
 SCROLL_SPEED = 8        # pixels per input
 SCROLL_FAST = 40        # pixels for L/R page scroll
 MARGIN_X = 20
 MARGIN_Y = 50
 CONTENT_HEIGHT = SCREEN_HEIGHT - MARGIN_Y - 30
+# Markdown line prefix (everything up to the first space) -> style
+LINE_PREFIXES = {"# ": "h1", "## ": "h2", "### ": "h3", "- ": "bullet"}
+IDLE_WAIT_MS = 1000     # longest sleep waiting for input when nothing is held
+CONTENT_RECT = pygame.Rect(MARGIN_X, MARGIN_Y, SCREEN_WIDTH - MARGIN_X * 2, CONTENT_HEIGHT)
+SCROLLBAR_RECT = pygame.Rect(SCREEN_WIDTH - 12, MARGIN_Y, 6, CONTENT_HEIGHT)
+# Everything below the title bar; the only part that changes when scrolling
+SCROLL_REGION = pygame.Rect(0, MARGIN_Y, SCREEN_WIDTH, SCREEN_HEIGHT - MARGIN_Y)
 
 
 class InputManager:
@@ -47,45 +67,52 @@ class InputManager:
         else:
             self.joy = None
         self.held_directions = set()
+        self._actions = []      # reused by every get_events call
+        self._axis_zones = {}   # axis -> -1/0/1 zone of its last reported value
 
-    def get_events(self):
-        actions = []
-        for event in pygame.event.get():
+    def get_events(self, wait_ms=0):
+        """
+        Translate queued events to actions, blocking up to wait_ms for the first one.
+        The returned list is reused, so it is only valid until the next call.
+        """
+        events = pygame.event.get()
+        if not events and wait_ms:
+            event = pygame.event.wait(wait_ms)
+            if event.type != NOEVENT:
+                events = [event] + pygame.event.get()
+        
+        actions = self._actions
+        actions.clear()
+        for event in events:
             if event.type == QUIT:
                 actions.append("QUIT")
 
             elif event.type == JOYBUTTONDOWN:
-                if event.button == BTN_A:
-                    actions.append("A")
-                elif event.button == BTN_B:
-                    actions.append("B")
-                elif event.button == BTN_L:
-                    actions.append("L")
-                elif event.button == BTN_R:
-                    actions.append("R")
-                elif event.button == BTN_START:
-                    actions.append("START")
-                elif event.button == BTN_SELECT:
-                    actions.append("SELECT")
+                action = BUTTON_ACTIONS.get(event.button)
+                if action:
+                    actions.append(action)
 
             elif event.type == JOYHATMOTION:
-                dx, dy = event.value
-                if dy == 1:
-                    actions.append("UP")
-                    self.held_directions.add("UP")
-                elif dy == -1:
-                    actions.append("DOWN")
-                    self.held_directions.add("DOWN")
+                action = HAT_ACTIONS.get(event.value)
+                if action:
+                    actions.append(action)
+                    self.held_directions.add(action)
                 else:
                     self.held_directions.discard("UP")
                     self.held_directions.discard("DOWN")
 
             elif event.type == JOYAXISMOTION:
+                # Only crossing into another zone matters; stick jitter is dropped here
+                zone = -1 if event.value < -0.5 else (1 if event.value > 0.5 else 0)
+                if self._axis_zones.get(event.axis) == zone:
+                    continue
+                self._axis_zones[event.axis] = zone
+                
                 if event.axis == 1:  # Vertical
-                    if event.value < -0.5:
+                    if zone < 0:
                         actions.append("UP")
                         self.held_directions.add("UP")
-                    elif event.value > 0.5:
+                    elif zone > 0:
                         actions.append("DOWN")
                         self.held_directions.add("DOWN")
                     else:
@@ -93,26 +120,15 @@ class InputManager:
                         self.held_directions.discard("DOWN")
 
             elif event.type == KEYDOWN:
-                if event.key == K_UP:
-                    actions.append("UP")
-                    self.held_directions.add("UP")
-                elif event.key == K_DOWN:
-                    actions.append("DOWN")
-                    self.held_directions.add("DOWN")
-                elif event.key == K_PAGEUP:
-                    actions.append("L")
-                elif event.key == K_PAGEDOWN:
-                    actions.append("R")
-                elif event.key == K_ESCAPE or event.key == K_a:
-                    actions.append("B")
-                elif event.key == K_q:
-                    actions.append("QUIT")
+                action = KEY_ACTIONS.get(event.key)
+                if action:
+                    actions.append(action)
+                    if action == "UP" or action == "DOWN":
+                        self.held_directions.add(action)
 
             elif event.type == KEYUP:
-                if event.key == K_UP:
-                    self.held_directions.discard("UP")
-                elif event.key == K_DOWN:
-                    self.held_directions.discard("DOWN")
+                if event.key in KEY_RELEASES:
+                    self.held_directions.discard(KEY_RELEASES[event.key])
 
         return actions
 
@@ -158,14 +174,12 @@ def read_changelog():
     with open(CHANGELOG_PATH, "r") as f:
         for line in f:
             text = line.rstrip()
-            if text.startswith("# "):
-                lines.append((text[2:], "h1"))
-            elif text.startswith("## "):
-                lines.append((text[3:], "h2"))
-            elif text.startswith("### "):
-                lines.append((text[4:], "h3"))
-            elif text.startswith("- "):
-                lines.append(("• " + text[2:], "bullet"))
+            space = text.find(" ", 0, 4)
+            style = LINE_PREFIXES.get(text[:space + 1]) if space >= 0 else None
+            if style == "bullet":
+                lines.append(("• " + text[2:], style))
+            elif style:
+                lines.append((text[space + 1:], style))
             elif text.strip():
                 lines.append((text, "text"))
             else:
@@ -173,125 +187,197 @@ def read_changelog():
     return lines
 
 
-def render_changelog_surface(lines, font, title_font, width):
-    """Pre-render the entire changelog to a surface for smooth scrolling."""
+def layout_changelog(lines, font, title_font, width):
+    """
+    Word-wrap and place every changelog line.
+    Returns (placements, total_height); placements are (font, text, color, x, y).
+    """
     line_height = font.get_linesize() + 4
     title_height = title_font.get_linesize() + 8
     
-    # Calculate total height with word wrapping
-    total_height = 20  # top padding
+    placements = []
+    y = 20  # top padding
     for text, style in lines:
         if style == "h1":
-            wrapped = wrap_text(text, title_font, width)
-            total_height += title_height * len(wrapped)
-        elif style == "h2":
-            wrapped = wrap_text(text, title_font, width)
-            total_height += title_height * len(wrapped)
-        elif style == "blank":
-            total_height += line_height // 2
-        elif style == "bullet":
-            # Bullet text wraps with indent
-            wrapped = wrap_text(text, font, width - 20)
-            total_height += line_height * len(wrapped)
-        else:
-            wrapped = wrap_text(text, font, width)
-            total_height += line_height * len(wrapped)
-    total_height += 40  # bottom padding
-    
-    # Create surface
-    surface = pygame.Surface((width, total_height), pygame.SRCALPHA)
-    surface.fill((0, 0, 0, 0))
-    
-    y = 20
-    for text, style in lines:
-        if style == "h1":
-            wrapped = wrap_text(text, title_font, width)
-            for line in wrapped:
-                surf = title_font.render(line, True, HEADER_COLOR)
-                surface.blit(surf, (0, y))
+            for line in wrap_text(text, title_font, width):
+                placements.append((title_font, line, HEADER_COLOR, 0, y))
                 y += title_height
         elif style == "h2":
-            wrapped = wrap_text(text, title_font, width)
-            for line in wrapped:
-                surf = title_font.render(line, True, ACCENT_COLOR)
-                surface.blit(surf, (0, y))
+            for line in wrap_text(text, title_font, width):
+                placements.append((title_font, line, ACCENT_COLOR, 0, y))
                 y += title_height
         elif style == "h3":
-            wrapped = wrap_text(text, font, width - 10)
-            for line in wrapped:
-                surf = font.render(line, True, HEADER_COLOR)
-                surface.blit(surf, (10, y))
+            for line in wrap_text(text, font, width - 10):
+                placements.append((font, line, HEADER_COLOR, 10, y))
                 y += line_height
         elif style == "bullet":
-            wrapped = wrap_text(text, font, width - 20)
-            for i, line in enumerate(wrapped):
-                surf = font.render(line, True, TEXT_COLOR)
+            # Bullet text wraps with indent
+            for i, line in enumerate(wrap_text(text, font, width - 20)):
                 # First line at normal indent, continuation lines indented more
                 x_offset = 20 if i == 0 else 36
-                surface.blit(surf, (x_offset, y))
+                placements.append((font, line, TEXT_COLOR, x_offset, y))
                 y += line_height
         elif style == "blank":
             y += line_height // 2
         else:
-            wrapped = wrap_text(text, font, width)
-            for line in wrapped:
-                surf = font.render(line, True, TEXT_COLOR)
-                surface.blit(surf, (0, y))
+            for line in wrap_text(text, font, width):
+                placements.append((font, line, TEXT_COLOR, 0, y))
                 y += line_height
+    return placements, y + 40  # bottom padding
+
+
+def render_changelog_surface(lines, font, title_font, width):
+    """Pre-render the entire changelog to a surface for smooth scrolling."""
+    # Wrap once; the same layout gives both the surface height and positions
+    placements, total_height = layout_changelog(lines, font, title_font, width)
+    
+    # Create surface
+    surface = pygame.Surface((width, total_height), pygame.SRCALPHA)
+    surface.fill((0, 0, 0, 0))
+    surface.blits([(f.render(text, True, color), (x, y))
+                   for f, text, color, x, y in placements], doreturn=False)
+    return surface
+
+
+def render_cache_path(width):
+    """
+    PNG path for the rendered changelog, or None without a changelog.
+    The key covers the file's mtime and size plus everything that affects layout.
+    """
+    try:
+        st = os.stat(CHANGELOG_PATH)
+    except OSError:
+        return None
+    key = f"{st.st_mtime_ns}:{st.st_size}:{width}:{FONT_SIZE}:{TITLE_FONT_SIZE}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return os.path.join(RENDER_CACHE_DIR, f"changelog_{digest}.png")
+
+
+def load_changelog_surface(font, title_font, width):
+    """Load the rendered changelog from the cache, rendering and saving it on a miss."""
+    cache_path = render_cache_path(width)
+    if cache_path and os.path.exists(cache_path):
+        try:
+            return pygame.image.load(cache_path).convert_alpha()
+        except pygame.error:
+            pass                            # unreadable; render it again
     
+    surface = render_changelog_surface(read_changelog(), font, title_font, width).convert_alpha()
+    if cache_path:
+        tmp_path = cache_path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pygame.image.save(surface, f, "png")
+            os.replace(tmp_path, cache_path)
+        except (OSError, pygame.error) as e:
+            print(f"Could not cache rendered changelog: {e}", file=sys.stderr)
     return surface
 
 
-def draw_screen(screen, content_surface, scroll_y, font):
-    """Draw the changelog viewer screen."""
-    screen.fill(BG_COLOR)
+def render_chrome(font):
+    """
+    Render the parts of the screen that don't scroll, once.
+    Returns (background, hint, band): the background with title bar, the
+    hint bar text, which is drawn over the bottom edge of the content, and
+    the part of the content area with nothing but content over plain
+    background, which draw_screen can scroll in place.
+    """
+    background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    background.fill(BG_COLOR)
     
     # Draw title bar
     title_text = "Change Log"
     title_surf = font.render(title_text, True, TEXT_COLOR)
-    screen.blit(title_surf, (MARGIN_X, 10))
+    background.blit(title_surf, (MARGIN_X, 10))
     
     # Draw separator line (below title)
     sep_y = 10 + title_surf.get_height() + 6
-    pygame.draw.line(screen, DIM_COLOR, (MARGIN_X, sep_y), (SCREEN_WIDTH - MARGIN_X, sep_y), 1)
+    pygame.draw.line(background, DIM_COLOR, (MARGIN_X, sep_y), (SCREEN_WIDTH - MARGIN_X, sep_y), 1)
     
-    # Create clipping rect for content area
-    content_rect = pygame.Rect(MARGIN_X, MARGIN_Y, SCREEN_WIDTH - MARGIN_X * 2, CONTENT_HEIGHT)
+    hint_font = pygame.font.Font(None, 36)
+    hint_text = "↑↓ Scroll   L/R Page   B Back"
+    # Match the display's pixel format so the per-scroll blits need no conversion
+    hint = hint_font.render(hint_text, True, DIM_COLOR).convert_alpha()
+    
+    hint_line_y = SCREEN_HEIGHT - hint.get_height() - 16
+    band_top = max(CONTENT_RECT.top, sep_y + 1)
+    band_bottom = min(CONTENT_RECT.bottom, hint_line_y)
+    band = pygame.Rect(CONTENT_RECT.left, band_top, CONTENT_RECT.width, max(0, band_bottom - band_top))
+    return background, hint, band
+
+
+@functools.lru_cache(maxsize=None)
+def scrollbar_metrics(content_height):
+    """(max_scroll, thumb_height) for content of this height; they only change with the content."""
+    max_scroll = max(0, content_height - CONTENT_HEIGHT)
+    thumb_height = max(20, int(SCROLLBAR_RECT.height * (CONTENT_HEIGHT / content_height)))
+    return max_scroll, thumb_height
+
+
+def _draw_area(screen, chrome, content_surface, scroll_y, area):
+    """Draw everything below the title bar, limited to area."""
+    background, hint_surf, _ = chrome
+    screen.set_clip(area)
+    screen.blit(background, area, area)
     
     # Blit the content surface with scroll offset
-    screen.set_clip(content_rect)
+    screen.set_clip(CONTENT_RECT.clip(area))
     screen.blit(content_surface, (MARGIN_X, MARGIN_Y - scroll_y))
-    screen.set_clip(None)
+    screen.set_clip(area)
     
-    # Draw scroll indicators
-    max_scroll = max(0, content_surface.get_height() - CONTENT_HEIGHT)
-    if max_scroll > 0:
+    # Draw scroll indicators (none when everything fits)
+    max_scroll, thumb_height = scrollbar_metrics(content_surface.get_height())
+    if max_scroll > 0 and SCROLLBAR_RECT.colliderect(area):
         # Scrollbar track
-        track_x = SCREEN_WIDTH - 12
-        track_y = MARGIN_Y
-        track_height = CONTENT_HEIGHT
-        pygame.draw.rect(screen, (40, 44, 60), (track_x, track_y, 6, track_height), border_radius=3)
+        pygame.draw.rect(screen, (40, 44, 60), SCROLLBAR_RECT, border_radius=3)
         
         # Scrollbar thumb
-        thumb_height = max(20, int(track_height * (CONTENT_HEIGHT / content_surface.get_height())))
-        thumb_y = track_y + int((track_height - thumb_height) * (scroll_y / max_scroll)) if max_scroll > 0 else track_y
-        pygame.draw.rect(screen, HEADER_COLOR, (track_x, thumb_y, 6, thumb_height), border_radius=3)
+        thumb_y = SCROLLBAR_RECT.y + int((SCROLLBAR_RECT.height - thumb_height) * (scroll_y / max_scroll))
+        pygame.draw.rect(screen, HEADER_COLOR, (SCROLLBAR_RECT.x, thumb_y, SCROLLBAR_RECT.width, thumb_height), border_radius=3)
     
     # Draw hint bar at bottom
-    hint_font = pygame.font.Font(None, 36)
-    hint_text = "↑↓ Scroll   L/R Page   B Back"
-    hint_surf = hint_font.render(hint_text, True, DIM_COLOR)
     hint_y = SCREEN_HEIGHT - hint_surf.get_height() - 8
     pygame.draw.line(screen, DIM_COLOR, (MARGIN_X, hint_y - 8), (SCREEN_WIDTH - MARGIN_X, hint_y - 8), 1)
     screen.blit(hint_surf, ((SCREEN_WIDTH - hint_surf.get_width()) // 2, hint_y))
+    screen.set_clip(None)
+
+
+def draw_screen(screen, chrome, content_surface, scroll_y, drawn_scroll=None):
+    """
+    Draw the scrolled part of the changelog viewer; returns the rect that changed.
+    drawn_scroll is the position currently on screen; for small steps the
+    content already there is moved with Surface.scroll and only the newly
+    exposed strip and the fixed overlays around it are drawn.
+    """
+    band = chrome[2]
+    delta = 0 if drawn_scroll is None else scroll_y - drawn_scroll
+    if not delta or abs(delta) >= band.height:
+        _draw_area(screen, chrome, content_surface, scroll_y, SCROLL_REGION)
+        return SCROLL_REGION
     
-    pygame.display.flip()
+    screen.set_clip(band)
+    screen.scroll(0, -delta)
+    screen.set_clip(None)
+    if delta > 0:
+        exposed = pygame.Rect(band.left, band.bottom - delta, band.width, delta)
+    else:
+        exposed = pygame.Rect(band.left, band.top, band.width, -delta)
+    for area in (exposed,
+                 pygame.Rect(0, MARGIN_Y, SCREEN_WIDTH, band.top - MARGIN_Y),
+                 pygame.Rect(0, band.bottom, SCREEN_WIDTH, SCREEN_HEIGHT - band.bottom),
+                 pygame.Rect(band.right, band.top, SCREEN_WIDTH - band.right, band.height)):
+        _draw_area(screen, chrome, content_surface, scroll_y, area)
+    return SCROLL_REGION
 
 
 def main():
     pygame.init()
     pygame.joystick.init()
     pygame.mouse.set_visible(False)
+    # Drop everything InputManager ignores before it reaches the queue, so
+    # mouse/window events don't wake the idle event wait
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([QUIT, KEYDOWN, KEYUP, JOYBUTTONDOWN, JOYAXISMOTION, JOYHATMOTION])
 
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Change Log")
@@ -301,20 +387,29 @@ def main():
     
     input_mgr = InputManager()
     
-    # Load and render changelog
-    lines = read_changelog()
+    # Load and render changelog (from the render cache when unchanged)
     content_width = SCREEN_WIDTH - MARGIN_X * 2 - 20  # leave room for scrollbar
-    content_surface = render_changelog_surface(lines, font, title_font, content_width)
+    content_surface = load_changelog_surface(font, title_font, content_width)
+    chrome = render_chrome(title_font)
     
     scroll_y = 0
     max_scroll = max(0, content_surface.get_height() - CONTENT_HEIGHT)
     
+    # First frame shows everything; after that only the scrolled region
+    # is redrawn, and only when the scroll position moved
+    screen.blit(chrome[0], (0, 0))
+    draw_screen(screen, chrome, content_surface, scroll_y)
+    pygame.display.flip()
+    drawn_scroll = scroll_y
+    
     clock = pygame.time.Clock()
     running = True
     hold_timer = 0
 
     while running:
-        actions = input_mgr.get_events()
+        # Sleep until input arrives, unless a held direction is still scrolling
+        holding = bool(input_mgr.held_directions)
+        actions = input_mgr.get_events(0 if holding else IDLE_WAIT_MS)
         
         for action in actions:
             if action == "QUIT":
@@ -346,8 +441,11 @@ def main():
         if input_mgr.is_select_start_held():
             running = False
         
-        draw_screen(screen, content_surface, scroll_y, title_font)
-        clock.tick(60)
+        if scroll_y != drawn_scroll:
+            pygame.display.update(draw_screen(screen, chrome, content_surface, scroll_y, drawn_scroll))
+            drawn_scroll = scroll_y
+        if input_mgr.held_directions:
+            clock.tick(60)      # hold-to-scroll speed is counted in frames
 
     pygame.quit()
 
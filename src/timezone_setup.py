@@ -6,6 +6,7 @@ Allows setting timezone from a list, and manual time entry when WiFi is disconne
 import os
 import sys
 import subprocess
+from datetime import datetime
 import pygame
 from pygame.locals import *
 
@@ -30,6 +31,17 @@ BTN_R = 2
 BTN_SELECT = 6
 BTN_START = 7
 
+# Buttons and keys that map straight to an action
+BUTTON_ACTIONS = {BTN_A: "A", BTN_B: "B", BTN_L: "L", BTN_R: "R",
+                  BTN_START: "START", BTN_SELECT: "SELECT", BTN_X: "X", BTN_Y: "Y"}
+KEY_ACTIONS = {K_UP: "UP", K_DOWN: "DOWN", K_LEFT: "LEFT", K_RIGHT: "RIGHT",
+               K_RETURN: "A", K_z: "A", K_ESCAPE: "B", K_x: "B",
+               K_t: "X", K_s: "START", K_q: "QUIT"}
+# D-pad hat value -> direction (vertical wins on diagonals); (0, 0) releases all
+HAT_ACTIONS = {(-1, 1): "UP", (0, 1): "UP", (1, 1): "UP",
+               (-1, -1): "DOWN", (0, -1): "DOWN", (1, -1): "DOWN",
+               (-1, 0): "LEFT", (1, 0): "RIGHT"}
+
 # Common timezones (grouped by region for easier navigation)
 TIMEZONES = [
     # US
@@ -75,12 +87,17 @@ TIMEZONES = [
     # UTC
     "UTC",
 ]
+TIMEZONE_INDEX = {tz: i for i, tz in enumerate(TIMEZONES)}
 
 # UI Constants
 MARGIN_X = 20
 MARGIN_Y = 80
 ITEM_HEIGHT = 44
 VISIBLE_ITEMS = 8
+WIFI_CHECK_MS = 1000  # how often the WiFi status line is refreshed
+# Manual time edit fields, left to right
+TIME_FIELD_LABELS = ["Year", "Month", "Day", "Hour", "Minute"]
+TIME_FIELD_X = [60, 150, 230, 320, 410]
 
 
 class InputManager:
@@ -92,45 +109,27 @@ class InputManager:
         else:
             self.joy = None
         self.held_directions = set()
+        self._actions = []      # reused by every get_events call
+        self._axis_zones = {}   # axis -> -1/0/1 zone of its last reported value
 
     def get_events(self):
-        actions = []
+        """Translate queued events to actions; the list is only valid until the next call."""
+        actions = self._actions
+        actions.clear()
         for event in pygame.event.get():
             if event.type == QUIT:
                 actions.append("QUIT")
 
             elif event.type == JOYBUTTONDOWN:
-                if event.button == BTN_A:
-                    actions.append("A")
-                elif event.button == BTN_B:
-                    actions.append("B")
-                elif event.button == BTN_L:
-                    actions.append("L")
-                elif event.button == BTN_R:
-                    actions.append("R")
-                elif event.button == BTN_START:
-                    actions.append("START")
-                elif event.button == BTN_SELECT:
-                    actions.append("SELECT")
-                elif event.button == BTN_X:
-                    actions.append("X")
-                elif event.button == BTN_Y:
-                    actions.append("Y")
+                action = BUTTON_ACTIONS.get(event.button)
+                if action:
+                    actions.append(action)
 
             elif event.type == JOYHATMOTION:
-                dx, dy = event.value
-                if dy == 1:
-                    actions.append("UP")
-                    self.held_directions.add("UP")
-                elif dy == -1:
-                    actions.append("DOWN")
-                    self.held_directions.add("DOWN")
-                elif dx == -1:
-                    actions.append("LEFT")
-                    self.held_directions.add("LEFT")
-                elif dx == 1:
-                    actions.append("RIGHT")
-                    self.held_directions.add("RIGHT")
+                action = HAT_ACTIONS.get(event.value)
+                if action:
+                    actions.append(action)
+                    self.held_directions.add(action)
                 else:
                     self.held_directions.discard("UP")
                     self.held_directions.discard("DOWN")
@@ -138,21 +137,27 @@ class InputManager:
                     self.held_directions.discard("RIGHT")
 
             elif event.type == JOYAXISMOTION:
+                # Only crossing into another zone matters; stick jitter is dropped here
+                zone = -1 if event.value < -0.5 else (1 if event.value > 0.5 else 0)
+                if self._axis_zones.get(event.axis) == zone:
+                    continue
+                self._axis_zones[event.axis] = zone
+                
                 if event.axis == 1:  # Vertical
-                    if event.value < -0.5:
+                    if zone < 0:
                         actions.append("UP")
                         self.held_directions.add("UP")
-                    elif event.value > 0.5:
+                    elif zone > 0:
                         actions.append("DOWN")
                         self.held_directions.add("DOWN")
                     else:
                         self.held_directions.discard("UP")
                         self.held_directions.discard("DOWN")
                 elif event.axis == 0:  # Horizontal
-                    if event.value < -0.5:
+                    if zone < 0:
                         actions.append("LEFT")
                         self.held_directions.add("LEFT")
-                    elif event.value > 0.5:
+                    elif zone > 0:
                         actions.append("RIGHT")
                         self.held_directions.add("RIGHT")
                     else:
@@ -160,24 +165,9 @@ class InputManager:
                         self.held_directions.discard("RIGHT")
 
             elif event.type == KEYDOWN:
-                if event.key == K_UP:
-                    actions.append("UP")
-                elif event.key == K_DOWN:
-                    actions.append("DOWN")
-                elif event.key == K_LEFT:
-                    actions.append("LEFT")
-                elif event.key == K_RIGHT:
-                    actions.append("RIGHT")
-                elif event.key == K_RETURN or event.key == K_z:
-                    actions.append("A")
-                elif event.key == K_ESCAPE or event.key == K_x:
-                    actions.append("B")
-                elif event.key == K_t:
-                    actions.append("X")
-                elif event.key == K_s:
-                    actions.append("START")
-                elif event.key == K_q:
-                    actions.append("QUIT")
+                action = KEY_ACTIONS.get(event.key)
+                if action:
+                    actions.append(action)
 
         return actions
 
@@ -206,12 +196,23 @@ def get_current_time():
         return "Unknown"
 
 
+CARRIER_PATH = "/sys/class/net/wlan0/carrier"
+_carrier_fd = None  # kept open between checks; reopened after any read error
+
+
 def is_wifi_connected():
     """Check if WiFi is connected."""
+    global _carrier_fd
     try:
-        with open("/sys/class/net/wlan0/carrier", "r") as f:
-            return f.read().strip() == "1"
-    except Exception:
+        if _carrier_fd is None:
+            _carrier_fd = os.open(CARRIER_PATH, os.O_RDONLY)
+        # sysfs regenerates the value on every read from offset 0
+        return os.pread(_carrier_fd, 2, 0).startswith(b"1")
+    except OSError:
+        # EINVAL while wlan0 is down, ENODEV once it has been removed
+        if _carrier_fd is not None:
+            os.close(_carrier_fd)
+            _carrier_fd = None
         return False
 
 
@@ -253,6 +254,9 @@ class TimezoneApp:
         pygame.init()
         pygame.joystick.init()
         pygame.mouse.set_visible(False)
+        # Only queue the events InputManager handles
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([QUIT, KEYDOWN, JOYBUTTONDOWN, JOYAXISMOTION, JOYHATMOTION])
         
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Timezone Setup")
@@ -260,6 +264,11 @@ class TimezoneApp:
         self.font = pygame.font.Font(None, 36)
         self.font_large = pygame.font.Font(None, 48)
         self.font_small = pygame.font.Font(None, 28)
+        # (font, text, color) -> rendered label; the screens only show a
+        # small fixed set of strings, so each is rendered once
+        self._text_cache = {}
+        self._preview = (None, None)  # (text, surface) of the last time-edit preview
+        self._build_backgrounds()
         
         self.input_mgr = InputManager()
         self.clock = pygame.time.Clock()
@@ -269,8 +278,8 @@ class TimezoneApp:
         self.scroll_offset = 0
         
         # Try to select current timezone in list
-        if self.current_tz in TIMEZONES:
-            self.selected_index = TIMEZONES.index(self.current_tz)
+        if self.current_tz in TIMEZONE_INDEX:
+            self.selected_index = TIMEZONE_INDEX[self.current_tz]
             self.scroll_offset = max(0, self.selected_index - VISIBLE_ITEMS // 2)
         
         # Time edit mode
@@ -278,33 +287,70 @@ class TimezoneApp:
         self.time_fields = [2025, 1, 1, 12, 0]  # year, month, day, hour, minute
         self.time_field_index = 0
         self.wifi_connected = is_wifi_connected()
+        self.next_wifi_check = pygame.time.get_ticks() + WIFI_CHECK_MS
         
         # Hold repeat
         self.hold_timer = 0
         
         self.running = True
+        # What the display currently shows; frames that would look the same are skipped
+        self._drawn_state = None
+
+    def render_text(self, font, text, color):
+        """Cached font.render for labels that repeat from frame to frame."""
+        key = (font, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = self._text_cache[key] = font.render(text, True, color).convert_alpha()
+        return surf
+
+    def _build_backgrounds(self):
+        """Pre-render the parts of each screen that never change, so a frame starts with one blit."""
+        self._list_bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._list_bg.fill(BG_COLOR)
+        header = self.render_text(self.font_large, "Timezone Setup", TEXT_COLOR)
+        self._list_bg.blit(header, (MARGIN_X, 15))
+        tz_label = self.render_text(self.font_small, "Current:", DIM_COLOR)
+        self._list_bg.blit(tz_label, (MARGIN_X, 55))
+        
+        self._edit_bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._edit_bg.fill(BG_COLOR)
+        header = self.render_text(self.font_large, "Set Time Manually", TEXT_COLOR)
+        self._edit_bg.blit(header, (MARGIN_X, 15))
+        pygame.draw.line(self._edit_bg, DIM_COLOR, (MARGIN_X, 55), (SCREEN_WIDTH - MARGIN_X, 55), 1)
+        for label, x in zip(TIME_FIELD_LABELS, TIME_FIELD_X):
+            label_surf = self.render_text(self.font_small, label, DIM_COLOR)
+            self._edit_bg.blit(label_surf, (x - label_surf.get_width() // 2, 100))
+        inst_y = 320
+        for i, text in enumerate(("LEFT/RIGHT: Select field", "UP/DOWN: Change value", "A: Apply time   B: Cancel")):
+            inst = self.render_text(self.font_small, text, DIM_COLOR)
+            self._edit_bg.blit(inst, ((SCREEN_WIDTH - inst.get_width()) // 2, inst_y + i * 30))
 
     def update_time_fields_from_system(self):
         """Update time fields from current system time."""
         try:
-            import datetime
-            now = datetime.datetime.now()
+            now = datetime.now()
             self.time_fields = [now.year, now.month, now.day, now.hour, now.minute]
         except Exception:
             pass
 
+    def _row_rect(self, index):
+        """Screen area of a visible list row, including its highlight."""
+        y = MARGIN_Y + (index - self.scroll_offset) * ITEM_HEIGHT
+        return pygame.Rect(0, y - 2, SCREEN_WIDTH, ITEM_HEIGHT)
+
     def draw_timezone_list(self):
         """Draw the timezone selection screen."""
-        self.screen.fill(BG_COLOR)
+        state = ("list", self.current_tz, self.scroll_offset, self.wifi_connected, self.selected_index)
+        drawn = self._drawn_state
+        if state == drawn:
+            return
         
-        # Header
-        header = self.font_large.render("Timezone Setup", True, TEXT_COLOR)
-        self.screen.blit(header, (MARGIN_X, 15))
+        # Background, header and "Current:" label
+        self.screen.blit(self._list_bg, (0, 0))
         
         # Current timezone display
-        tz_label = self.font_small.render("Current:", True, DIM_COLOR)
-        self.screen.blit(tz_label, (MARGIN_X, 55))
-        tz_value = self.font.render(self.current_tz, True, ACCENT_COLOR)
+        tz_value = self.render_text(self.font, self.current_tz, ACCENT_COLOR)
         self.screen.blit(tz_value, (MARGIN_X + 80, 52))
         
         # Separator
@@ -333,15 +379,15 @@ class TimezoneApp:
             
             # Draw timezone name (simplified display)
             display_name = tz.replace("_", " ")
-            text_surf = self.font.render(display_name, True, color)
+            text_surf = self.render_text(self.font, display_name, color)
             self.screen.blit(text_surf, (MARGIN_X + 10, y + 6))
         
         # Scroll indicators
         if self.scroll_offset > 0:
-            arrow_up = self.font.render("▲", True, DIM_COLOR)
+            arrow_up = self.render_text(self.font, "▲", DIM_COLOR)
             self.screen.blit(arrow_up, (SCREEN_WIDTH // 2 - 10, list_y - 20))
         if self.scroll_offset + VISIBLE_ITEMS < len(TIMEZONES):
-            arrow_down = self.font.render("▼", True, DIM_COLOR)
+            arrow_down = self.render_text(self.font, "▼", DIM_COLOR)
             self.screen.blit(arrow_down, (SCREEN_WIDTH // 2 - 10, list_y + VISIBLE_ITEMS * ITEM_HEIGHT))
         
         # Bottom hints
@@ -350,42 +396,37 @@ class TimezoneApp:
         
         wifi_status = "WiFi: Connected" if self.wifi_connected else "WiFi: Off"
         wifi_color = HEADER_COLOR if self.wifi_connected else ERROR_COLOR
-        wifi_surf = self.font_small.render(wifi_status, True, wifi_color)
+        wifi_surf = self.render_text(self.font_small, wifi_status, wifi_color)
         self.screen.blit(wifi_surf, (MARGIN_X, hint_y))
         
         if not self.wifi_connected:
             hint = "A Select  X Set Time  START Exit"
         else:
             hint = "A Select  START Exit"
-        hint_surf = self.font_small.render(hint, True, DIM_COLOR)
+        hint_surf = self.render_text(self.font_small, hint, DIM_COLOR)
         self.screen.blit(hint_surf, (SCREEN_WIDTH - hint_surf.get_width() - MARGIN_X, hint_y))
         
-        pygame.display.flip()
+        if drawn is not None and drawn[:4] == state[:4]:
+            # Only the highlight moved; send just the old and new rows
+            pygame.display.update([self._row_rect(drawn[4]), self._row_rect(self.selected_index)])
+        else:
+            pygame.display.flip()
+        self._drawn_state = state
 
     def draw_time_edit(self):
         """Draw the manual time edit screen."""
-        self.screen.fill(BG_COLOR)
-        
-        # Header
-        header = self.font_large.render("Set Time Manually", True, TEXT_COLOR)
-        self.screen.blit(header, (MARGIN_X, 15))
+        state = ("edit", tuple(self.time_fields), self.time_field_index)
+        if state == self._drawn_state:
+            return
         
-        # Separator
-        pygame.draw.line(self.screen, DIM_COLOR, (MARGIN_X, 55), (SCREEN_WIDTH - MARGIN_X, 55), 1)
+        # Background, header, field labels and instructions
+        self.screen.blit(self._edit_bg, (0, 0))
         
         # Time display
-        labels = ["Year", "Month", "Day", "Hour", "Minute"]
-        field_x = [60, 150, 230, 320, 410]
-        
-        y_label = 100
+        field_x = TIME_FIELD_X
         y_value = 150
         
-        for i, (label, val) in enumerate(zip(labels, self.time_fields)):
-            # Label
-            label_surf = self.font_small.render(label, True, DIM_COLOR)
-            lx = field_x[i] - label_surf.get_width() // 2
-            self.screen.blit(label_surf, (lx, y_label))
-            
+        for i, val in enumerate(self.time_fields):
             # Value
             if i == 0:  # Year
                 val_str = f"{val:04d}"
@@ -393,7 +434,7 @@ class TimezoneApp:
                 val_str = f"{val:02d}"
             
             color = ACCENT_COLOR if i == self.time_field_index else TEXT_COLOR
-            val_surf = self.font_large.render(val_str, True, color)
+            val_surf = self.render_text(self.font_large, val_str, color)
             vx = field_x[i] - val_surf.get_width() // 2
             self.screen.blit(val_surf, (vx, y_value))
             
@@ -405,29 +446,24 @@ class TimezoneApp:
         
         # Separators between date parts
         sep_y = y_value + 15
-        sep_surf = self.font_large.render("-", True, DIM_COLOR)
+        sep_surf = self.render_text(self.font_large, "-", DIM_COLOR)
         self.screen.blit(sep_surf, (105, y_value))
         self.screen.blit(sep_surf, (190, y_value))
-        colon_surf = self.font_large.render(":", True, DIM_COLOR)
+        colon_surf = self.render_text(self.font_large, ":", DIM_COLOR)
         self.screen.blit(colon_surf, (365, y_value))
         
         # Preview
         preview_y = 250
         preview_str = f"{self.time_fields[0]:04d}-{self.time_fields[1]:02d}-{self.time_fields[2]:02d} {self.time_fields[3]:02d}:{self.time_fields[4]:02d}"
-        preview_surf = self.font.render(preview_str, True, HEADER_COLOR)
+        # Only the latest preview is kept; it changes with every edit
+        if self._preview[0] != preview_str:
+            self._preview = (preview_str, self.font.render(preview_str, True, HEADER_COLOR).convert_alpha())
+        preview_surf = self._preview[1]
         px = (SCREEN_WIDTH - preview_surf.get_width()) // 2
         self.screen.blit(preview_surf, (px, preview_y))
         
-        # Instructions
-        inst_y = 320
-        inst1 = self.font_small.render("LEFT/RIGHT: Select field", True, DIM_COLOR)
-        inst2 = self.font_small.render("UP/DOWN: Change value", True, DIM_COLOR)
-        inst3 = self.font_small.render("A: Apply time   B: Cancel", True, DIM_COLOR)
-        self.screen.blit(inst1, ((SCREEN_WIDTH - inst1.get_width()) // 2, inst_y))
-        self.screen.blit(inst2, ((SCREEN_WIDTH - inst2.get_width()) // 2, inst_y + 30))
-        self.screen.blit(inst3, ((SCREEN_WIDTH - inst3.get_width()) // 2, inst_y + 60))
-        
         pygame.display.flip()
+        self._drawn_state = state
 
     def handle_timezone_input(self, actions):
         """Handle input for timezone selection."""
@@ -497,8 +533,11 @@ class TimezoneApp:
         while self.running:
             actions = self.input_mgr.get_events()
             
-            # Update WiFi status periodically
-            self.wifi_connected = is_wifi_connected()
+            # Update WiFi status periodically (once a second is plenty)
+            now = pygame.time.get_ticks()
+            if now >= self.next_wifi_check:
+                self.wifi_connected = is_wifi_connected()
+                self.next_wifi_check = now + WIFI_CHECK_MS
             
             if self.time_edit_mode:
                 self.handle_time_edit_input(actions)
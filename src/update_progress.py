@@ -5,11 +5,13 @@ Controlled via a named pipe for IPC with the shell script.
 """
 import os
 import sys
+import select
 import pygame
 from pygame.locals import *
 
 SCREEN_WIDTH, SCREEN_HEIGHT = 480, 480
 FIFO_PATH = "/tmp/update_progress_fifo"
+EVENT_POLL_SECONDS = 0.1  # longest wait on the FIFO before checking pygame events
 
 # Colors
 BG_COLOR = (20, 24, 40)
@@ -27,7 +29,6 @@ def main():
     
     font_large = pygame.font.Font(None, 64)
     font_small = pygame.font.Font(None, 36)
-    clock = pygame.time.Clock()
     
     # Create FIFO for receiving progress updates
     if os.path.exists(FIFO_PATH):
@@ -36,75 +37,106 @@ def main():
     
     # Open FIFO in non-blocking mode
     fifo_fd = os.open(FIFO_PATH, os.O_RDONLY | os.O_NONBLOCK)
-    fifo = os.fdopen(fifo_fd, 'r')
+    # Hold a write end ourselves: the script opens and closes the FIFO for
+    # every line, and with no writer left select() would report EOF nonstop
+    keepalive_fd = os.open(FIFO_PATH, os.O_WRONLY | os.O_NONBLOCK)
+    pending = b""  # partial line read so far
     
     message = "Updating..."
     progress = 0.0  # 0.0 to 1.0
     running = True
     
+    # Layout; the message and the bar + percentage each get a band of the
+    # screen that is cleared and redrawn only when its value changes
+    msg_y = SCREEN_HEIGHT // 2 - 60
+    bar_width = 360
+    bar_height = 24
+    bar_x = (SCREEN_WIDTH - bar_width) // 2
+    bar_y = SCREEN_HEIGHT // 2 + 10
+    pct_y = bar_y + bar_height + 16
+    msg_rect = pygame.Rect(0, msg_y, SCREEN_WIDTH, bar_y - msg_y)
+    bar_rect = pygame.Rect(0, bar_y, SCREEN_WIDTH, pct_y + font_small.get_linesize() - bar_y)
+    drawn_message = None
+    drawn_progress = None
+    
     def draw():
-        screen.fill(BG_COLOR)
-        
-        # Draw message centered
-        msg_surf = font_large.render(message, True, TEXT_COLOR)
-        msg_x = (SCREEN_WIDTH - msg_surf.get_width()) // 2
-        msg_y = SCREEN_HEIGHT // 2 - 60
-        screen.blit(msg_surf, (msg_x, msg_y))
-        
-        # Draw progress bar
-        bar_width = 360
-        bar_height = 24
-        bar_x = (SCREEN_WIDTH - bar_width) // 2
-        bar_y = SCREEN_HEIGHT // 2 + 10
-        
-        # Background
-        pygame.draw.rect(screen, BAR_BG_COLOR, (bar_x, bar_y, bar_width, bar_height), border_radius=12)
-        
-        # Filled portion
-        fill_width = int(bar_width * progress)
-        if fill_width > 0:
-            pygame.draw.rect(screen, BAR_FG_COLOR, (bar_x, bar_y, fill_width, bar_height), border_radius=12)
+        nonlocal drawn_message, drawn_progress
+        first = drawn_message is None
+        if first:
+            screen.fill(BG_COLOR)
+        dirty = []
         
-        # Border
-        pygame.draw.rect(screen, TEXT_COLOR, (bar_x, bar_y, bar_width, bar_height), width=2, border_radius=12)
+        if message != drawn_message:
+            screen.fill(BG_COLOR, msg_rect)
+            # Draw message centered
+            msg_surf = font_large.render(message, True, TEXT_COLOR)
+            msg_x = (SCREEN_WIDTH - msg_surf.get_width()) // 2
+            screen.blit(msg_surf, (msg_x, msg_y))
+            dirty.append(msg_rect)
+            drawn_message = message
         
-        # Percentage text
-        pct_text = f"{int(progress * 100)}%"
-        pct_surf = font_small.render(pct_text, True, TEXT_COLOR)
-        pct_x = (SCREEN_WIDTH - pct_surf.get_width()) // 2
-        pct_y = bar_y + bar_height + 16
-        screen.blit(pct_surf, (pct_x, pct_y))
+        if progress != drawn_progress:
+            screen.fill(BG_COLOR, bar_rect)
+            # Background
+            pygame.draw.rect(screen, BAR_BG_COLOR, (bar_x, bar_y, bar_width, bar_height), border_radius=12)
+            
+            # Filled portion
+            fill_width = int(bar_width * progress)
+            if fill_width > 0:
+                pygame.draw.rect(screen, BAR_FG_COLOR, (bar_x, bar_y, fill_width, bar_height), border_radius=12)
+            
+            # Border
+            pygame.draw.rect(screen, TEXT_COLOR, (bar_x, bar_y, bar_width, bar_height), width=2, border_radius=12)
+            
+            # Percentage text
+            pct_text = f"{int(progress * 100)}%"
+            pct_surf = font_small.render(pct_text, True, TEXT_COLOR)
+            pct_x = (SCREEN_WIDTH - pct_surf.get_width()) // 2
+            screen.blit(pct_surf, (pct_x, pct_y))
+            dirty.append(bar_rect)
+            drawn_progress = progress
         
-        pygame.display.flip()
+        if first:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
     
     try:
+        draw()
         while running:
             # Handle pygame events
             for event in pygame.event.get():
                 if event.type == QUIT:
                     running = False
             
-            # Read commands from FIFO
+            # Sleep until the script writes something (or it's time to check events)
+            ready, _, _ = select.select([fifo_fd], [], [], EVENT_POLL_SECONDS)
+            if not ready:
+                continue
             try:
-                line = fifo.readline()
-                if line:
-                    line = line.strip()
-                    if line.startswith("MSG:"):
-                        message = line[4:]
-                    elif line.startswith("PCT:"):
-                        try:
-                            progress = float(line[4:]) / 100.0
-                        except ValueError:
-                            pass
-                    elif line == "QUIT":
-                        running = False
-            except (IOError, BlockingIOError):
-                pass
+                pending += os.read(fifo_fd, 4096)
+            except BlockingIOError:
+                continue
+            
+            # Apply every complete line that arrived, then draw once
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                line = line.decode("utf-8", "replace").strip()
+                if line.startswith("MSG:"):
+                    message = line[4:]
+                elif line.startswith("PCT:"):
+                    try:
+                        progress = float(line[4:]) / 100.0
+                    except ValueError:
+                        pass
+                elif line == "QUIT":
+                    running = False
+                    break
             
             draw()
-            clock.tick(30)
     finally:
-        fifo.close()
+        os.close(keepalive_fd)
+        os.close(fifo_fd)
         if os.path.exists(FIFO_PATH):
             os.remove(FIFO_PATH)
         pygame.quit()